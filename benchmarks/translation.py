@@ -0,0 +1,112 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Compares the bytecode-json and the gremlin-groovy query languages.
+
+The client side encoding cost is always measured. If contact points are provided, the latency of both
+languages is also measured against a graph loaded with the classic TinkerPop graph (marko, vadas, ...).
+
+    python benchmarks/translation.py
+    python benchmarks/translation.py --hosts 127.0.0.1 --graph classic --requests 2000
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import time
+import timeit
+
+from gremlin_python.process.graph_traversal import __
+from gremlin_python.process.traversal import P, Order
+
+from dse.graph import GraphSON2Serializer
+
+from dse_graph import DseGraph
+from dse_graph.groovy import translate, GROOVY_QUERY_LANGUAGE
+
+TRAVERSALS = {
+    'point lookup': lambda g, i: g.V().has('person', 'name', 'marko-{0}'.format(i)).valueMap(),
+    'two hops': lambda g, i: g.V().has('person', 'name', 'marko').out('knows').out('created').values('name'),
+    'filter and order': lambda g, i: g.V().hasLabel('person').has('age', P.gt(i % 40)).order().by('age', Order.decr)
+                                          .limit(10).values('name'),
+    'nested': lambda g, i: g.V().hasLabel('person').where(__.out('created').count().is_(P.gte(1))).values('name'),
+    'large within': lambda g, i: g.V().has('person', 'name', P.within(['name-{0}'.format(j) for j in range(1000)]))
+                                      .count(),
+}
+
+
+def encode_bytecode(traversal):
+    return DseGraph.query_from_traversal(traversal)
+
+
+def encode_groovy(traversal):
+    script, bindings = translate(traversal)
+    return script, json.dumps(dict((k, GraphSON2Serializer.serialize(v)) for k, v in bindings.items()))
+
+
+def bench_encoding(number):
+    print('Client side encoding, {0} traversals, microseconds per traversal'.format(number))
+    print('{0:<20} {1:>15} {2:>15}'.format('traversal', 'bytecode-json', GROOVY_QUERY_LANGUAGE))
+    for name, build in sorted(TRAVERSALS.items()):
+        g = DseGraph.traversal_source()
+        traversals = [build(g, i) for i in range(number)]
+        results = []
+        for encode in (encode_bytecode, encode_groovy):
+            start = timeit.default_timer()
+            for traversal in traversals:
+                encode(traversal)
+            results.append((timeit.default_timer() - start) / number * 1e6)
+        print('{0:<20} {1:>15.1f} {2:>15.1f}'.format(name, *results))
+
+
+def bench_server(hosts, graph_name, number):
+    from dse.cluster import Cluster, EXEC_PROFILE_GRAPH_DEFAULT
+
+    cluster = Cluster(hosts)
+    session = cluster.connect()
+    print('End to end latency, {0} requests, milliseconds (mean / p99)'.format(number))
+    print('{0:<20} {1:>20} {2:>20}'.format('traversal', 'bytecode-json', GROOVY_QUERY_LANGUAGE))
+    try:
+        sources = [DseGraph.traversal_source(session, graph_name, EXEC_PROFILE_GRAPH_DEFAULT, query_language=language)
+                   for language in (DseGraph.DSE_GRAPH_QUERY_LANGUAGE, GROOVY_QUERY_LANGUAGE)]
+        for name, build in sorted(TRAVERSALS.items()):
+            results = []
+            for source in sources:
+                latencies = []
+                for i in range(number):
+                    traversal = build(source, i)
+                    start = time.time()
+                    traversal.toList()
+                    latencies.append((time.time() - start) * 1000)
+                latencies.sort()
+                results.append('{0:.2f} / {1:.2f}'.format(sum(latencies) / number,
+                                                          latencies[int(number * 0.99) - 1]))
+            print('{0:<20} {1:>20} {2:>20}'.format(name, *results))
+    finally:
+        cluster.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--hosts', nargs='*', help='DSE contact points, enables the end to end benchmark')
+    parser.add_argument('--graph', default='classic', help='Graph name of the end to end benchmark')
+    parser.add_argument('--number', type=int, default=2000, help='Traversals encoded per measure')
+    parser.add_argument('--requests', type=int, default=1000, help='Requests sent per measure')
+    args = parser.parse_args()
+
+    bench_encoding(args.number)
+    if args.hosts:
+        print()
+        bench_server(args.hosts, args.graph, args.requests)
+
+
+if __name__ == '__main__':
+    main()
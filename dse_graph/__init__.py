@@ -7,18 +7,37 @@
 #
 # http://www.datastax.com/terms/datastax-dse-driver-license-terms
 
+import copy
+import datetime
 import logging
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from decimal import Decimal
 
-from gremlin_python.structure.graph import Graph
-from gremlin_python.driver.remote_connection import RemoteConnection, RemoteTraversal
-from gremlin_python.process.traversal import Traverser, TraversalSideEffects
-from gremlin_python.process.graph_traversal import GraphTraversal
-from gremlin_python.structure.io.graphson import GraphSONReader, GraphSONWriter
-
-from dse.cluster import Session, GraphExecutionProfile, EXEC_PROFILE_GRAPH_DEFAULT
-from dse.graph import GraphOptions
+import six
+from six.moves import queue
 
-from dse_graph.serializers import serializers, deserializers, dse_deserializers
+from gremlin_python.statics import long
+from gremlin_python.structure.graph import Graph
+from gremlin_python.driver.remote_connection import RemoteConnection, RemoteTraversal, RemoteStrategy
+from gremlin_python.process.traversal import Bytecode, Traverser, TraversalSideEffects, TraversalStrategies
+from gremlin_python.process.graph_traversal import GraphTraversal, GraphTraversalSource
+from gremlin_python.structure.io.graphson import GraphSONReader
+
+from dse.cluster import Session, GraphExecutionProfile, EXEC_PROFILE_GRAPH_DEFAULT, EXEC_PROFILE_GRAPH_ANALYTICS_DEFAULT
+from dse.graph import GraphOptions, GraphProtocol, SimpleGraphStatement
+from dse.policies import DSELoadBalancingPolicy
+from dse.query import HostTargetingStatement
+from dse.util import Point, LineString, Polygon
+
+from dse_graph.serializers import serializers, deserializers, dse_deserializers, CompactDsePathDeserializer
+from dse_graph.bytecode import is_read_only, start_vertex_ids
+from dse_graph.groovy import GROOVY_QUERY_LANGUAGE, translate
+from dse_graph.graphson import StreamingGraphSONWriter
+from dse_graph.analytics import ANALYTICS_SOURCE
 from dse_graph._version import __version__, __version_info__
 
 
@@ -32,7 +51,7 @@ log = logging.getLogger(__name__)
 # Create our custom GraphSONReader/Writer
 dse_graphson_reader = GraphSONReader(deserializer_map=dse_deserializers)
 graphson_reader = GraphSONReader(deserializer_map=deserializers)
-graphson_writer = GraphSONWriter(serializer_map=serializers)
+graphson_writer = StreamingGraphSONWriter(serializer_map=serializers)
 
 
 def graph_traversal_row_factory(column_names, rows):
@@ -49,20 +68,159 @@ def graph_traversal_dse_object_row_factory(column_names, rows):
     return [dse_graphson_reader.readObject(row[0])['result'] for row in rows]
 
 
+def graph_traversal_compact_path_row_factory(column_names, rows):
+    """
+    Row Factory that returns the decoded graphson as DSE types, like `graph_traversal_dse_object_row_factory`,
+    but the paths of a result page share their decoded objects and their label sets, which are frozensets.
+    """
+    deserializer_map = dse_deserializers.copy()
+    deserializer_map['g:Path'] = CompactDsePathDeserializer()
+    reader = GraphSONReader(deserializer_map=deserializer_map)
+    return [reader.readObject(row[0])['result'] for row in rows]
+
+
+def _raw_row_factory(column_names, rows):
+    """
+    Row Factory that returns the raw graphson strings.
+    """
+    return [row[0] for row in rows]
+
+
+def _with_connection_options(traversal_source, **options):
+    """
+    Returns a copy of a traversal source bound to a copy of its RemoteConnection, with the provided options set.
+    """
+    connection = copy.copy(_remote_connection(traversal_source))
+    for name, value in six.iteritems(options):
+        setattr(connection, name, value)
+    strategies = TraversalStrategies()
+    strategies.traversal_strategies = [s for s in traversal_source.traversal_strategies.traversal_strategies
+                                       if not isinstance(s, RemoteStrategy)]
+    source = type(traversal_source)(traversal_source.graph, strategies, Bytecode(traversal_source.bytecode))
+    return source.withRemote(connection)
+
+
+def _remote_connection(traversal):
+    """
+    Returns the RemoteConnection a GraphTraversal is bound to.
+    """
+    for strategy in traversal.traversal_strategies.traversal_strategies:
+        rc = getattr(strategy, 'remote_connection', None)
+        if rc is not None:
+            return rc
+    raise ValueError('The traversal is not bound to a DSE session. Use DseGraph.traversal_source(session) to create it.')
+
+
+def _hashable_id(element_id):
+    """
+    DSE element ids are maps, returns a hashable equivalent.
+    """
+    if isinstance(element_id, dict):
+        return tuple(sorted((k, _hashable_id(v)) for k, v in six.iteritems(element_id)))
+    elif isinstance(element_id, list):
+        return tuple(_hashable_id(v) for v in element_id)
+    return element_id
+
+
+# Default of DSESessionRemoteGraphConnection._execute_async: the traversal source is chosen by the analytics policy
+_ROUTE = object()
+
+
 class DSESessionRemoteGraphConnection(RemoteConnection):
     """
     A Tinkerpop RemoteConnection to execute traversal queries on DSE.
 
+    Read-only traversals can be hedged: if no response was received after ``hedge_delay`` seconds, or after
+    the ``hedge_percentile`` of the recent read latencies, a second copy is sent to another host and the first
+    response wins. The response of the other request is discarded. Traversals with a step of
+    :data:`dse_graph.bytecode.MUTATING_STEPS` are never hedged.
+
+    Each traversal is classified as read-only or mutating with :func:`dse_graph.bytecode.is_read_only`. Read-only
+    traversals are sent with ``read_execution_profile`` and mutating ones with ``write_execution_profile``, e.g. to
+    read at a lower consistency level than writes.
+
+    With an ``analytics_policy``, the traversals it selects, like ``g.V().count()``, are sent to the analytics
+    traversal source with the execution profile of the policy. They are neither hedged nor token aware.
+
+    With a ``scan_analyzer``, the other traversals are checked for scans before they are encoded, see
+    :class:`dse_graph.preflight.ScanAnalyzer`.
+
+    The results are decoded with ``row_factory``: the row factory of the execution profiles is replaced, since the
+    decoded results are wrapped in traversers.
+
     :param session: A DSE session
     :param graph_name: (Optional) DSE Graph name.
     :param execution_profile: (Optional) Execution profile for traversal queries. Default is set to `EXEC_PROFILE_GRAPH_DEFAULT`.
+    :param hedge_delay: (Optional) Delay, in seconds, before a read-only traversal is hedged.
+    :param hedge_percentile: (Optional) Percentile, e.g. 95, of the recent read latencies after which a read-only
+        traversal is hedged. ``hedge_delay`` is used until enough latencies are recorded.
+    :param token_aware: (Optional) Send the traversals starting with ``g.V(ids)`` to a replica owning these
+        vertices. Requires a DSELoadBalancingPolicy. Default is False.
+    :param query_language: (Optional) Query language of the requests, `DseGraph.DSE_GRAPH_QUERY_LANGUAGE` or
+        'gremlin-groovy'. With 'gremlin-groovy', traversals are sent as scripts with bindings, see
+        :func:`dse_graph.groovy.translate`. Default is `DseGraph.DSE_GRAPH_QUERY_LANGUAGE`.
+    :param slow_log: (Optional) A :class:`dse_graph.slowlog.SlowTraversalLog` recording the latency of every
+        request sent.
+    :param scheduler: (Optional) A :class:`dse_graph.scheduling.TraversalScheduler` the requests wait in for a slot.
+    :param priority: (Optional) Name of the priority class of the requests in ``scheduler``. Default is its first class.
+    :param read_execution_profile: (Optional) Execution profile of the read-only traversals. Default is ``execution_profile``.
+    :param write_execution_profile: (Optional) Execution profile of the mutating traversals. Default is ``execution_profile``.
+    :param analytics_policy: (Optional) A :class:`dse_graph.analytics.AnalyticsRoutingPolicy` selecting the traversals
+        sent to the analytics source.
+    :param scan_analyzer: (Optional) A :class:`dse_graph.preflight.ScanAnalyzer` checking the traversals before
+        they are sent.
+    :param row_factory: (Optional) Row Factory decoding the results, like
+        :func:`dse_graph.arrays.typed_list_row_factory`. Default is `graph_traversal_row_factory`.
+    :param graph_source: (Optional) The traversal source all the traversals are sent to, 'a' for analytics or 'g',
+        overriding the ``analytics_policy``. See :func:`dse_graph.analytics.route`. Without an
+        ``analytics_policy``, the analytics requests use `EXEC_PROFILE_GRAPH_ANALYTICS_DEFAULT`.
     """
 
     session = None
     graph_name = None
     execution_profile = None
+    hedge_delay = None
+    hedge_percentile = None
+    token_aware = False
+    query_language = None
+    slow_log = None
+    scheduler = None
+    priority = None
+    read_execution_profile = None
+    write_execution_profile = None
+    analytics_policy = None
+    scan_analyzer = None
+    row_factory = None
+    graph_source = None
+
+    hedges_sent = 0
+    """
+    Number of hedged requests sent.
+    """
+
+    hedges_won = 0
+    """
+    Number of hedged requests that responded first.
+    """
+
+    reads_sent = 0
+    """
+    Number of requests of read-only traversals sent.
+    """
 
-    def __init__(self, session, graph_name=None, execution_profile=EXEC_PROFILE_GRAPH_DEFAULT):
+    writes_sent = 0
+    """
+    Number of requests of mutating traversals sent.
+    """
+
+    _latency_window = 1000
+    _latency_min_samples = 100
+
+    def __init__(self, session, graph_name=None, execution_profile=EXEC_PROFILE_GRAPH_DEFAULT,
+                 hedge_delay=None, hedge_percentile=None, token_aware=False, query_language=None,
+                 slow_log=None, scheduler=None, priority=None, read_execution_profile=None,
+                 write_execution_profile=None, analytics_policy=None, scan_analyzer=None,
+                 row_factory=graph_traversal_row_factory, graph_source=None):
         super(DSESessionRemoteGraphConnection, self).__init__(None, None)
 
         if not isinstance(session, Session):
@@ -71,27 +229,239 @@ class DSESessionRemoteGraphConnection(RemoteConnection):
         self.session = session
         self.graph_name = graph_name
         self.execution_profile = execution_profile
+        self.hedge_delay = hedge_delay
+        self.hedge_percentile = hedge_percentile
+        self.token_aware = token_aware
+        self.query_language = query_language or DseGraph.DSE_GRAPH_QUERY_LANGUAGE
+        self.slow_log = slow_log
+        self.scheduler = scheduler
+        self.priority = priority
+        if scheduler is not None:
+            scheduler.priority_class(priority)
+        self.read_execution_profile = read_execution_profile
+        self.write_execution_profile = write_execution_profile
+        self.analytics_policy = analytics_policy
+        self.scan_analyzer = scan_analyzer
+        self.row_factory = row_factory
+        self.graph_source = graph_source
+        self._router = None
+        self._latencies = deque(maxlen=self._latency_window)
+        self._lock = threading.Lock()
 
     def submit(self, bytecode):
+        read_only = is_read_only(bytecode)
+        graph_source = self._graph_source(bytecode)
+        if ((self.hedge_delay is not None or self.hedge_percentile is not None) and read_only and
+                graph_source != ANALYTICS_SOURCE):
+            traversers = self._execute_hedged(bytecode, graph_source)
+        else:
+            traversers = self._execute_async(bytecode, read_only=read_only, graph_source=graph_source).result()
+        traversers = [Traverser(t) for t in traversers]
+        return RemoteTraversal(iter(traversers), TraversalSideEffects())
 
-        query = DseGraph.query_from_traversal(bytecode)
-        ep = self.session.execution_profile_clone_update(self.execution_profile, row_factory=graph_traversal_row_factory)
+    def _execute_async(self, bytecode, target_host=None, row_factory=None, read_only=None,
+                       graph_source=_ROUTE, preflight=True, instrumented=True):
+        """
+        Sends the traversal bytecode and returns the ResponseFuture of the request, decoded with ``row_factory``,
+        by default the row factory of the connection. The request is sent to ``target_host`` first if provided and
+        if the load balancing policy is a DSELoadBalancingPolicy.
+        ``read_only`` is the classification of the traversal and ``graph_source`` its traversal source, or None for
+        the source of the profile; both are computed from the bytecode if not provided. The traversal is checked
+        by the scan analyzer if ``preflight`` is True. If ``instrumented`` is False, the request is not counted, not
+        scheduled and not recorded in the slow log.
+        """
+        if row_factory is None:
+            row_factory = self.row_factory
+        if read_only is None:
+            read_only = is_read_only(bytecode)
+        if graph_source is _ROUTE:
+            graph_source = self._graph_source(bytecode)
+        if preflight and self.scan_analyzer is not None and graph_source != ANALYTICS_SOURCE:
+            self.scan_analyzer.check(bytecode)
+        if instrumented:
+            with self._lock:
+                if read_only:
+                    self.reads_sent += 1
+                else:
+                    self.writes_sent += 1
+
+        if self.query_language == GROOVY_QUERY_LANGUAGE:
+            query, parameters = translate(bytecode)
+            graphson = None
+        else:
+            query = graphson = DseGraph.query_from_traversal(bytecode)
+            parameters = None
+
+        if target_host is None and self.token_aware and graph_source != ANALYTICS_SOURCE:
+            target_host = self._replica_address(bytecode)
+        if target_host is not None:
+            query = HostTargetingStatement(SimpleGraphStatement(query), target_host)
+
+        scheduler = self.scheduler if instrumented else None
+        if scheduler is not None:
+            scheduler.acquire(self.priority)
+        start = time.time()
+        try:
+            execution_profile = self._execution_profile(row_factory, read_only, graph_source)
+            future = self.session.execute_graph_async(query, parameters, execution_profile=execution_profile)
+        except Exception:
+            if scheduler is not None:
+                scheduler.release(self.priority)
+            raise
+
+        if not instrumented:
+            return future
+        if self.slow_log is not None:
+            self._on_first_response(future, lambda error: self.slow_log.record(
+                bytecode, time.time() - start, graphson, error, start))
+        if self.scheduler is not None:
+            self._on_first_response(future, lambda error: self.scheduler.release(
+                self.priority, time.time() - start, error))
+        return future
+
+    @staticmethod
+    def _on_first_response(future, callback):
+        """
+        Calls ``callback(error)`` once, on the first page or the error of ``future``.
+        """
+        responded = []
+
+        def respond(error=None):
+            if not responded:
+                responded.append(True)
+                callback(error)
+
+        future.add_callbacks(lambda _: respond(), respond)
+
+    def _replica_address(self, bytecode):
+        # routing is best-effort, the request is sent without a target host if it fails
+        try:
+            replica = self.router.replica(start_vertex_ids(bytecode))
+        except Exception:
+            log.debug("Error routing a traversal to a replica, sending it without a target host", exc_info=True)
+            return None
+        return replica.address if replica is not None else None
+
+    def _graph_source(self, bytecode):
+        if self.analytics_policy is None:
+            return self.graph_source
+        return self.analytics_policy.graph_source(bytecode, self.graph_source)
+
+    def _execution_profile(self, row_factory, read_only=True, graph_source=None):
+        """
+        Returns the execution profile of the read-only or mutating requests decoded by ``row_factory`` and sent
+        to ``graph_source``. Profiles are cloned from the execution profile of the analytics policy,
+        ``read_execution_profile``, ``write_execution_profile`` or ``execution_profile`` for every request, so
+        that the changes made to the registered profiles apply.
+        """
+        if graph_source == ANALYTICS_SOURCE:
+            if self.analytics_policy is not None:
+                base = self.analytics_policy.execution_profile
+            else:
+                base = EXEC_PROFILE_GRAPH_ANALYTICS_DEFAULT
+        else:
+            base = self.read_execution_profile if read_only else self.write_execution_profile
+            if base is None:
+                base = self.execution_profile
+        ep = self.session.execution_profile_clone_update(base, row_factory=row_factory)
         graph_options = ep.graph_options.copy()
-        graph_options.graph_language = DseGraph.DSE_GRAPH_QUERY_LANGUAGE
+        graph_options.graph_language = self.query_language
+        if self.query_language == GROOVY_QUERY_LANGUAGE:
+            graph_options.graph_protocol = GraphProtocol.GRAPHSON_2_0
         if self.graph_name:
             graph_options.graph_name = self.graph_name
-
+        elif graph_source == ANALYTICS_SOURCE and not graph_options.graph_name:
+            # the analytics profile has no graph, like the default one
+            graph_options.graph_name = self._execution_profile(row_factory, read_only).graph_options.graph_name
+        if graph_source is not None:
+            graph_options.graph_source = graph_source
         ep.graph_options = graph_options
+        return ep
 
-        traversers = self.session.execute_graph(query, execution_profile=ep)
-        traversers = [Traverser(t) for t in traversers]
-        return RemoteTraversal(iter(traversers), TraversalSideEffects())
+    @property
+    def router(self):
+        """
+        The :class:`dse_graph.routing.ReplicaRouter` of the graph.
+        """
+        if self._router is None:
+            from dse_graph.routing import ReplicaRouter
+            graph_name = self.graph_name or self._execution_profile(self.row_factory).graph_options.graph_name
+            if isinstance(graph_name, six.binary_type):
+                graph_name = graph_name.decode('utf-8')
+            self._router = ReplicaRouter(self.session, graph_name)
+        return self._router
+
+    def _current_hedge_delay(self):
+        if self.hedge_percentile is not None and len(self._latencies) >= self._latency_min_samples:
+            latencies = sorted(self._latencies)
+            index = int(round(self.hedge_percentile / 100.0 * (len(latencies) - 1)))
+            return latencies[min(max(index, 0), len(latencies) - 1)]
+        return self.hedge_delay
+
+    def _hedge_host(self, future):
+        hosts = [host for host in self.session.cluster.metadata.all_hosts()
+                 if host.is_up and host not in future.attempted_hosts]
+        return random.choice(hosts).address if hosts else None
+
+    def _execute_hedged(self, bytecode, graph_source=None):
+        """
+        Executes a read-only traversal, hedging it when it is slow. Returns the results of the first
+        successful response.
+        """
+        done = queue.Queue()
+
+        def send(target_host=None):
+            future = self._execute_async(bytecode, target_host, read_only=True, graph_source=graph_source,
+                                         preflight=target_host is None)
+            future.add_callbacks(lambda _: done.put(future), lambda _: done.put(future))
+            return future
+
+        start = time.time()
+        futures = [send()]
+        delay = self._current_hedge_delay()
+        try:
+            winner = done.get(timeout=delay) if delay is not None else done.get()
+        except queue.Empty:
+            host = self._hedge_host(futures[0])
+            if host is not None:
+                futures.append(send(host))
+                with self._lock:
+                    self.hedges_sent += 1
+            winner = done.get()
+
+        pending = len(futures)
+        while True:
+            pending -= 1
+            try:
+                results = winner.result()
+                break
+            except Exception:
+                if not pending:
+                    raise
+                winner = done.get()
+
+        with self._lock:
+            self._latencies.append(time.time() - start)
+            if winner is not futures[0]:
+                self.hedges_won += 1
+        return results
 
     def __str__(self):
         return "<DSESessionRemoteGraphConnection: graph_name='{0}'>".format(self.graph_name)
     __repr__ = __str__
 
 
+# Elements decoded by DseGraph.warmup
+_WARMUP_ELEMENTS = (
+    '{"result":['
+    '{"@type":"g:Vertex","@value":{"id":{"~label":"v","community_id":{"@type":"g:Int32","@value":1}},"label":"v",'
+    '"properties":{"k":[{"@type":"g:VertexProperty","@value":{"id":{"@type":"g:Int64","@value":1},"value":"a",'
+    '"label":"k","properties":{"m":"b"}}}]}}},'
+    '{"@type":"g:Edge","@value":{"id":{"out_vertex":"a"},"label":"e","inV":"a","inVLabel":"v","outV":"b",'
+    '"outVLabel":"v","properties":{"w":{"@type":"g:Property","@value":{"key":"w","value":1.0}}}}},'
+    '{"@type":"g:Path","@value":{"labels":[["a"]],"objects":["a"]}}]}')
+
+
 class DseGraph(object):
     """
     Dse Graph utility class for GraphTraversal construction and execution.
@@ -112,9 +482,9 @@ class DseGraph(object):
 
         if isinstance(traversal, GraphTraversal):
             for strategy in traversal.traversal_strategies.traversal_strategies:
-                rc = strategy.remote_connection
+                rc = getattr(strategy, 'remote_connection', None)
                 if (isinstance(rc, DSESessionRemoteGraphConnection) and
-                   rc.session or rc.graph_name or rc.execution_profile):
+                   (rc.session or rc.graph_name or rc.execution_profile)):
                     log.warning(" GraphTraversal session, graph_name and execution_profile are only taken into account when executed with TinkerPop.")
 
         try:
@@ -126,13 +496,17 @@ class DseGraph(object):
         return query
 
     @staticmethod
-    def traversal_source(session=None, graph_name=None, execution_profile=EXEC_PROFILE_GRAPH_DEFAULT):
+    def traversal_source(session=None, graph_name=None, execution_profile=EXEC_PROFILE_GRAPH_DEFAULT,
+                         client_strategies=None, **kwargs):
         """
         Returns a TinkerPop GraphTraversalSource binded to the session and graph_name if provided.
 
         :param session: A DSE session
         :param graph_name: (Optional) DSE Graph name
         :param execution_profile: (Optional) Execution profile for traversal queries. Default is set to `EXEC_PROFILE_GRAPH_DEFAULT`.
+        :param client_strategies: (Optional) TraversalStrategies applied on the client before the traversals are sent,
+            like :class:`dse_graph.optimization.BytecodeOptimizationStrategy`.
+        :param kwargs: (Optional) Other options of :class:`DSESessionRemoteGraphConnection`, e.g. ``hedge_delay``.
 
         .. code-block:: python
 
@@ -150,22 +524,94 @@ class DseGraph(object):
         graph = Graph()
         traversal_source = graph.traversal()
 
+        if client_strategies:
+            strategies = TraversalStrategies(traversal_source.traversal_strategies)
+            strategies.add_strategies(list(client_strategies))
+            traversal_source = GraphTraversalSource(graph, strategies)
+
         if session:
             traversal_source = traversal_source.withRemote(
-                DSESessionRemoteGraphConnection(session, graph_name, execution_profile))
+                DSESessionRemoteGraphConnection(session, graph_name, execution_profile, **kwargs))
+
+        return traversal_source
+
+    @staticmethod
+    def warmup(session, graph_name=None, traversals=None, execution_profile=EXEC_PROFILE_GRAPH_DEFAULT,
+               probe_hosts=True, **kwargs):
+        """
+        Builds a traversal source and primes, ahead of the first requests: the GraphSON codecs, the replica router
+        of a token aware connection, the serialization of the ``traversals`` and, if ``probe_hosts`` is True, the
+        graph on every live host with a ``g.inject(1)`` traversal. Failed probes are logged.
+
+        Returns the warmed GraphTraversalSource, to use for the application traversals.
+
+        The ``traversals`` are only serialized to load and exercise the code paths of their steps and argument
+        types; the results are not kept, every traversal is still serialized when it is sent. A probe can only be
+        sent to a given host if the load balancing policy of the execution profile is a DSELoadBalancingPolicy,
+        otherwise a single probe is sent to the host the policy chooses. Probes are not scheduled, not counted and
+        not recorded in the slow log of the connection.
+
+        :param session: A DSE session
+        :param graph_name: (Optional) DSE Graph name
+        :param traversals: (Optional) Traversals serialized ahead of time, e.g. built from ``DseGraph.traversal_source()``.
+        :param execution_profile: (Optional) Execution profile for traversal queries. Default is set to `EXEC_PROFILE_GRAPH_DEFAULT`.
+        :param probe_hosts: (Optional) Send a probe traversal to every live host. Default is True.
+        :param kwargs: (Optional) Other options of :meth:`DseGraph.traversal_source`.
+
+        .. code-block:: python
+
+            g = DseGraph.warmup(session, 'my_graph', traversals=[DseGraph.traversal_source().V().has('name', '')])
+
+        """
+        traversal_source = DseGraph.traversal_source(session, graph_name, execution_profile, **kwargs)
+        connection = _remote_connection(traversal_source)
+
+        values = [1, long(1), 1.0, uuid.uuid4(), Decimal(1), datetime.datetime.utcnow(), datetime.timedelta(1),
+                  datetime.date.today(), datetime.time(), bytearray(b'0'), Point(0, 0), LineString(((0, 0), (1, 1))),
+                  Polygon([(0, 0), (1, 0), (1, 1), (0, 0)])]
+        for reader in (graphson_reader, dse_graphson_reader):
+            reader.readObject(graphson_writer.writeObject(values))
+            reader.readObject(_WARMUP_ELEMENTS)
+
+        if connection.token_aware:
+            connection.router
+
+        for traversal in traversals or ():
+            if connection.query_language == GROOVY_QUERY_LANGUAGE:
+                translate(traversal)
+            else:
+                DseGraph.query_from_traversal(traversal.bytecode)
+
+        if probe_hosts:
+            probe = traversal_source.inject(1).bytecode
+            policy = connection._execution_profile(connection.row_factory).load_balancing_policy
+            if isinstance(policy, DSELoadBalancingPolicy):
+                hosts = [host for host in session.cluster.metadata.all_hosts() if host.is_up]
+            else:
+                hosts = [None]
+            futures = [(host, connection._execute_async(probe, host.address if host is not None else None,
+                                                        instrumented=False))
+                       for host in hosts]
+            for host, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    log.warning("Warmup probe failed on host %s: %s",
+                                host if host is not None else "chosen by the policy", e)
 
         return traversal_source
 
     @staticmethod
-    def create_execution_profile(graph_name):
+    def create_execution_profile(graph_name, row_factory=graph_traversal_dse_object_row_factory):
         """
         Creates an ExecutionProfile for GraphTraversal execution. You need to register that execution profile to the
         cluster by using `cluster.add_execution_profile`.
 
         :param graph_name: The graph name
+        :param row_factory: (Optional) Row factory decoding the results. Default is `graph_traversal_dse_object_row_factory`.
         """
 
-        ep = GraphExecutionProfile(row_factory=graph_traversal_dse_object_row_factory,
+        ep = GraphExecutionProfile(row_factory=row_factory,
                                    graph_options=GraphOptions(graph_name=graph_name,
                                                               graph_language=DseGraph.DSE_GRAPH_QUERY_LANGUAGE))
         return ep
@@ -0,0 +1,239 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+asyncio flavour of the traversal source. Requires Python 3.5.2+: the module is not installed with older
+interpreters, and nothing else in dse_graph imports it.
+"""
+
+import asyncio
+import collections
+
+from gremlin_python.structure.graph import Graph
+from gremlin_python.process.graph_traversal import GraphTraversal, GraphTraversalSource
+from gremlin_python.process.traversal import TraversalStrategies, Bytecode
+
+from dse.cluster import EXEC_PROFILE_GRAPH_DEFAULT
+
+from dse_graph import DSESessionRemoteGraphConnection, _remote_connection
+
+_END = object()
+
+
+class AsyncTraversalResults(object):
+    """
+    Asynchronous iterator over the results of a traversal request.
+
+    Result pages are handed over from the driver callbacks to the event loop. At most ``max_buffered_pages``
+    pages are kept in memory: the next page is only requested when the consumer catches up.
+    """
+
+    def __init__(self, response_future, loop, max_buffered_pages=2):
+        self._future = response_future
+        self._loop = loop
+        self._max_buffered_pages = max_buffered_pages
+        self._pages = collections.deque()
+        self._current = iter(())
+        self._waiter = None
+        self._fetch_paused = False
+        response_future.add_callbacks(self._on_page, self._on_error)
+
+    def _on_page(self, rows):
+        self._call_soon(rows)
+
+    def _on_error(self, error):
+        self._call_soon(error)
+
+    def _call_soon(self, page):
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, page)
+        except RuntimeError:  # the event loop was closed, nobody is waiting for the results anymore
+            pass
+
+    def _deliver(self, page):
+        self._pages.append(page)
+        if isinstance(page, list):
+            if not self._future.has_more_pages:
+                self._pages.append(_END)
+            elif len(self._pages) < self._max_buffered_pages:
+                self._future.start_fetching_next_page()
+            else:
+                self._fetch_paused = True
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            for result in self._current:
+                return result
+
+            while not self._pages:
+                self._waiter = self._loop.create_future()
+                await self._waiter
+            page = self._pages.popleft()
+
+            if page is _END:
+                self._pages.appendleft(_END)
+                raise StopAsyncIteration
+            if isinstance(page, BaseException):
+                self._pages.appendleft(_END)
+                raise page
+
+            if self._fetch_paused and len(self._pages) < self._max_buffered_pages:
+                self._fetch_paused = False
+                self._future.start_fetching_next_page()
+            self._current = iter(page)
+
+
+class AsyncDSESessionRemoteGraphConnection(DSESessionRemoteGraphConnection):
+    """
+    A :class:`dse_graph.DSESessionRemoteGraphConnection` that can also submit traversals without blocking
+    an asyncio event loop.
+
+    :param session: A DSE session
+    :param graph_name: (Optional) DSE Graph name.
+    :param execution_profile: (Optional) Execution profile for traversal queries. Default is set to `EXEC_PROFILE_GRAPH_DEFAULT`.
+    :param loop: (Optional) The event loop results are delivered to. Default is the running loop.
+    :param max_buffered_pages: (Optional) Maximum number of result pages buffered ahead of the consumer. Default is 2.
+    """
+
+    loop = None
+    max_buffered_pages = 2
+
+    def __init__(self, session, graph_name=None, execution_profile=EXEC_PROFILE_GRAPH_DEFAULT, loop=None,
+                 max_buffered_pages=2):
+        super(AsyncDSESessionRemoteGraphConnection, self).__init__(session, graph_name, execution_profile)
+        self.loop = loop
+        self.max_buffered_pages = max_buffered_pages
+
+    def submit_async(self, bytecode):
+        """
+        Sends the traversal bytecode and returns an :class:`AsyncTraversalResults`.
+        """
+        loop = self.loop or asyncio.get_event_loop()
+        return AsyncTraversalResults(self._execute_async(bytecode), loop, self.max_buffered_pages)
+
+    def __str__(self):
+        return "<AsyncDSESessionRemoteGraphConnection: graph_name='{0}'>".format(self.graph_name)
+    __repr__ = __str__
+
+
+class AsyncGraphTraversal(GraphTraversal):
+    """
+    A GraphTraversal whose terminal steps are coroutines, and that supports ``async for``.
+    """
+
+    _results = None
+
+    def _submit(self):
+        if self._results is None:
+            self._results = _remote_connection(self).submit_async(self.bytecode)
+        return self._results
+
+    def __aiter__(self):
+        return self._submit()
+
+    async def next(self, amount=None):
+        results = self._submit()
+        if amount is None:
+            return await results.__anext__()
+        out = []
+        while len(out) < amount:
+            try:
+                out.append(await results.__anext__())
+            except StopAsyncIteration:
+                break
+        return out
+
+    async def toList(self):
+        out = []
+        async for result in self._submit():
+            out.append(result)
+        return out
+
+    async def toSet(self):
+        return set(await self.toList())
+
+    async def iterate(self):
+        async for _ in self._submit():
+            pass
+        return self
+
+
+def _async_traversal(method):
+    def spawn(self, *args):
+        traversal = AsyncGraphTraversal(self.graph, self.traversal_strategies, Bytecode(self.bytecode))
+        traversal.bytecode.add_step(method, *args)
+        return traversal
+    spawn.__name__ = method
+    return spawn
+
+
+def _async_source(method):
+    def configure(self, *args, **kwargs):
+        source = getattr(GraphTraversalSource, method)(self, *args, **kwargs)
+        return AsyncGraphTraversalSource(source.graph, source.traversal_strategies, source.bytecode)
+    configure.__name__ = method
+    return configure
+
+
+class AsyncGraphTraversalSource(GraphTraversalSource):
+    """
+    A GraphTraversalSource spawning :class:`AsyncGraphTraversal` traversals.
+    """
+
+    E = _async_traversal('E')
+    V = _async_traversal('V')
+    addV = _async_traversal('addV')
+    inject = _async_traversal('inject')
+
+    withBulk = _async_source('withBulk')
+    withPath = _async_source('withPath')
+    withSack = _async_source('withSack')
+    withSideEffect = _async_source('withSideEffect')
+    withStrategies = _async_source('withStrategies')
+    withoutStrategies = _async_source('withoutStrategies')
+    withRemote = _async_source('withRemote')
+    withComputer = _async_source('withComputer')
+
+
+def async_traversal_source(session=None, graph_name=None, execution_profile=EXEC_PROFILE_GRAPH_DEFAULT, loop=None,
+                           max_buffered_pages=2):
+    """
+    Returns an asyncio GraphTraversalSource binded to the session and graph_name if provided. Terminal steps
+    of the traversals are coroutines.
+
+    :param session: A DSE session
+    :param graph_name: (Optional) DSE Graph name
+    :param execution_profile: (Optional) Execution profile for traversal queries. Default is set to `EXEC_PROFILE_GRAPH_DEFAULT`.
+    :param loop: (Optional) The event loop results are delivered to. Default is the running loop.
+    :param max_buffered_pages: (Optional) Maximum number of result pages buffered ahead of the consumer. Default is 2.
+
+    .. code-block:: python
+
+        g = async_traversal_source(session, 'my_graph')
+
+        async def names():
+            async for name in g.V().values('name'):
+                print(name)
+            return await g.V().count().next()
+
+    """
+    graph = Graph()
+    traversal_source = graph.traversal()
+    traversal_source = AsyncGraphTraversalSource(graph, TraversalStrategies(traversal_source.traversal_strategies))
+
+    if session:
+        traversal_source = traversal_source.withRemote(
+            AsyncDSESessionRemoteGraphConnection(session, graph_name, execution_profile, loop, max_buffered_pages))
+
+    return traversal_source
@@ -0,0 +1,139 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Routing of the scan-heavy traversals to the analytics (OLAP) traversal source.
+"""
+
+import threading
+from collections import OrderedDict
+
+from gremlin_python.process.traversal import Traversal
+
+from dse.cluster import EXEC_PROFILE_GRAPH_ANALYTICS_DEFAULT
+
+from dse_graph.bytecode import has_vertex_program, is_unanchored_scan, has_global_aggregation
+
+ANALYTICS_SOURCE = 'a'
+"""
+The server-defined analytics traversal source.
+"""
+
+GRAPH_SOURCE = 'g'
+"""
+The server-defined graph (OLTP) traversal source.
+"""
+
+# reasons of the routing decisions
+VERTEX_PROGRAM = 'vertex_program'
+SCAN_AGGREGATION = 'scan_aggregation'
+SCAN = 'scan'
+OVERRIDE_ANALYTICS = 'override_analytics'
+OVERRIDE_GRAPH = 'override_graph'
+OLTP = 'oltp'
+
+
+def _bytecode(traversal):
+    return traversal.bytecode if isinstance(traversal, Traversal) else traversal
+
+
+def route(traversal_source, analytics=True):
+    """
+    Returns a copy of a traversal source bound to the same session, whose traversals are sent to the analytics
+    source if ``analytics`` is True, to the graph source otherwise, overriding the :class:`AnalyticsRoutingPolicy`
+    decisions. The copy uses the ``graph_source`` option of :class:`dse_graph.DSESessionRemoteGraphConnection`.
+
+    .. code-block:: python
+
+        route(g, analytics=False).V().hasLabel('person').count().next()
+
+    """
+    from dse_graph import _with_connection_options  # dse_graph imports this module
+
+    return _with_connection_options(traversal_source, graph_source=ANALYTICS_SOURCE if analytics else GRAPH_SOURCE)
+
+
+class AnalyticsRoutingPolicy(object):
+    """
+    Decides which traversals a :class:`dse_graph.DSESessionRemoteGraphConnection` sends to the analytics
+    traversal source: the traversals running a vertex program, like ``pageRank()``, and the unanchored scans
+    (see :func:`dse_graph.bytecode.is_unanchored_scan`) aggregating their traversers, like ``g.V().count()``.
+    Other traversals are sent with the execution profile of the connection. :func:`route` overrides the decisions
+    for the traversals of a traversal source.
+
+    The number of decisions is counted per reason.
+
+    :param scans: (Optional) Also send the unanchored scans without aggregation. Default is False.
+    :param execution_profile: (Optional) Execution profile of the analytics requests, with ``graph_source`` set to
+        the analytics source. Default is `EXEC_PROFILE_GRAPH_ANALYTICS_DEFAULT`.
+
+    .. code-block:: python
+
+        g = DseGraph.traversal_source(session, 'my_graph', analytics_policy=AnalyticsRoutingPolicy())
+        g.V().hasLabel('person').groupCount().by('age').next()  # sent to the analytics source
+
+    """
+
+    scans = False
+    execution_profile = None
+
+    def __init__(self, scans=False, execution_profile=EXEC_PROFILE_GRAPH_ANALYTICS_DEFAULT):
+        self.scans = scans
+        self.execution_profile = execution_profile
+        self._lock = threading.Lock()
+        self._decisions = OrderedDict((reason, 0) for reason in (
+            VERTEX_PROGRAM, SCAN_AGGREGATION, SCAN, OVERRIDE_ANALYTICS, OVERRIDE_GRAPH, OLTP))
+
+    def reason(self, traversal):
+        """
+        Returns the reason of the routing decision of a traversal.
+        """
+        bytecode = _bytecode(traversal)
+        if has_vertex_program(bytecode):
+            return VERTEX_PROGRAM
+        if is_unanchored_scan(bytecode):
+            if has_global_aggregation(bytecode):
+                return SCAN_AGGREGATION
+            if self.scans:
+                return SCAN
+        return OLTP
+
+    def graph_source(self, traversal, override=None):
+        """
+        Returns the traversal source a traversal is sent to, `ANALYTICS_SOURCE`, `GRAPH_SOURCE`, or None for the
+        source of the connection profile, and counts the decision.
+
+        :param traversal: A GraphTraversal or its Bytecode
+        :param override: (Optional) The traversal source forced by the connection, see :func:`route`.
+        """
+        if override is not None:
+            reason = OVERRIDE_ANALYTICS if override == ANALYTICS_SOURCE else OVERRIDE_GRAPH
+        else:
+            reason = self.reason(traversal)
+        with self._lock:
+            self._decisions[reason] += 1
+        if reason == OLTP:
+            return None
+        return GRAPH_SOURCE if reason == OVERRIDE_GRAPH else ANALYTICS_SOURCE
+
+    def decisions(self):
+        """
+        Returns the number of routing decisions per reason: 'vertex_program', 'scan_aggregation', 'scan',
+        'override_analytics', 'override_graph' and 'oltp'.
+        """
+        with self._lock:
+            return OrderedDict(self._decisions)
+
+    @property
+    def analytics_requests(self):
+        """
+        Number of traversals sent to the analytics source.
+        """
+        with self._lock:
+            return sum(count for reason, count in self._decisions.items() if reason not in (OVERRIDE_GRAPH, OLTP))
@@ -0,0 +1,122 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Bulk decoding of the homogeneous lists of numbers, like the results of ``values('score').fold()``.
+"""
+
+import array
+from operator import itemgetter
+
+import six
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from gremlin_python.statics import long
+from gremlin_python.structure.io.graphson import GraphSONReader, GraphSONUtil
+
+from dse_graph.serializers import deserializers, dse_deserializers
+
+CONTAINERS = ('list', 'array', 'numpy')
+"""
+Containers of the decoded lists: plain lists, ``array.array`` or numpy arrays.
+"""
+
+# GraphSON type: (array typecode, numpy dtype name, python type)
+_NUMBER_TYPES = {
+    'gx:Int16': ('h', 'int16', int),
+    'g:Int32': ('i', 'int32', int),
+    'g:Int64': ('l' if six.PY2 else 'q', 'int64', long if six.PY2 else int),
+    'g:Float': ('f', 'float32', float),
+    'g:Double': ('d', 'float64', float),
+}
+
+_type = itemgetter(GraphSONUtil.TYPE_KEY)
+_value = itemgetter(GraphSONUtil.VALUE_KEY)
+
+
+class TypedListReader(GraphSONReader):
+    """
+    A GraphSONReader decoding the lists of numbers that all have the same GraphSON type (gx:Int16, g:Int32,
+    g:Int64, g:Float or g:Double) in bulk, without decoding their items one by one. Other values are decoded
+    like GraphSONReader.
+
+    :param deserializer_map: (Optional) Map of GraphSON types to deserializers, like GraphSONReader.
+    :param container: (Optional) One of `CONTAINERS`. Default is 'array'.
+    :param min_size: (Optional) Minimum size of the lists decoded in bulk. Default is 16.
+    """
+
+    container = 'array'
+    min_size = 16
+
+    def __init__(self, deserializer_map=None, container='array', min_size=16):
+        super(TypedListReader, self).__init__(deserializer_map)
+        if container not in CONTAINERS:
+            raise ValueError("Unknown container '{0}', expected one of {1}".format(container, CONTAINERS))
+        if container == 'numpy' and numpy is None:
+            raise ImportError('numpy is required to decode lists as numpy arrays.')
+        self.container = container
+        self.min_size = min_size
+
+    def toObject(self, obj):
+        if isinstance(obj, list) and len(obj) >= self.min_size:
+            values = self._typed_list(obj)
+            if values is not None:
+                return values
+        return super(TypedListReader, self).toObject(obj)
+
+    def _typed_list(self, obj):
+        try:
+            types = set(map(_type, obj))
+            if len(types) != 1:
+                return None
+            number_type = _NUMBER_TYPES.get(types.pop())
+            if number_type is None:
+                return None
+            values = list(map(_value, obj))
+        except (KeyError, TypeError):
+            return None
+
+        typecode, dtype, python_type = number_type
+        if self.container == 'numpy':
+            return numpy.array(values, dtype=dtype)
+        elif self.container == 'list':
+            return values if python_type is int else list(map(python_type, values))
+        try:
+            return array.array(typecode, values)
+        except TypeError:
+            # 'NaN' and 'Infinity' are written as strings
+            return array.array(typecode, map(python_type, values))
+
+
+def typed_list_row_factory(container='array', min_size=16, dse_types=True):
+    """
+    Returns a Row Factory decoding the results with a :class:`TypedListReader`. Pass it as the ``row_factory``
+    of :meth:`dse_graph.DseGraph.traversal_source`, or of an execution profile used with
+    ``session.execute_graph``.
+
+    :param container: (Optional) One of `CONTAINERS`. Default is 'array'.
+    :param min_size: (Optional) Minimum size of the lists decoded in bulk. Default is 16.
+    :param dse_types: (Optional) Decode the elements as DSE types, like
+        `dse_graph.graph_traversal_dse_object_row_factory`. Default is True.
+
+    .. code-block:: python
+
+        g = DseGraph.traversal_source(session, 'my_graph', row_factory=typed_list_row_factory('numpy'))
+        scores = g.V().has('item', 'name', 'x').values('embedding').fold().next()
+
+    """
+    reader = TypedListReader(dse_deserializers if dse_types else deserializers, container, min_size)
+
+    def row_factory(column_names, rows):
+        return [reader.readObject(row[0])['result'] for row in rows]
+    return row_factory
@@ -0,0 +1,182 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Helpers to inspect the bytecode of traversals on the client side.
+"""
+
+from aenum import Enum
+
+from gremlin_python.process.traversal import Bytecode, Binding, P, Traversal, Scope
+
+from dse_graph.predicates import GeoP, TextDistanceP
+
+MUTATING_STEPS = frozenset(['addV', 'addE', 'addVertex', 'addEdge', 'addInE', 'addOutE', 'property', 'drop'])
+"""
+Steps that modify the graph.
+"""
+
+VERTEX_PROGRAM_STEPS = frozenset(['pageRank', 'peerPressure', 'connectedComponent', 'shortestPath', 'program'])
+"""
+Steps running a vertex program over the whole graph, which require an analytics traversal source.
+"""
+
+AGGREGATION_STEPS = frozenset(['count', 'groupCount', 'group', 'sum', 'mean', 'max', 'min', 'fold', 'order', 'dedup'])
+"""
+Steps aggregating all the traversers, unless they are given ``Scope.local``.
+"""
+
+_ANCHORING_STEPS = frozenset(['has', 'hasLabel', 'hasId', 'hasKey', 'hasValue', 'hasNot'])
+
+_VARARG_STEPS = frozenset(['V', 'E', 'inject', 'hasLabel', 'hasId', 'hasKey', 'hasValue', 'out', 'in', 'both',
+                           'outE', 'inE', 'bothE', 'values', 'valueMap', 'properties', 'propertyMap'])
+
+
+def _bytecode(traversal):
+    if isinstance(traversal, Traversal):
+        return traversal.bytecode
+    return traversal
+
+
+def _argument_shape(arg, collapse_varargs):
+    if isinstance(arg, Traversal):
+        arg = arg.bytecode
+    if isinstance(arg, Bytecode):
+        return '__' + _instructions_shape(arg.step_instructions, collapse_varargs)
+    elif isinstance(arg, Enum):
+        return '{0}.{1}'.format(type(arg).__name__, arg.name)
+    elif isinstance(arg, (P, GeoP, TextDistanceP)):
+        args = [_argument_shape(arg.value, collapse_varargs)]
+        if getattr(arg, 'other', None) is not None:
+            args.append(_argument_shape(arg.other, collapse_varargs))
+        return '{0}({1})'.format(arg.operator, ','.join(args))
+    elif isinstance(arg, Binding):
+        return arg.key
+    return '?'
+
+
+def _step_shape(instruction, collapse_varargs):
+    args = [_argument_shape(a, collapse_varargs) for a in instruction[1:]]
+    if collapse_varargs and instruction[0] in _VARARG_STEPS:
+        collapsed = []
+        for arg in args:
+            if arg == '?' and collapsed and collapsed[-1] in ('?', '?*'):
+                collapsed[-1] = '?*'
+            else:
+                collapsed.append(arg)
+        args = collapsed
+    return '.{0}({1})'.format(instruction[0], ','.join(args))
+
+
+def _instructions_shape(instructions, collapse_varargs=False):
+    return ''.join(_step_shape(i, collapse_varargs) for i in instructions)
+
+
+def traversal_shape(traversal, collapse_varargs=False):
+    """
+    Returns the shape of a traversal: a string form of its bytecode where every literal argument is
+    replaced by '?'. Traversals that only differ by their literals have the same shape.
+
+    :param traversal: A GraphTraversal or its Bytecode
+    :param collapse_varargs: (Optional) Collapse the consecutive literal arguments of the steps taking a variable
+        number of them, like ``V(*ids)`` or ``hasLabel(*labels)``, into a single '?*', so that the traversals only
+        differing by their number of ids or labels have the same shape. Default is False.
+    """
+    bytecode = _bytecode(traversal)
+    return 'g' + _instructions_shape(bytecode.source_instructions, collapse_varargs) + \
+        _instructions_shape(bytecode.step_instructions, collapse_varargs)
+
+
+def _nested_bytecodes(args):
+    for arg in args:
+        if isinstance(arg, Traversal):
+            arg = arg.bytecode
+        if isinstance(arg, Bytecode):
+            yield arg
+
+
+def is_read_only(traversal):
+    """
+    Returns True if the traversal, including its nested anonymous traversals, has no step of `MUTATING_STEPS`.
+
+    :param traversal: A GraphTraversal or its Bytecode
+    """
+    bytecode = _bytecode(traversal)
+    for instruction in bytecode.source_instructions + bytecode.step_instructions:
+        if instruction[0] in MUTATING_STEPS:
+            return False
+        for nested in _nested_bytecodes(instruction[1:]):
+            if not is_read_only(nested):
+                return False
+    return True
+
+
+def start_vertex_ids(traversal):
+    """
+    Returns the vertex ids a traversal starts from, i.e. the arguments of ``g.V(...)``. Returns an empty
+    list if the traversal does not start with ``V`` or without ids.
+
+    :param traversal: A GraphTraversal or its Bytecode
+    """
+    bytecode = _bytecode(traversal)
+    if not bytecode.step_instructions or bytecode.step_instructions[0][0] != 'V':
+        return []
+    ids = []
+    for arg in bytecode.step_instructions[0][1:]:
+        for element_id in (arg if isinstance(arg, (list, tuple)) else [arg]):
+            ids.append(getattr(element_id, 'id', element_id))
+    return ids
+
+
+def has_vertex_program(traversal):
+    """
+    Returns True if the traversal, including its nested anonymous traversals, has a step of
+    `VERTEX_PROGRAM_STEPS`.
+
+    :param traversal: A GraphTraversal or its Bytecode
+    """
+    bytecode = _bytecode(traversal)
+    for instruction in bytecode.step_instructions:
+        if instruction[0] in VERTEX_PROGRAM_STEPS:
+            return True
+        if any(has_vertex_program(nested) for nested in _nested_bytecodes(instruction[1:])):
+            return True
+    return False
+
+
+def is_unanchored_scan(traversal):
+    """
+    Returns True if the traversal starts with ``V()`` or ``E()`` without ids, and is not narrowed down by a
+    leading ``hasId()`` or ``has(key, value)`` filter, i.e. it reads all the vertices or edges, or all those of
+    a label.
+
+    :param traversal: A GraphTraversal or its Bytecode
+    """
+    instructions = _bytecode(traversal).step_instructions
+    if not instructions or instructions[0][0] not in ('V', 'E') or len(instructions[0]) > 1:
+        return False
+    for instruction in instructions[1:]:
+        if instruction[0] not in _ANCHORING_STEPS:
+            break
+        if instruction[0] == 'hasId' or (instruction[0] == 'has' and len(instruction) > 2):
+            return False
+    return True
+
+
+def has_global_aggregation(traversal):
+    """
+    Returns True if the traversal has a step of `AGGREGATION_STEPS` that is not given ``Scope.local``.
+    Nested anonymous traversals are not inspected.
+
+    :param traversal: A GraphTraversal or its Bytecode
+    """
+    for instruction in _bytecode(traversal).step_instructions:
+        if instruction[0] in AGGREGATION_STEPS and Scope.local not in instruction[1:]:
+            return True
+    return False
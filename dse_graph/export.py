@@ -0,0 +1,224 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Export of traversal results to Apache Arrow and pandas. Requires ``pyarrow``, and ``pandas`` for
+:func:`to_pandas`.
+"""
+
+import json
+import uuid
+from collections import OrderedDict
+
+import six
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from dse.util import Point, LineString, Polygon, Distance
+
+from dse_graph import dse_graphson_reader, _remote_connection, _raw_row_factory
+from dse_graph.pagination import RangeWindows
+
+
+def _id_value(element_id):
+    if isinstance(element_id, dict):
+        return json.dumps(element_id, sort_keys=True)
+    return element_id
+
+
+def _column_value(value):
+    value = dse_graphson_reader.toObject(value)
+    if isinstance(value, (uuid.UUID, Point, LineString, Polygon, Distance)):
+        return str(value)
+    elif isinstance(value, bytearray):
+        return bytes(value)
+    return value
+
+
+class _RowFlattener(object):
+    """
+    Flattens the raw GraphSON of a traverser in a dict of column values, without building the
+    intermediate graph objects.
+    """
+
+    def __init__(self, multi_valued=()):
+        self.multi_valued = frozenset(multi_valued)
+
+    def _property_value(self, key, values):
+        if key in self.multi_valued:
+            return [_column_value(v) for v in values]
+        return _column_value(values[0]) if values else None
+
+    def flatten(self, data):
+        if isinstance(data, dict):
+            data_type = data.get('@type')
+            if data_type == 'g:Vertex':
+                return self._vertex(data['@value'])
+            elif data_type == 'g:Edge':
+                return self._edge(data['@value'])
+            elif data_type is None:
+                return self._map(data)
+        return {'value': _column_value(data)}
+
+    def _vertex(self, v):
+        row = OrderedDict([('id', _id_value(dse_graphson_reader.toObject(v['id']))),
+                           ('label', v.get('label', 'vertex'))])
+        for key, properties in six.iteritems(v.get('properties', {})):
+            row[key] = self._property_value(key, [p['@value']['value'] for p in properties])
+        return row
+
+    def _edge(self, e):
+        row = OrderedDict([('id', _id_value(dse_graphson_reader.toObject(e['id']))),
+                           ('label', e.get('label', 'edge')),
+                           ('outV', _id_value(dse_graphson_reader.toObject(e['outV']))),
+                           ('outVLabel', e.get('outVLabel')),
+                           ('inV', _id_value(dse_graphson_reader.toObject(e['inV']))),
+                           ('inVLabel', e.get('inVLabel'))])
+        for key, prop in six.iteritems(e.get('properties', {})):
+            row[key] = _column_value(prop['@value']['value'])
+        return row
+
+    def _map(self, m):
+        # valueMap() rows hold lists of values, project() rows hold any value
+        row = OrderedDict()
+        for key, value in six.iteritems(m):
+            if isinstance(value, list):
+                row[key] = self._property_value(key, value)
+            elif key in ('id', 'inV', 'outV'):
+                row[key] = _id_value(dse_graphson_reader.toObject(value))
+            else:
+                row[key] = _column_value(value)
+        return row
+
+
+class _BatchBuilder(object):
+
+    def __init__(self, schema=None):
+        self.schema = schema
+        self.columns = OrderedDict((name, []) for name in schema.names) if schema is not None else OrderedDict()
+        self.size = 0
+
+    def add(self, row):
+        for key, value in six.iteritems(row):
+            column = self.columns.get(key)
+            if column is None:
+                if self.schema is not None:
+                    continue
+                column = self.columns[key] = [None] * self.size
+            column.append(value)
+        self.size += 1
+        for column in six.itervalues(self.columns):
+            if len(column) < self.size:
+                column.append(None)
+
+    def build(self):
+        if self.schema is not None:
+            batch = pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array(self.columns[field.name], type=field.type) for field in self.schema], schema=self.schema)
+        else:
+            batch = pyarrow.RecordBatch.from_arrays([pyarrow.array(c) for c in six.itervalues(self.columns)],
+                                                    list(self.columns))
+        self.columns = OrderedDict((name, []) for name in self.columns)
+        self.size = 0
+        return batch
+
+
+def _check_pyarrow():
+    if pyarrow is None:
+        raise ImportError('pyarrow is required to export traversal results.')
+
+
+def _raw_results(traversal, page_size):
+    connection = _remote_connection(traversal)
+    if page_size is None:
+        for row in connection._execute_async(traversal.bytecode, row_factory=_raw_row_factory).result():
+            yield row
+        return
+
+    windows = RangeWindows(traversal.bytecode, page_size)
+    page = None
+    while page is None or len(page) == page_size:
+        page = connection._execute_async(windows.next_window(page), row_factory=_raw_row_factory).result()
+        page = list(page)
+        for row in page:
+            yield row
+
+
+def record_batches(traversal, batch_size=10000, page_size=None, multi_valued=(), schema=None):
+    """
+    Executes a GraphTraversal and returns a generator of ``pyarrow.RecordBatch``. Only ``batch_size``
+    rows are decoded at a time, straight from the raw GraphSON into columns.
+
+    Vertices are exported as ``id``, ``label`` and one column per property key; edges as ``id``, ``label``,
+    ``outV``, ``outVLabel``, ``inV``, ``inVLabel`` and one column per property key; maps, like ``valueMap()`` and
+    ``project()`` rows, as one column per key; other results as a ``value`` column. Map ids are exported as
+    JSON strings.
+
+    Without ``schema``, the columns of each batch are the keys found in its rows.
+
+    :param traversal: A GraphTraversal created with :meth:`dse_graph.DseGraph.traversal_source`
+    :param batch_size: (Optional) Number of rows per batch. Default is 10000.
+    :param page_size: (Optional) Requests the results in windows of ``page_size``, like :func:`dse_graph.pagination.paginate`.
+    :param multi_valued: (Optional) Property keys exported as lists of all their values. Other properties are
+        exported as their first value.
+    :param schema: (Optional) A ``pyarrow.Schema`` of the batches. Keys that are not in the schema are ignored.
+    """
+    _check_pyarrow()
+    flattener = _RowFlattener(multi_valued)
+    builder = _BatchBuilder(schema)
+    for raw in _raw_results(traversal, page_size):
+        builder.add(flattener.flatten(json.loads(raw)['result']))
+        if builder.size >= batch_size:
+            yield builder.build()
+    if builder.size:
+        yield builder.build()
+
+
+def _align(batch, schema):
+    arrays = []
+    for field in schema:
+        index = batch.schema.get_field_index(field.name)
+        if index < 0:
+            arrays.append(pyarrow.nulls(batch.num_rows, type=field.type))
+        else:
+            arrays.append(batch.column(index).cast(field.type))
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def to_arrow(traversal, **kwargs):
+    """
+    Executes a GraphTraversal and returns its results as a ``pyarrow.Table``. Accepts the options
+    of :func:`record_batches`. The schema is the union of the batches schemas.
+
+    .. code-block:: python
+
+        table = to_arrow(g.V().hasLabel('person'))
+
+    """
+    batches = list(record_batches(traversal, **kwargs))
+    if not batches:
+        return pyarrow.Table.from_batches([], schema=kwargs.get('schema') or pyarrow.schema([]))
+    schema = pyarrow.unify_schemas([b.schema for b in batches])
+    return pyarrow.Table.from_batches([_align(b, schema) for b in batches], schema=schema)
+
+
+def to_pandas(traversal, **kwargs):
+    """
+    Executes a GraphTraversal and returns its results as a ``pandas.DataFrame``. Accepts the options
+    of :func:`record_batches`.
+
+    .. code-block:: python
+
+        df = to_pandas(g.V().hasLabel('person').valueMap())
+
+    """
+    return to_arrow(traversal, **kwargs).to_pandas()
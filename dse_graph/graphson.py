@@ -0,0 +1,109 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+GraphSON encoding of large traversals.
+"""
+
+import json
+import re
+import uuid
+
+import six
+from six.moves import range, cStringIO as StringIO
+
+from gremlin_python.structure.io.graphson import GraphSONWriter
+
+_encoder = json.JSONEncoder(separators=(',', ':'))
+_to_dict = six.get_unbound_function(GraphSONWriter.toDict)
+
+
+class _Encoding(object):
+    """
+    State of one encoding. Passed as the writer to the serializers, it replaces the large collections by
+    placeholders, which are streamed once the rest of the object is encoded.
+    """
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.serializers = writer.serializers
+        self.token = uuid.uuid4().hex
+        self.placeholder = re.compile('"__stream_{0}_([0-9]+)__"'.format(self.token))
+        self.collections = []
+
+    def _serializer(self, obj):
+        serializer = self.serializers.get(type(obj))
+        if serializer is None:
+            for key, s in self.serializers.items():
+                if isinstance(obj, key):
+                    return s
+        return serializer
+
+    def toDict(self, obj):
+        if (isinstance(obj, (list, set)) and len(obj) >= self.writer.stream_threshold and
+                self._serializer(obj) is None):
+            self.collections.append(obj)
+            return '__stream_{0}_{1}__'.format(self.token, len(self.collections) - 1)
+        return _to_dict(self, obj)
+
+    def write(self, text, fp):
+        start = 0
+        for match in self.placeholder.finditer(text):
+            fp.write(text[start:match.start()])
+            self.write_collection(self.collections[int(match.group(1))], fp)
+            start = match.end()
+        fp.write(text[start:])
+
+    def write_collection(self, collection, fp):
+        items = list(collection) if isinstance(collection, set) else collection
+        chunk_size = self.writer.chunk_size
+        fp.write('[')
+        for i in range(0, len(items), chunk_size):
+            if i:
+                fp.write(',')
+            nested = len(self.collections)
+            chunk = _encoder.encode([self.toDict(item) for item in items[i:i + chunk_size]])[1:-1]
+            if len(self.collections) > nested:
+                self.write(chunk, fp)
+            else:
+                fp.write(chunk)
+        fp.write(']')
+
+
+class StreamingGraphSONWriter(GraphSONWriter):
+    """
+    A GraphSONWriter that streams the large lists and sets of an object, like the arguments of
+    ``inject()`` or ``within()``, instead of first building the typed values of all their items. Only
+    ``chunk_size`` items are converted at a time. The output is identical to the output of GraphSONWriter
+    with the same serializers.
+
+    :param serializer_map: (Optional) Map of Python types to serializers, like GraphSONWriter.
+    :param stream_threshold: (Optional) Minimum size of the streamed collections. Default is 1000.
+    :param chunk_size: (Optional) Number of items of a collection converted at a time. Default is 1000.
+    """
+
+    stream_threshold = 1000
+    chunk_size = 1000
+
+    def __init__(self, serializer_map=None, stream_threshold=1000, chunk_size=1000):
+        super(StreamingGraphSONWriter, self).__init__(serializer_map)
+        self.stream_threshold = stream_threshold
+        self.chunk_size = chunk_size
+
+    def writeObject(self, objectData):
+        fp = StringIO()
+        self.write(objectData, fp)
+        return fp.getvalue()
+
+    def write(self, objectData, fp):
+        """
+        Writes the GraphSON of an object to a text file-like object.
+        """
+        encoding = _Encoding(self)
+        encoding.write(_encoder.encode(encoding.toDict(objectData)), fp)
@@ -0,0 +1,132 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Translation of traversal bytecode to parameterized Gremlin-Groovy scripts.
+"""
+
+from collections import OrderedDict
+
+from aenum import Enum
+
+from gremlin_python.process.traversal import Bytecode, Binding, P, Traversal
+from gremlin_python.statics import long
+from gremlin_python.structure.graph import Element
+
+from dse.graph import Element as DseElement, GraphSON2Serializer
+from dse.graph.graphson import Int64TypeIO
+
+from dse_graph.predicates import GeoP, TextDistanceP
+
+GROOVY_QUERY_LANGUAGE = 'gremlin-groovy'
+"""
+Graph query language of the translated scripts.
+"""
+
+_ENUM_CLASSES = {
+    'Cardinality': 'VertexProperty.Cardinality'
+}
+
+_SEARCH_PREDICATES = frozenset(['token', 'tokenPrefix', 'tokenRegex', 'prefix', 'regex'])
+
+
+class _Int64(long):
+    """
+    A long binding, sent as g:Int64 like in bytecode; the driver types the other integers by their value.
+    """
+    pass
+
+
+class _Int64TypeIO(Int64TypeIO):
+
+    @classmethod
+    def get_specialized_serializer(cls, value):
+        return cls
+
+
+GraphSON2Serializer.register(_Int64, _Int64TypeIO)
+
+
+def _binding(value):
+    return _Int64(value) if isinstance(value, long) else value
+
+
+class _Translation(object):
+
+    def __init__(self):
+        self.bindings = OrderedDict()
+
+    def bind(self, value):
+        name = '_p{0}'.format(len(self.bindings))
+        self.bindings[name] = _binding(value)
+        return name
+
+    def argument(self, arg):
+        if isinstance(arg, Traversal):
+            arg = arg.bytecode
+        if isinstance(arg, Bytecode):
+            if arg.source_instructions:
+                raise ValueError('Anonymous traversals with source instructions cannot be translated.')
+            return '__' + self.steps(arg.step_instructions)
+        elif isinstance(arg, Enum):
+            enum_class = type(arg).__name__
+            return '{0}.{1}'.format(_ENUM_CLASSES.get(enum_class, enum_class), arg.name.rstrip('_'))
+        elif isinstance(arg, P):
+            return self.predicate(arg)
+        elif isinstance(arg, GeoP):
+            return 'Geo.{0}({1})'.format(arg.operator, self.arguments(arg.value, arg.other))
+        elif isinstance(arg, TextDistanceP):
+            return 'Search.{0}({1})'.format(arg.operator, self.arguments(arg.value, arg.distance))
+        elif isinstance(arg, Binding):
+            self.bindings[arg.key] = _binding(arg.value)
+            return arg.key
+        elif isinstance(arg, (Element, DseElement)):
+            return self.bind(arg.id)
+        elif callable(arg):
+            raise ValueError('Lambdas cannot be translated.')
+        return self.bind(arg)
+
+    def arguments(self, value, other=None):
+        args = [value] if other is None else [value, other]
+        return ','.join(self.argument(arg) for arg in args)
+
+    def predicate(self, p):
+        if p.operator in ('and', 'or'):
+            return '{0}.{1}({2})'.format(self.argument(p.value), p.operator, self.argument(p.other))
+        elif p.operator == 'not':
+            return 'P.not({0})'.format(self.argument(p.value))
+        predicate_class = 'Search' if p.operator in _SEARCH_PREDICATES else 'P'
+        return '{0}.{1}({2})'.format(predicate_class, p.operator, self.arguments(p.value, p.other))
+
+    def steps(self, instructions):
+        return ''.join('.{0}({1})'.format(i[0], ','.join(self.argument(a) for a in i[1:])) for i in instructions)
+
+
+def translate(traversal, traversal_source='g'):
+    """
+    Translates a traversal to a Gremlin-Groovy script and its bindings. Every literal argument is
+    replaced by a binding, so traversals with the same :func:`dse_graph.bytecode.traversal_shape` have the
+    same script, which the server compiles once and caches. Lambdas are not supported.
+
+    Returns a tuple of the script and an OrderedDict of the bindings.
+
+    :param traversal: A GraphTraversal or its Bytecode
+    :param traversal_source: (Optional) Name of the traversal source in the script. Default is 'g'.
+
+    .. code-block:: python
+
+        >>> translate(g.V().has('name', 'marko').out('knows'))
+        ("g.V().has(_p0,_p1).out(_p2)", OrderedDict([('_p0', 'name'), ('_p1', 'marko'), ('_p2', 'knows')]))
+
+    """
+    bytecode = traversal.bytecode if isinstance(traversal, Traversal) else traversal
+    translation = _Translation()
+    script = traversal_source + translation.steps(bytecode.source_instructions) + \
+        translation.steps(bytecode.step_instructions)
+    return script, translation.bindings
@@ -0,0 +1,206 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+import logging
+import threading
+from collections import OrderedDict
+
+import six
+
+from dse_graph import _remote_connection, _hashable_id
+
+log = logging.getLogger(__name__)
+
+
+class MutationBuffer(object):
+    """
+    Buffers property updates and coalesces the pending updates of each vertex into a single traversal.
+    For a given vertex and key, the last written value wins.
+
+    Pending updates are flushed when ``max_pending`` updates are buffered, every ``flush_interval``
+    seconds if provided, on :meth:`flush` and when the buffer is closed.
+
+    :param traversal_source: A GraphTraversalSource created with :meth:`dse_graph.DseGraph.traversal_source`
+    :param max_pending: (Optional) Number of pending updates triggering a flush. Default is 1000.
+    :param flush_interval: (Optional) Maximum time, in seconds, updates stay in the buffer.
+    :param cardinality: (Optional) Cardinality passed to the ``property()`` steps, e.g. ``Cardinality.single``.
+    :param max_retries: (Optional) Number of times the updates of a vertex are put back in the buffer after their
+      traversal failed. Default is 2.
+    :param on_error: (Optional) Called with the vertex id, the properties and the error when the updates of a
+      vertex are dropped, because their traversal cannot be sent or failed more than ``max_retries`` times.
+
+    .. code-block:: python
+
+        g = DseGraph.traversal_source(session, 'my_graph')
+        with MutationBuffer(g, flush_interval=0.05) as buffer:
+            for event in events:
+                buffer.set_property(event.vertex_id, event.key, event.value)
+
+    """
+
+    def __init__(self, traversal_source, max_pending=1000, flush_interval=None, cardinality=None, max_retries=2,
+                 on_error=None):
+        self.traversal_source = traversal_source
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.cardinality = cardinality
+        self.max_retries = max_retries
+        self.on_error = on_error
+
+        self._connection = _remote_connection(traversal_source)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._pending_count = 0
+        self._attempts = {}
+        self._closed = threading.Event()
+        self._timer = None
+        if flush_interval:
+            self._timer = threading.Thread(target=self._run_timer, name='dse_graph-mutation-buffer')
+            self._timer.daemon = True
+            self._timer.start()
+
+    @property
+    def pending(self):
+        """
+        Number of buffered property updates.
+        """
+        return self._pending_count
+
+    def set_property(self, vertex_id, key, value):
+        """
+        Buffers a property update of a vertex.
+        """
+        if self._closed.is_set():
+            raise ValueError('The mutation buffer is closed.')
+
+        with self._lock:
+            vertex_key = _hashable_id(vertex_id)
+            entry = self._pending.get(vertex_key)
+            if entry is None:
+                entry = self._pending[vertex_key] = (vertex_id, OrderedDict())
+            properties = entry[1]
+            if key in properties:
+                del properties[key]
+            else:
+                self._pending_count += 1
+            properties[key] = value
+            full = self._pending_count >= self.max_pending
+
+        if full:
+            self.flush()
+
+    def flush(self):
+        """
+        Sends all pending updates, one traversal per vertex, and waits for them to complete. Returns the
+        number of traversals that succeeded.
+
+        The updates of a vertex whose traversal cannot be sent are dropped. The ones whose traversal failed are
+        put back in the buffer, under the updates buffered in the meantime, until they failed more than
+        ``max_retries`` times. The dropped updates are passed to ``on_error``, and the first error is raised once
+        all the traversals completed.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, OrderedDict()
+                self._pending_count = 0
+
+            errors = []
+            sent = []
+            for vertex_key, (vertex_id, properties) in six.iteritems(pending):
+                try:
+                    future = self._connection._execute_async(self._traversal(vertex_id, properties).bytecode)
+                except Exception as e:
+                    errors.append(e)
+                    self._drop(vertex_key, vertex_id, properties, e)
+                else:
+                    sent.append((vertex_key, vertex_id, properties, future))
+
+            failed = []
+            succeeded = 0
+            for vertex_key, vertex_id, properties, future in sent:
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(e)
+                    attempts = self._attempts.get(vertex_key, 0) + 1
+                    if attempts > self.max_retries:
+                        self._drop(vertex_key, vertex_id, properties, e)
+                    else:
+                        log.warning("Error flushing the buffered property updates of vertex %r (attempt %d), "
+                                    "put back in the buffer: %s", vertex_id, attempts, e)
+                        self._attempts[vertex_key] = attempts
+                        failed.append((vertex_key, (vertex_id, properties)))
+                else:
+                    self._attempts.pop(vertex_key, None)
+                    succeeded += 1
+
+            if failed:
+                self._requeue(failed)
+            if errors:
+                raise errors[0]
+            return succeeded
+
+    def _drop(self, vertex_key, vertex_id, properties, error):
+        self._attempts.pop(vertex_key, None)
+        log.error("Dropping the buffered property updates of vertex %r: %s", vertex_id, error)
+        if self.on_error:
+            try:
+                self.on_error(vertex_id, dict(properties), error)
+            except Exception:
+                log.exception("Error in mutation buffer error callback:")
+
+    def _requeue(self, entries):
+        with self._lock:
+            requeued = OrderedDict()
+            for vertex_key, (vertex_id, properties) in entries:
+                entry = self._pending.pop(vertex_key, None)
+                if entry is not None:
+                    # updates buffered during the flush are more recent
+                    properties = OrderedDict(properties)
+                    for key, value in six.iteritems(entry[1]):
+                        properties.pop(key, None)
+                        properties[key] = value
+                requeued[vertex_key] = (vertex_id, properties)
+            requeued.update(self._pending)
+            self._pending = requeued
+            self._pending_count = sum(len(properties) for _, properties in six.itervalues(requeued))
+
+    def _traversal(self, vertex_id, properties):
+        traversal = self.traversal_source.V(vertex_id)
+        for key, value in six.iteritems(properties):
+            if self.cardinality is None:
+                traversal = traversal.property(key, value)
+            else:
+                traversal = traversal.property(self.cardinality, key, value)
+        return traversal
+
+    def _run_timer(self):
+        while not self._closed.wait(self.flush_interval):
+            if self._pending_count:
+                try:
+                    self.flush()
+                except Exception:
+                    # logged, and passed to on_error for the dropped updates
+                    log.debug("Periodic flush of the mutation buffer failed", exc_info=True)
+
+    def close(self):
+        """
+        Flushes the pending updates and stops the flush timer.
+        """
+        self._closed.set()
+        if self._timer is not None:
+            self._timer.join()
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
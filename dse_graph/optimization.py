@@ -0,0 +1,151 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Client side rewrites of the traversal bytecode, applied before the traversals are sent.
+"""
+
+import logging
+from collections import OrderedDict
+
+import six
+
+from gremlin_python.process.traversal import Bytecode, Traversal, TraversalStrategy, P
+
+from dse_graph.bytecode import traversal_shape
+
+log = logging.getLogger(__name__)
+
+_FILTER_STEPS = frozenset(['has', 'hasLabel', 'hasId'])
+
+
+def merge_has(instructions):
+    """
+    Merges ``hasLabel(label)`` with an adjacent ``has(key, value)`` into ``has(label, key, value)``, which DSE
+    resolves with the indexes of the label, and drops the filter steps that repeat the previous one. Only string
+    keys, not ``T.id`` or ``T.label``, and values that are not traversals are merged.
+    """
+    out = []
+    for instruction in instructions:
+        previous = out[-1] if out else None
+        if previous is not None and previous[0] in _FILTER_STEPS and previous == instruction:
+            continue
+        if previous is not None and _is_label_and_has(previous, instruction):
+            out[-1] = ['has', previous[1], instruction[1], instruction[2]]
+            continue
+        if previous is not None and _is_label_and_has(instruction, previous):
+            out[-1] = ['has', instruction[1], previous[1], previous[2]]
+            continue
+        out.append(instruction)
+    return out
+
+
+def _is_label_and_has(label_step, has_step):
+    # has(label, key, value) only exists for a string key, and a traversal value has another meaning
+    return (label_step[0] == 'hasLabel' and len(label_step) == 2 and isinstance(label_step[1], six.string_types) and
+            has_step[0] == 'has' and len(has_step) == 3 and isinstance(has_step[1], six.string_types) and
+            not isinstance(has_step[2], (Traversal, Bytecode)))
+
+
+def remove_identity(instructions):
+    """
+    Removes the ``identity()`` steps, unless it is the only step of the traversal.
+    """
+    out = [i for i in instructions if i != ['identity']]
+    return out if out else instructions
+
+
+def remove_redundant_dedup(instructions):
+    """
+    Removes a ``dedup()`` directly following another ``dedup()``.
+    """
+    out = []
+    for instruction in instructions:
+        if instruction == ['dedup'] and out and out[-1] == ['dedup']:
+            continue
+        out.append(instruction)
+    return out
+
+
+def start_from_ids(instructions):
+    """
+    Rewrites ``V().hasId(ids)`` into ``V(ids)``, a direct lookup of the vertices.
+    """
+    if (len(instructions) >= 2 and instructions[0] == ['V'] and instructions[1][0] == 'hasId' and
+            len(instructions[1]) > 1 and not any(isinstance(arg, P) for arg in instructions[1][1:])):
+        return [['V'] + instructions[1][1:]] + instructions[2:]
+    return instructions
+
+
+RULES = OrderedDict([
+    ('merge_has', merge_has),
+    ('remove_identity', remove_identity),
+    ('remove_redundant_dedup', remove_redundant_dedup),
+    ('start_from_ids', start_from_ids),
+])
+"""
+The available rewrite rules, by name. Each rule takes a list of step instructions and returns the
+rewritten list.
+"""
+
+
+class BytecodeOptimizationStrategy(TraversalStrategy):
+    """
+    A client side TraversalStrategy rewriting the bytecode of the traversals, and of their nested anonymous
+    traversals, before they are sent. The rules that rewrote a traversal are logged at debug level.
+
+    :param rules: (Optional) Names of the `RULES` to apply. Default is all of them.
+
+    .. code-block:: python
+
+        g = DseGraph.traversal_source(session, 'my_graph',
+                                      client_strategies=[BytecodeOptimizationStrategy(['start_from_ids'])])
+
+    """
+
+    def __init__(self, rules=None):
+        super(BytecodeOptimizationStrategy, self).__init__()
+        names = list(RULES) if rules is None else list(rules)
+        unknown = [name for name in names if name not in RULES]
+        if unknown:
+            raise ValueError('Unknown optimization rules: {0}'.format(', '.join(unknown)))
+        self.rules = [(name, RULES[name]) for name in names]
+
+    def apply(self, traversal):
+        if traversal.traversers is None:
+            self.optimize(traversal.bytecode)
+
+    def optimize(self, bytecode):
+        """
+        Rewrites a Bytecode in place. Returns the names of the rules that changed it.
+        """
+        fired = []
+        self._optimize(bytecode, fired)
+        if fired and log.isEnabledFor(logging.DEBUG):
+            log.debug("Optimization rules %s rewrote the traversal to %s", fired, traversal_shape(bytecode))
+        return fired
+
+    def _optimize(self, bytecode, fired):
+        instructions = [self._optimize_arguments(i, fired) for i in bytecode.step_instructions]
+        for name, rule in self.rules:
+            rewritten = rule(instructions)
+            if rewritten != instructions:
+                if name not in fired:
+                    fired.append(name)
+                instructions = rewritten
+        bytecode.step_instructions = instructions
+
+    def _optimize_arguments(self, instruction, fired):
+        arguments = []
+        for arg in instruction[1:]:
+            if isinstance(arg, (Traversal, Bytecode)):
+                arg = Bytecode(arg.bytecode if isinstance(arg, Traversal) else arg)
+                self._optimize(arg, fired)
+            arguments.append(arg)
+        return [instruction[0]] + arguments
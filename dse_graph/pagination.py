@@ -0,0 +1,114 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from gremlin_python.process.traversal import Bytecode, P, Order
+from gremlin_python.statics import long
+
+from dse_graph import _remote_connection
+
+
+class RangeWindows(object):
+    """
+    Splits a traversal in successive ``range(low, high)`` windows.
+
+    Windows are only consistent if the traversal returns its results in a stable order.
+    """
+
+    def __init__(self, bytecode, page_size):
+        self.bytecode = bytecode
+        self.page_size = page_size
+        self._low = 0
+
+    def next_window(self, page=None):
+        """
+        Returns the bytecode of the next window.
+
+        :param page: The results of the previous window, None for the first window.
+        """
+        if page is not None:
+            self._low += self.page_size
+        bytecode = Bytecode(self.bytecode)
+        bytecode.add_step('range', long(self._low), long(self._low + self.page_size))
+        return bytecode
+
+    def result(self, item):
+        return item
+
+
+class CursorWindows(object):
+    """
+    Splits a traversal emitting elements in windows ordered by the value of a property key. Each
+    window starts after the last key value of the previous one, so the key should be unique.
+    """
+
+    def __init__(self, bytecode, page_size, cursor_key):
+        self.bytecode = bytecode
+        self.page_size = page_size
+        self.cursor_key = cursor_key
+
+    def next_window(self, page=None):
+        bytecode = Bytecode(self.bytecode)
+        if page:
+            bytecode.add_step('has', self.cursor_key, P.gt(page[-1]['cursor']))
+        bytecode.add_step('order')
+        bytecode.add_step('by', self.cursor_key, Order.incr)
+        bytecode.add_step('limit', long(self.page_size))
+        bytecode.add_step('project', 'element', 'cursor')
+        bytecode.add_step('by')
+        bytecode.add_step('by', self.cursor_key)
+        return bytecode
+
+    def result(self, item):
+        return item['element']
+
+
+def paginate(traversal, page_size=1000, cursor_key=None, prefetch=True):
+    """
+    Executes a GraphTraversal in successive windows of ``page_size`` results and returns a generator over
+    all the results. While a window is being consumed, the next one is already requested to the server.
+
+    By default windows are built with ``range(low, high)``. If ``cursor_key`` is provided, the traversal must
+    emit elements that have this property key; windows are then ordered by the key and each one starts after the
+    last value of the previous one.
+
+    :param traversal: A GraphTraversal created with :meth:`dse_graph.DseGraph.traversal_source`
+    :param page_size: (Optional) Number of results per window. Default is 1000.
+    :param cursor_key: (Optional) Property key used to build cursor windows.
+    :param prefetch: (Optional) Request the next window before the current one is consumed. Default is True.
+
+    .. code-block:: python
+
+        g = DseGraph.traversal_source(session, 'my_graph')
+        for edge in paginate(g.E().hasLabel('distance'), page_size=500):
+            process(edge)
+
+    """
+    if page_size <= 0:
+        raise ValueError('page_size must be a positive integer.')
+
+    connection = _remote_connection(traversal)
+    if cursor_key is None:
+        windows = RangeWindows(traversal.bytecode, page_size)
+    else:
+        windows = CursorWindows(traversal.bytecode, page_size, cursor_key)
+
+    future = connection._execute_async(windows.next_window())
+    while future is not None:
+        page = list(future.result())
+        future = next_bytecode = None
+        if len(page) == page_size:
+            next_bytecode = windows.next_window(page)
+            if prefetch:
+                future = connection._execute_async(next_bytecode)
+
+        for item in page:
+            yield windows.result(item)
+
+        if next_bytecode is not None and future is None:
+            future = connection._execute_async(next_bytecode)
@@ -0,0 +1,144 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+import threading
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # Python 2 without the futures backport
+    ProcessPoolExecutor = None
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # Python < 3.8
+    resource_tracker = shared_memory = None
+
+from dse_graph import dse_graphson_reader, graph_traversal_dse_object_row_factory
+
+
+def _attach(name):
+    """
+    Attaches to an existing shared memory block without registering it with the resource tracker of the
+    worker, which would unlink it, or warn that it leaked, when the worker exits. The block is unlinked by
+    the process that created it.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 registers the blocks it attaches to
+        pass
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None  # the workers run one task at a time
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _decode_chunk(source, offsets):
+    """
+    Decodes the rows found at ``offsets`` in ``source``, which is either the name of a shared memory
+    block or the raw payload. Runs in the worker processes.
+    """
+    block = None
+    if isinstance(source, tuple):
+        block = _attach(source[0])
+        payload = block.buf
+    else:
+        payload = source
+
+    try:
+        return [dse_graphson_reader.readObject(bytes(payload[start:end]).decode('utf-8'))['result']
+                for start, end in offsets]
+    finally:
+        if block is not None:
+            del payload
+            block.close()
+
+
+class ProcessPoolRowFactory(object):
+    """
+    Row Factory that returns the decoded graphson as DSE types, like `graph_traversal_dse_object_row_factory`,
+    but decodes large results in a pool of processes. The raw rows are split in chunks that are decoded
+    concurrently and reassembled in order. Results smaller than ``threshold`` are decoded inline.
+
+    With Python 3.8+, the raw payload is passed to the workers through shared memory. This mode requires
+    ``concurrent.futures`` (Python 3, or the ``futures`` backport on Python 2), otherwise all results are
+    decoded inline.
+
+    :param max_workers: (Optional) Number of worker processes. Default is the number of CPUs.
+    :param threshold: (Optional) Minimum payload size, in characters, decoded in the pool. Default is 1MB.
+    :param chunk_size: (Optional) Number of rows decoded by each task. Default is 1000.
+    :param executor: (Optional) An existing ProcessPoolExecutor to use.
+
+    .. code-block:: python
+
+        row_factory = ProcessPoolRowFactory(max_workers=4)
+        ep = DseGraph.create_execution_profile('my_graph', row_factory=row_factory)
+
+    """
+
+    threshold = 1024 * 1024
+    chunk_size = 1000
+
+    def __init__(self, max_workers=None, threshold=1024 * 1024, chunk_size=1000, executor=None):
+        self.max_workers = max_workers
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self._executor = executor
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def __call__(self, column_names, rows):
+        if ProcessPoolExecutor is None or len(rows) <= 1 or sum(len(row[0]) for row in rows) < self.threshold:
+            return graph_traversal_dse_object_row_factory(column_names, rows)
+
+        offsets = []
+        position = 0
+        encoded = [row[0].encode('utf-8') for row in rows]
+        for data in encoded:
+            offsets.append((position, position + len(data)))
+            position += len(data)
+        payload = b''.join(encoded)
+        del encoded
+
+        block = None
+        source = payload
+        if shared_memory is not None:
+            block = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+            block.buf[:len(payload)] = payload
+            source = (block.name,)
+            del payload
+
+        try:
+            futures = [self.executor.submit(_decode_chunk, source, offsets[i:i + self.chunk_size])
+                       for i in range(0, len(offsets), self.chunk_size)]
+            results = []
+            for future in futures:
+                results.extend(future.result())
+            return results
+        finally:
+            if block is not None:
+                block.close()
+                block.unlink()
+
+    def shutdown(self, wait=True):
+        """
+        Shuts down the worker processes.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
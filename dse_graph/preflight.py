@@ -0,0 +1,244 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Pre-flight detection of the traversals scanning all the vertices or edges of a label.
+"""
+
+import logging
+import threading
+import warnings
+from collections import namedtuple, OrderedDict
+
+import six
+
+from gremlin_python.process.traversal import P, T, Traversal
+
+from dse_graph import _with_connection_options
+from dse_graph.bytecode import traversal_shape
+from dse_graph.predicates import GeoP, TextDistanceP
+
+log = logging.getLogger(__name__)
+
+MODES = ('warn', 'raise', 'log')
+"""
+How a :class:`ScanAnalyzer` surfaces the scans: a :class:`ScanWarning`, a :class:`FullScanError`, or a
+warning logged by the ``dse_graph.preflight`` logger.
+"""
+
+# reasons of the scans
+UNFILTERED = 'unfiltered'
+LABEL = 'label'
+NO_LABEL = 'no_label'
+UNINDEXED = 'unindexed'
+
+# predicates that any index type supports; the others, including the geo and text distance predicates,
+# require a search index
+_EQUALITY_OPERATORS = frozenset(['eq', 'within'])
+_LOOKUP_TYPES = frozenset(['materialized', 'secondary', 'search'])
+_FILTER_STEPS = frozenset(['has', 'hasLabel', 'hasId', 'hasKey', 'hasValue', 'hasNot'])
+
+Scan = namedtuple('Scan', ['shape', 'reason', 'labels', 'keys'])
+"""
+A traversal detected as a scan: its shape, the reason ('unfiltered', 'label', 'no_label' or 'unindexed'),
+the labels it is restricted to and the property keys it filters on.
+"""
+
+
+class ScanWarning(UserWarning):
+    """
+    Warning issued for the scans by a :class:`ScanAnalyzer` in 'warn' mode.
+    """
+    pass
+
+
+class FullScanError(Exception):
+    """
+    Raised for the scans by a :class:`ScanAnalyzer` in 'raise' mode, before the traversal is sent.
+    """
+
+    scan = None
+    """
+    The :class:`Scan` detected.
+    """
+
+    def __init__(self, scan):
+        super(FullScanError, self).__init__(_message(scan))
+        self.scan = scan
+
+
+def _message(scan):
+    if scan.reason == UNFILTERED:
+        detail = 'it reads every element of the graph'
+    elif scan.reason == LABEL:
+        detail = 'it reads every element of the label(s) {0}'.format(', '.join(scan.labels))
+    elif scan.reason == NO_LABEL:
+        detail = 'it filters on {0} without a label'.format(', '.join(scan.keys))
+    else:
+        detail = 'no index of the label(s) {0} supports its filters on {1}'.format(
+            ', '.join(scan.labels), ', '.join(scan.keys))
+    return 'Traversal {0} would scan: {1}'.format(scan.shape, detail)
+
+
+def _bytecode(traversal):
+    return traversal.bytecode if isinstance(traversal, Traversal) else traversal
+
+
+def allow_scan(traversal_source):
+    """
+    Returns a copy of a traversal source bound to the same session, whose traversals are intended scans that
+    are not checked by a :class:`ScanAnalyzer`.
+
+    .. code-block:: python
+
+        allow_scan(g).V().hasLabel('person').count().next()
+
+    """
+    return _with_connection_options(traversal_source, scan_analyzer=None)
+
+
+def _label_values(predicate):
+    """
+    Returns the labels a ``has(T.label, ...)`` filter restricts the traversal to.
+    """
+    if not isinstance(predicate, P):
+        return [predicate]
+    elif predicate.operator == 'eq':
+        return [predicate.value]
+    elif predicate.operator == 'within':
+        if isinstance(predicate.value, (list, tuple, set)):
+            return list(predicate.value)
+        return [value for value in (predicate.value, predicate.other) if value is not None]
+    # e.g. without() or neq(), which do not restrict the labels
+    return []
+
+
+def _is_equality(predicate):
+    if isinstance(predicate, (GeoP, TextDistanceP)):
+        return False
+    return not isinstance(predicate, P) or predicate.operator in _EQUALITY_OPERATORS
+
+
+class ScanAnalyzer(object):
+    """
+    Detects, before a :class:`dse_graph.DSESessionRemoteGraphConnection` sends them, the traversals that would
+    scan all the vertices or edges of a label, by comparing their leading ``has()`` filters to the indexes of a
+    cached schema snapshot. A traversal starting with ``V()`` or ``E()`` without ids is a scan unless it is
+    narrowed down by ``hasId()``, or by ``has()`` filters on a label and a property key covered by an index of
+    the label, or on all the property keys of its partition key. Predicates other than equality and ``within()``
+    require a search index. Like the server with scans disallowed, traversals only restricted to a label are scans.
+
+    The traversals sent to the analytics source and the ones of a traversal source returned by :func:`allow_scan`
+    are not checked.
+
+    :param schema_cache: A :class:`dse_graph.schema.SchemaCache` of the graph
+    :param mode: (Optional) One of `MODES`. Default is 'warn'.
+
+    .. code-block:: python
+
+        analyzer = ScanAnalyzer(SchemaCache(session, 'my_graph'), mode='raise')
+        g = DseGraph.traversal_source(session, 'my_graph', scan_analyzer=analyzer)
+        g.V().has('person', 'nickname', 'bob').next()  # raises FullScanError if 'nickname' is not indexed
+
+    """
+
+    schema_cache = None
+    mode = 'warn'
+
+    traversals_checked = 0
+    """
+    Number of traversals checked.
+    """
+
+    def __init__(self, schema_cache, mode='warn'):
+        if mode not in MODES:
+            raise ValueError("Unknown mode '{0}', expected one of {1}".format(mode, MODES))
+        self.schema_cache = schema_cache
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._scans = OrderedDict((reason, 0) for reason in (UNFILTERED, LABEL, NO_LABEL, UNINDEXED))
+
+    def analyze(self, traversal):
+        """
+        Returns the :class:`Scan` of a traversal, or None if it does not scan.
+        """
+        bytecode = _bytecode(traversal)
+        instructions = bytecode.step_instructions
+        if not instructions or instructions[0][0] not in ('V', 'E') or len(instructions[0]) > 1:
+            return None
+
+        labels = []
+        filters = []
+        for instruction in instructions[1:]:
+            step, args = instruction[0], instruction[1:]
+            if step not in _FILTER_STEPS:
+                break
+            if step == 'hasId':
+                return None
+            elif step == 'hasLabel':
+                labels.extend(args)
+            elif step == 'has' and len(args) == 3:
+                labels.append(args[0])
+                filters.append(args[1:])
+            elif step == 'has' and len(args) == 2:
+                if args[0] == T.id:
+                    return None
+                elif args[0] == T.label:
+                    labels.extend(_label_values(args[1]))
+                else:
+                    filters.append(args)
+
+        shape = traversal_shape(bytecode)
+        keys = [key for key, _ in filters]
+        labels = [label for label in labels if isinstance(label, six.string_types)]
+        if not filters:
+            return Scan(shape, LABEL if labels else UNFILTERED, labels, keys)
+        if not labels:
+            return Scan(shape, NO_LABEL, labels, keys)
+
+        schema = self.schema_cache.get()
+        element_labels = schema.vertex_labels if instructions[0][0] == 'V' else schema.edge_labels
+        for key, predicate in filters:
+            supported = _LOOKUP_TYPES if _is_equality(predicate) else set(['search'])
+            if all(label in element_labels and element_labels[label].index_types(key) & supported
+                   for label in labels):
+                return None
+        # a partition key only narrows down the traversal if all its components are filtered on
+        equality_keys = set(key for key, predicate in filters if _is_equality(predicate))
+        if all(label in element_labels and element_labels[label].partition_keys and
+               equality_keys.issuperset(element_labels[label].partition_keys) for label in labels):
+            return None
+        return Scan(shape, UNINDEXED, labels, keys)
+
+    def check(self, traversal):
+        """
+        Analyzes a traversal and surfaces its scan according to the mode. Returns the :class:`Scan`, or None.
+        """
+        scan = self.analyze(traversal)
+        with self._lock:
+            self.traversals_checked += 1
+            if scan is not None:
+                self._scans[scan.reason] += 1
+        if scan is None:
+            return None
+
+        if self.mode == 'raise':
+            raise FullScanError(scan)
+        elif self.mode == 'warn':
+            warnings.warn(_message(scan), ScanWarning, stacklevel=2)
+        else:
+            log.warning(_message(scan))
+        return scan
+
+    def scans(self):
+        """
+        Returns the number of scans detected per reason: 'unfiltered', 'label', 'no_label' and 'unindexed'.
+        """
+        with self._lock:
+            return OrderedDict(self._scans)
@@ -0,0 +1,285 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+import threading
+
+from gremlin_python.process.traversal import Bytecode
+
+from dse_graph import _remote_connection
+from dse_graph.bytecode import traversal_shape
+
+
+def _unwrap(value):
+    """
+    Unwraps a GraphSON typed value that was not decoded by the reader.
+    """
+    if isinstance(value, dict) and '@value' in value:
+        return value['@value']
+    return value
+
+
+class StepMetrics(object):
+    """
+    Server side metrics of a single step of a profiled traversal.
+    """
+
+    id = None
+    name = None
+
+    duration = None
+    """
+    Time spent in the step, in milliseconds.
+    """
+
+    percent_duration = None
+    """
+    Percentage of the traversal time spent in the step.
+    """
+
+    traverser_count = None
+    element_count = None
+
+    children = None
+    """
+    Metrics of the steps of nested traversals.
+    """
+
+    def __init__(self, id, name, duration, percent_duration=None, traverser_count=None, element_count=None,
+                 children=None):
+        self.id = id
+        self.name = name
+        self.duration = duration
+        self.percent_duration = percent_duration
+        self.traverser_count = traverser_count
+        self.element_count = element_count
+        self.children = children or []
+
+    @classmethod
+    def from_graphson(cls, data):
+        data = _unwrap(data)
+        counts = _unwrap(data.get('counts')) or {}
+        annotations = _unwrap(data.get('annotations')) or {}
+        return cls(
+            data.get('id'),
+            data.get('name'),
+            _unwrap(data.get('dur')),
+            _unwrap(annotations.get('percentDur')),
+            _unwrap(counts.get('traverserCount')),
+            _unwrap(counts.get('elementCount')),
+            [cls.from_graphson(m) for m in _unwrap(data.get('metrics')) or []]
+        )
+
+    def __repr__(self):
+        return "<StepMetrics: name='{0}', duration={1}, percent_duration={2}, traverser_count={3}>".format(
+            self.name, self.duration, self.percent_duration, self.traverser_count)
+
+
+class TraversalProfile(object):
+    """
+    The parsed TraversalMetrics of a profiled traversal.
+    """
+
+    shape = None
+    """
+    The shape of the profiled traversal, see :func:`dse_graph.bytecode.traversal_shape`.
+    """
+
+    duration = None
+    """
+    Total time of the traversal on the server, in milliseconds.
+    """
+
+    steps = None
+
+    def __init__(self, duration, steps, shape=None):
+        self.duration = duration
+        self.steps = steps
+        self.shape = shape
+
+    @classmethod
+    def from_graphson(cls, data, shape=None):
+        """
+        Builds a TraversalProfile from the result of a ``profile()`` step.
+
+        :param data: The decoded TraversalMetrics
+        :param shape: (Optional) The shape of the profiled traversal
+        """
+        data = _unwrap(data)
+        if not isinstance(data, dict) or 'metrics' not in data:
+            raise ValueError('Unexpected profile() result: %r' % (data,))
+        return cls(_unwrap(data.get('dur')), [StepMetrics.from_graphson(m) for m in _unwrap(data['metrics'])], shape)
+
+    def walk(self):
+        """
+        Iterates over all steps, nested ones included, depth first. Yields `(depth, step)` tuples.
+        """
+        stack = [(0, s) for s in reversed(self.steps)]
+        while stack:
+            depth, step = stack.pop()
+            yield depth, step
+            stack.extend((depth + 1, s) for s in reversed(step.children))
+
+    def __str__(self):
+        lines = ['{0:<60} {1:>10} {2:>10} {3:>12} {4:>7}'.format('Step', 'Count', 'Traversers', 'Time (ms)', '% Dur')]
+        for depth, step in self.walk():
+            lines.append('{0:<60} {1:>10} {2:>10} {3:>12.3f} {4:>7.2f}'.format(
+                ('  ' * depth + (step.name or ''))[:60], step.element_count or 0, step.traverser_count or 0,
+                step.duration or 0, step.percent_duration or 0))
+        lines.append('{0:<60} {1:>10} {2:>10} {3:>12.3f}'.format('TOTAL', '-', '-', self.duration or 0))
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return "<TraversalProfile: shape='{0}', duration={1}, steps={2}>".format(self.shape, self.duration, len(self.steps))
+
+
+def profile(traversal):
+    """
+    Executes a GraphTraversal with a ``profile()`` step through the DSE session it is bound to, and returns
+    the server side metrics as a :class:`TraversalProfile`. The traversal itself is not modified.
+
+    :param traversal: A GraphTraversal created with :meth:`dse_graph.DseGraph.traversal_source`
+
+    .. code-block:: python
+
+        g = DseGraph.traversal_source(session, 'my_graph')
+        print profile(g.V().has('name', 'marko').out('knows'))
+
+    """
+    bytecode = Bytecode(traversal.bytecode)
+    bytecode.add_step('profile')
+    remote_traversal = _remote_connection(traversal).submit(bytecode)
+    return TraversalProfile.from_graphson(next(remote_traversal.traversers).object, traversal_shape(traversal))
+
+
+class StepReport(object):
+    """
+    Aggregated metrics of one step of a traversal shape.
+    """
+
+    name = None
+    depth = 0
+    runs = 0
+    total_duration = 0
+    max_duration = 0
+    total_percent_duration = 0
+    total_traverser_count = 0
+
+    def __init__(self, name, depth):
+        self.name = name
+        self.depth = depth
+
+    def add(self, step):
+        self.runs += 1
+        self.total_duration += step.duration or 0
+        self.max_duration = max(self.max_duration, step.duration or 0)
+        self.total_percent_duration += step.percent_duration or 0
+        self.total_traverser_count += step.traverser_count or 0
+
+    @property
+    def mean_duration(self):
+        return self.total_duration / float(self.runs) if self.runs else 0
+
+    @property
+    def mean_percent_duration(self):
+        return self.total_percent_duration / float(self.runs) if self.runs else 0
+
+    def __repr__(self):
+        return "<StepReport: name='{0}', runs={1}, mean_duration={2:.3f}, mean_percent_duration={3:.2f}>".format(
+            self.name, self.runs, self.mean_duration, self.mean_percent_duration)
+
+
+class ShapeReport(object):
+    """
+    Aggregated profiles of all the runs of a traversal shape.
+    """
+
+    shape = None
+    runs = 0
+    total_duration = 0
+    steps = None
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.steps = []
+
+    def add(self, traversal_profile):
+        self.runs += 1
+        self.total_duration += traversal_profile.duration or 0
+        for i, (depth, step) in enumerate(traversal_profile.walk()):
+            if i == len(self.steps):
+                self.steps.append(StepReport(step.name, depth))
+            self.steps[i].add(step)
+
+    @property
+    def mean_duration(self):
+        return self.total_duration / float(self.runs) if self.runs else 0
+
+    def __repr__(self):
+        return "<ShapeReport: shape='{0}', runs={1}, mean_duration={2:.3f}>".format(
+            self.shape, self.runs, self.mean_duration)
+
+
+class ProfileAggregator(object):
+    """
+    Aggregates traversal profiles across runs, per traversal shape.
+
+    .. code-block:: python
+
+        aggregator = ProfileAggregator()
+        for name in names:
+            aggregator.profile(g.V().has('person', 'name', name).out('knows'))
+
+        for shape, step in aggregator.hot_steps(5):
+            print shape, step.name, step.mean_duration
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reports = {}
+
+    def profile(self, traversal):
+        """
+        Profiles a traversal with :func:`profile`, records and returns the result.
+        """
+        traversal_profile = profile(traversal)
+        self.add(traversal_profile)
+        return traversal_profile
+
+    def add(self, traversal_profile):
+        """
+        Records a :class:`TraversalProfile`.
+        """
+        with self._lock:
+            report = self._reports.get(traversal_profile.shape)
+            if report is None:
+                report = self._reports[traversal_profile.shape] = ShapeReport(traversal_profile.shape)
+            report.add(traversal_profile)
+
+    def reports(self):
+        """
+        Returns the :class:`ShapeReport` of every recorded shape, slowest first.
+        """
+        with self._lock:
+            reports = list(self._reports.values())
+        return sorted(reports, key=lambda r: r.mean_duration, reverse=True)
+
+    def hot_steps(self, limit=10):
+        """
+        Returns the `(shape, StepReport)` tuples of the steps with the highest mean duration, across all shapes.
+
+        :param limit: (Optional) Maximum number of steps returned. Default is 10.
+        """
+        steps = [(report.shape, step) for report in self.reports() for step in report.steps]
+        steps.sort(key=lambda s: s[1].mean_duration, reverse=True)
+        return steps[:limit]
+
+    def clear(self):
+        with self._lock:
+            self._reports.clear()
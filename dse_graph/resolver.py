@@ -0,0 +1,142 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+import threading
+from collections import OrderedDict
+
+from gremlin_python.process.traversal import P, T
+
+from dse_graph import _remote_connection, _hashable_id
+
+
+class VertexIdResolver(object):
+    """
+    Resolves vertices identified by a business key ``(label, key, value)`` to their DSE vertex id, with
+    a bounded LRU cache. Cache misses are looked up in batches with a ``within(...)`` predicate.
+
+    Values that are not found are not cached.
+
+    :param traversal_source: A GraphTraversalSource created with :meth:`dse_graph.DseGraph.traversal_source`
+    :param max_size: (Optional) Maximum number of cached ids. Default is 100000.
+    :param batch_size: (Optional) Maximum number of values looked up by a single traversal. Default is 500.
+
+    .. code-block:: python
+
+        resolver = VertexIdResolver(g)
+        ids = resolver.resolve_many('user', 'email', [row.src for row in rows] + [row.dst for row in rows])
+        for row in rows:
+            g.V(ids[row.src]).addE('follows').to(__.V(ids[row.dst])).iterate()
+
+    """
+
+    hits = 0
+    misses = 0
+
+    def __init__(self, traversal_source, max_size=100000, batch_size=500):
+        self.traversal_source = traversal_source
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self._connection = _remote_connection(traversal_source)
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._keys_by_id = {}
+
+    def resolve(self, label, key, value):
+        """
+        Returns the id of the vertex, or None if it does not exist.
+        """
+        return self.resolve_many(label, key, [value]).get(value)
+
+    def resolve_many(self, label, key, values):
+        """
+        Returns a dict of the provided values to their vertex id. Values that are not found are not in the dict.
+        A value repeated in ``values`` is looked up, and counted as a miss, once.
+        """
+        resolved = {}
+        missing = []
+        seen = set()
+        with self._lock:
+            for value in values:
+                cache_key = (label, key, value)
+                vertex_id = self._cache.pop(cache_key, None)
+                if vertex_id is None:
+                    if value not in seen:
+                        seen.add(value)
+                        missing.append(value)
+                    continue
+                self._cache[cache_key] = vertex_id
+                resolved[value] = vertex_id
+                self.hits += 1
+            self.misses += len(missing)
+
+        futures = [self._connection._execute_async(self._lookup(label, key, missing[i:i + self.batch_size]))
+                   for i in range(0, len(missing), self.batch_size)]
+        for future in futures:
+            for row in future.result():
+                resolved[row['value']] = row['id']
+                self._put((label, key, row['value']), row['id'])
+
+        return resolved
+
+    def _lookup(self, label, key, values):
+        return self.traversal_source.V().has(label, key, P.within(list(values))) \
+            .project('value', 'id').by(key).by(T.id).bytecode
+
+    def _put(self, cache_key, vertex_id):
+        id_key = _hashable_id(vertex_id)
+        with self._lock:
+            self._cache.pop(cache_key, None)
+            self._cache[cache_key] = vertex_id
+            self._keys_by_id.setdefault(id_key, set()).add(cache_key)
+            while len(self._cache) > self.max_size:
+                self._forget(*self._cache.popitem(last=False))
+
+    def _forget(self, cache_key, vertex_id):
+        id_key = _hashable_id(vertex_id)
+        keys = self._keys_by_id.get(id_key)
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del self._keys_by_id[id_key]
+
+    def invalidate(self, label, key, value):
+        """
+        Removes a business key from the cache.
+        """
+        with self._lock:
+            vertex_id = self._cache.pop((label, key, value), None)
+            if vertex_id is not None:
+                self._forget((label, key, value), vertex_id)
+
+    def invalidate_vertex(self, vertex_id):
+        """
+        Removes all the cached business keys of a vertex.
+        """
+        with self._lock:
+            for cache_key in self._keys_by_id.pop(_hashable_id(vertex_id), ()):
+                self._cache.pop(cache_key, None)
+
+    def drop_vertex(self, vertex_id):
+        """
+        Drops a vertex and removes its business keys from the cache.
+        """
+        self.invalidate_vertex(vertex_id)
+        try:
+            self._connection._execute_async(self.traversal_source.V(vertex_id).drop().bytecode).result()
+        finally:
+            # a concurrent resolve may have cached the vertex again while the drop was in flight
+            self.invalidate_vertex(vertex_id)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._keys_by_id.clear()
+
+    def __len__(self):
+        return len(self._cache)
@@ -0,0 +1,145 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Routing of traversals to the replicas owning the vertices they start from.
+"""
+
+import logging
+import random
+import struct
+from collections import OrderedDict
+
+from gremlin_python.process.traversal import Bytecode
+
+from dse import cqltypes
+from dse.policies import HostDistance
+
+from dse_graph import _remote_connection, _hashable_id
+from dse_graph.bytecode import _bytecode, start_vertex_ids
+
+log = logging.getLogger(__name__)
+
+VERTEX_TABLE_SUFFIX = '_p'
+"""
+Suffix of the tables storing the vertices of a label in the graph keyspace.
+"""
+
+
+class ReplicaRouter(object):
+    """
+    Finds the replicas owning vertices from their id. DSE vertex ids contain the partition key of the
+    vertex table of their label; its columns are read from the cluster metadata.
+
+    :param session: A DSE session
+    :param graph_name: The graph name, which is also the name of its keyspace
+    """
+
+    def __init__(self, session, graph_name):
+        self.session = session
+        self.graph_name = graph_name
+
+    def routing_key(self, vertex_id):
+        """
+        Returns the serialized partition key of a vertex, or None if it cannot be determined or serialized.
+        """
+        if not isinstance(vertex_id, dict) or '~label' not in vertex_id:
+            return None
+        cluster = self.session.cluster
+        keyspace = cluster.metadata.keyspaces.get(self.graph_name)
+        table = keyspace.tables.get(vertex_id['~label'] + VERTEX_TABLE_SUFFIX) if keyspace else None
+        if table is None:
+            return None
+
+        parts = []
+        for column in table.partition_key:
+            if column.name not in vertex_id:
+                return None
+            # CQL type names, like the driver metadata; frozen, UDT and custom types are not found
+            cql_type = cqltypes._cqltypes.get(column.cql_type)
+            if cql_type is None:
+                log.debug("Cannot route vertex %r: unsupported partition key type '%s'", vertex_id, column.cql_type)
+                return None
+            try:
+                parts.append(cql_type.serialize(vertex_id[column.name], cluster.protocol_version))
+            except Exception as e:
+                # routing is best-effort
+                log.debug("Cannot route vertex %r: error serializing its partition key column '%s': %s",
+                          vertex_id, column.name, e)
+                return None
+        if len(parts) == 1:
+            return parts[0]
+        return b''.join(struct.pack('>H%dsB' % len(p), len(p), p, 0) for p in parts)
+
+    def replicas(self, vertex_id):
+        """
+        Returns the live replicas of a vertex, local ones first.
+        """
+        routing_key = self.routing_key(vertex_id)
+        if routing_key is None:
+            return []
+        cluster = self.session.cluster
+        distance = cluster.profile_manager.distance
+        hosts = [host for host in cluster.metadata.get_replicas(self.graph_name, routing_key) if host.is_up]
+        return sorted(hosts, key=lambda host: distance(host) != HostDistance.LOCAL)
+
+    def replica(self, vertex_ids):
+        """
+        Returns a live replica owning all the vertices, or None.
+        """
+        common = None
+        for vertex_id in vertex_ids:
+            replicas = self.replicas(vertex_id)
+            common = replicas if common is None else [host for host in common if host in replicas]
+            if not common:
+                return None
+        return random.choice(common) if common else None
+
+    def group_by_replica(self, vertex_ids):
+        """
+        Groups vertex ids by their first live replica. Returns an OrderedDict of host to ids; the ids with
+        no known replica are grouped under None.
+        """
+        groups = OrderedDict()
+        seen = set()
+        for vertex_id in vertex_ids:
+            key = _hashable_id(vertex_id)
+            if key in seen:
+                continue
+            seen.add(key)
+            replicas = self.replicas(vertex_id)
+            groups.setdefault(replicas[0] if replicas else None, []).append(vertex_id)
+        return groups
+
+
+def submit_by_replica(traversal):
+    """
+    Splits a traversal starting from several vertex ids in one traversal per owning replica, sends them
+    concurrently and returns the concatenated results. Use it for multi-id lookups and bulk mutations
+    processing each vertex independently, e.g. ``g.V(ids).valueMap()`` or ``g.V(ids).property('seen', True)``,
+    but not for aggregations like ``count()``.
+
+    :param traversal: A GraphTraversal bound to a token aware :class:`dse_graph.DSESessionRemoteGraphConnection`
+    """
+    connection = _remote_connection(traversal)
+    bytecode = _bytecode(traversal)
+    ids = start_vertex_ids(bytecode)
+    if len(ids) <= 1:
+        return list(connection._execute_async(bytecode).result())
+
+    futures = []
+    for host, group in connection.router.group_by_replica(ids).items():
+        split = Bytecode(bytecode)
+        split.step_instructions = [['V'] + group] + split.step_instructions[1:]
+        futures.append(connection._execute_async(split, host.address if host is not None else None))
+
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    return results
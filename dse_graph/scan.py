@@ -0,0 +1,188 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+import logging
+import time
+
+from six.moves import queue
+
+from gremlin_python.process.traversal import Bytecode, P
+
+from dse_graph import _remote_connection
+
+log = logging.getLogger(__name__)
+
+
+class PropertyRangePartitioner(object):
+    """
+    Splits a scan in disjoint partitions of the values of a property key. ``boundaries`` are the sorted
+    values separating the partitions, so ``n`` boundaries produce ``n + 1`` ranges:
+    ``< b0``, ``>= b0 and < b1``, ..., ``>= bn``, plus a last partition of the elements that do not have the
+    property, which no range filter matches.
+
+    The partition filter is added right after the starting step of the traversal. The key should be evenly
+    distributed and indexed for the scanned label.
+
+    :param key: The property key
+    :param boundaries: The sorted boundary values
+
+    .. code-block:: python
+
+        # 4 partitions of the 'user_id' key
+        PropertyRangePartitioner('user_id', [250000, 500000, 750000])
+
+    """
+
+    def __init__(self, key, boundaries):
+        if not boundaries:
+            raise ValueError('At least one boundary must be provided.')
+        self.key = key
+        self.boundaries = sorted(boundaries)
+
+    def predicates(self):
+        bounds = [None] + self.boundaries + [None]
+        for low, high in zip(bounds, bounds[1:]):
+            if low is None:
+                yield [P.lt(high)]
+            elif high is None:
+                yield [P.gte(low)]
+            else:
+                yield [P.gte(low), P.lt(high)]
+
+    def partitions(self, bytecode):
+        """
+        Returns the bytecode of each partition of the scan.
+        """
+        filters = [[['has', self.key, p] for p in predicates] for predicates in self.predicates()]
+        filters.append([['hasNot', self.key]])
+        partitions = []
+        for steps in filters:
+            partition = Bytecode(bytecode)
+            partition.step_instructions[1:1] = steps
+            partitions.append(partition)
+        return partitions
+
+
+class PartitionProgress(object):
+    """
+    The state of one partition of a :class:`PartitionedScan`.
+    """
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    index = None
+    state = PENDING
+    attempts = 0
+    result_count = 0
+    elapsed = None
+    error = None
+
+    def __init__(self, index):
+        self.index = index
+
+    def __repr__(self):
+        return "<PartitionProgress: index={0}, state='{1}', attempts={2}, result_count={3}>".format(
+            self.index, self.state, self.attempts, self.result_count)
+
+
+class PartitionedScan(object):
+    """
+    Executes a scan traversal as disjoint partitions running concurrently through the DSE session, and
+    iterates over the merged results as partitions complete. A partition is only emitted once all its results
+    are received, so that a retried partition never emits duplicates.
+
+    :param traversal: A GraphTraversal created with :meth:`dse_graph.DseGraph.traversal_source`
+    :param partitioner: Splits the traversal, e.g. a :class:`PropertyRangePartitioner`
+    :param concurrency: (Optional) Maximum number of partitions executed at the same time. Default is 4.
+    :param max_retries: (Optional) Number of times a failed partition is retried. Default is 2.
+    :param on_progress: (Optional) Called with a :class:`PartitionProgress` every time a partition changes state.
+
+    .. code-block:: python
+
+        g = DseGraph.traversal_source(session, 'my_graph')
+        scan = PartitionedScan(g.V().hasLabel('user').valueMap(),
+                               PropertyRangePartitioner('user_id', [250000, 500000, 750000]))
+        for user in scan:
+            process(user)
+
+    """
+
+    def __init__(self, traversal, partitioner, concurrency=4, max_retries=2, on_progress=None):
+        if concurrency <= 0:
+            raise ValueError('concurrency must be a positive integer.')
+        self.connection = _remote_connection(traversal)
+        self.partitions = partitioner.partitions(traversal.bytecode)
+        self.progress = [PartitionProgress(i) for i in range(len(self.partitions))]
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.on_progress = on_progress
+
+    def __iter__(self):
+        events = queue.Queue()
+        pending = list(reversed(range(len(self.partitions))))
+        running = 0
+
+        while pending or running:
+            while pending and running < self.concurrency:
+                self._start(pending.pop(), events)
+                running += 1
+
+            index, results, error = events.get()
+            progress = self.progress[index]
+            if error is None:
+                running -= 1
+                self._update(progress, PartitionProgress.DONE, result_count=len(results))
+                for result in results:
+                    yield result
+            elif progress.attempts <= self.max_retries:
+                log.warning("Partition %d of the scan failed (attempt %d), retrying.", index, progress.attempts,
+                            exc_info=error)
+                self._start(index, events)
+            else:
+                self._update(progress, PartitionProgress.FAILED, error=error)
+                raise error
+
+    def _start(self, index, events):
+        progress = self.progress[index]
+        progress.attempts += 1
+        self._update(progress, PartitionProgress.RUNNING)
+        start = time.time()
+        results = []
+
+        def on_page(rows, future):
+            results.extend(rows)
+            if future.has_more_pages:
+                future.start_fetching_next_page()
+            else:
+                progress.elapsed = time.time() - start
+                events.put((index, results, None))
+
+        def on_error(error):
+            progress.elapsed = time.time() - start
+            events.put((index, None, error))
+
+        try:
+            future = self.connection._execute_async(self.partitions[index])
+        except Exception as e:
+            on_error(e)
+        else:
+            future.add_callbacks(on_page, on_error, callback_args=(future,))
+
+    def _update(self, progress, state, **kwargs):
+        progress.state = state
+        for attr, value in kwargs.items():
+            setattr(progress, attr, value)
+        if self.on_progress:
+            try:
+                self.on_progress(progress)
+            except Exception:
+                log.exception("Error in scan progress callback:")
@@ -0,0 +1,335 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Client side scheduling of the traversal requests by priority class.
+"""
+
+import threading
+import time
+from collections import deque, OrderedDict
+
+from dse import OperationTimedOut, ReadTimeout, WriteTimeout
+from dse.cluster import NoHostAvailable
+from dse.protocol import OverloadedErrorMessage
+
+OVERLOAD_ERRORS = (OperationTimedOut, ReadTimeout, WriteTimeout, OverloadedErrorMessage)
+"""
+Errors a :class:`AdaptiveConcurrencyLimiter` backs off on.
+"""
+
+
+def is_overload_error(error):
+    """
+    Returns True if ``error`` is one of `OVERLOAD_ERRORS`, or a NoHostAvailable caused by one of them.
+    """
+    if isinstance(error, NoHostAvailable):
+        return any(is_overload_error(e) for e in (error.errors or {}).values())
+    return isinstance(error, OVERLOAD_ERRORS)
+
+
+class PriorityClass(object):
+    """
+    A priority class of a :class:`TraversalScheduler`, and its statistics.
+
+    :param name: Name of the class
+    :param weight: (Optional) Share of the request slots of the class, relative to the other classes with
+        queued requests. Default is 1.
+    :param max_in_flight: (Optional) Maximum number of requests of the class in flight. Default is no limit.
+    """
+
+    name = None
+    weight = 1
+    max_in_flight = None
+
+    in_flight = 0
+    requests = 0
+    total_queue_wait = 0
+    max_queue_wait = 0
+    total_server_time = 0
+    max_server_time = 0
+
+    def __init__(self, name, weight=1, max_in_flight=None):
+        if weight <= 0:
+            raise ValueError('The weight of a priority class must be positive.')
+        self.name = name
+        self.weight = weight
+        self.max_in_flight = max_in_flight
+        self._queue = deque()
+        self._virtual_time = 0
+
+    @property
+    def queued(self):
+        """
+        Number of requests waiting for a slot.
+        """
+        return len(self._queue)
+
+    @property
+    def mean_queue_wait(self):
+        return self.total_queue_wait / float(self.requests) if self.requests else 0
+
+    @property
+    def mean_server_time(self):
+        return self.total_server_time / float(self.requests) if self.requests else 0
+
+    def _can_send(self):
+        return self._queue and (self.max_in_flight is None or self.in_flight < self.max_in_flight)
+
+    def __repr__(self):
+        return "<PriorityClass: name='{0}', weight={1}, in_flight={2}, queued={3}>".format(
+            self.name, self.weight, self.in_flight, self.queued)
+
+
+class TraversalScheduler(object):
+    """
+    Schedules the requests of the :class:`dse_graph.DSESessionRemoteGraphConnection` sharing it. Each
+    connection sends its requests in a priority class. When ``max_in_flight`` requests are in flight, or when the
+    limit of their class is reached, the requests wait for a slot in a queue per class. Free slots are shared by
+    the classes with queued requests in proportion of their weights (weighted fair queueing), so a burst of
+    batch requests cannot starve the interactive ones, nor the other way around.
+
+    The time a request waited for a slot and the time from sending it to its response are recorded per class.
+
+    :param max_in_flight: (Optional) Maximum number of requests in flight across the classes. Default is 64.
+    :param classes: (Optional) The :class:`PriorityClass` of the scheduler. Default is an 'interactive' class of
+        weight 8 and a 'batch' class of weight 1.
+
+    .. code-block:: python
+
+        scheduler = TraversalScheduler(max_in_flight=32, classes=[PriorityClass('interactive', weight=8),
+                                                                  PriorityClass('batch', max_in_flight=16)])
+        g = DseGraph.traversal_source(session, 'my_graph', scheduler=scheduler, priority='interactive')
+        g_batch = DseGraph.traversal_source(session, 'my_graph', scheduler=scheduler, priority='batch')
+
+    Requests sent with a connection block while they wait for a slot. The traversal sources of
+    :mod:`dse_graph.aio` are not scheduled.
+    """
+
+    max_in_flight = 64
+    default_class = None
+
+    def __init__(self, max_in_flight=64, classes=None):
+        self.max_in_flight = max_in_flight
+        if classes is None:
+            classes = [PriorityClass('interactive', weight=8), PriorityClass('batch')]
+        if not classes:
+            raise ValueError('A scheduler requires at least one priority class.')
+        self._classes = OrderedDict((c.name, c) for c in classes)
+        self.default_class = classes[0].name
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._virtual_time = 0
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def priority_class(self, name=None):
+        """
+        Returns a :class:`PriorityClass` by name. Default is the first class.
+        """
+        try:
+            return self._classes[name if name is not None else self.default_class]
+        except KeyError:
+            raise ValueError("Unknown priority class '{0}'".format(name))
+
+    def classes(self):
+        """
+        Returns the :class:`PriorityClass` of the scheduler.
+        """
+        return list(self._classes.values())
+
+    def acquire(self, name=None):
+        """
+        Waits for a request slot of a priority class. Returns the time waited, in seconds. The slot must be
+        released with :meth:`release`.
+        """
+        priority_class = self.priority_class(name)
+        start = time.time()
+        waiter = threading.Event()
+        with self._lock:
+            if not priority_class._queue:
+                # a class that was idle does not accumulate credit
+                priority_class._virtual_time = max(priority_class._virtual_time, self._virtual_time)
+            priority_class._queue.append(waiter)
+            self._dispatch()
+        waiter.wait()
+        wait = time.time() - start
+        with self._lock:
+            priority_class.total_queue_wait += wait
+            priority_class.max_queue_wait = max(priority_class.max_queue_wait, wait)
+        return wait
+
+    def release(self, name=None, server_time=None, error=None):
+        """
+        Releases a request slot of a priority class.
+
+        :param name: (Optional) Name of the priority class
+        :param server_time: (Optional) Time from sending the request to its response, in seconds.
+        :param error: (Optional) The exception the request failed with.
+        """
+        priority_class = self.priority_class(name)
+        with self._lock:
+            priority_class.in_flight -= 1
+            self._in_flight -= 1
+            priority_class.requests += 1
+            if server_time is not None:
+                priority_class.total_server_time += server_time
+                priority_class.max_server_time = max(priority_class.max_server_time, server_time)
+            self._dispatch()
+
+    def _dispatch(self):
+        while self.max_in_flight is None or self._in_flight < self.max_in_flight:
+            candidates = [c for c in self._classes.values() if c._can_send()]
+            if not candidates:
+                return
+            priority_class = min(candidates, key=lambda c: c._virtual_time)
+            self._virtual_time = priority_class._virtual_time
+            priority_class._virtual_time += 1.0 / priority_class.weight
+            priority_class.in_flight += 1
+            self._in_flight += 1
+            priority_class._queue.popleft().set()
+
+    def report(self):
+        """
+        Returns a human readable report of the statistics of the priority classes.
+        """
+        lines = ['{0:<15} {1:>6} {2:>9} {3:>6} {4:>9} {5:>14} {6:>13} {7:>15}'.format(
+            'class', 'weight', 'in_flight', 'queued', 'requests', 'mean_wait_ms', 'max_wait_ms', 'mean_server_ms')]
+        for c in self.classes():
+            lines.append('{0:<15} {1:>6} {2:>9} {3:>6} {4:>9} {5:>14.2f} {6:>13.2f} {7:>15.2f}'.format(
+                c.name, c.weight, c.in_flight, c.queued, c.requests, c.mean_queue_wait * 1000,
+                c.max_queue_wait * 1000, c.mean_server_time * 1000))
+        return '\n'.join(lines) + '\n'
+
+
+class AdaptiveConcurrencyLimiter(TraversalScheduler):
+    """
+    A :class:`TraversalScheduler` adapting its ``max_in_flight`` limit to the load the cluster sustains,
+    with additive increase and multiplicative decrease (AIMD). The limit grows by one every time ``limit``
+    requests completed with a mean latency within ``latency_tolerance`` times the lowest mean latency observed.
+    It is multiplied by ``backoff`` when a request fails with one of `OVERLOAD_ERRORS`; the requests sent
+    before a back off do not trigger another one.
+
+    :param initial_limit: (Optional) Initial number of requests in flight. Default is 8.
+    :param min_limit: (Optional) Minimum limit. Default is 1.
+    :param max_limit: (Optional) Maximum limit. Default is 512.
+    :param backoff: (Optional) Factor applied to the limit on overload. Default is 0.5.
+    :param latency_tolerance: (Optional) Ratio to the lowest mean latency above which the limit stops
+        growing. Default is 2.
+    :param classes: (Optional) The :class:`PriorityClass` of the limiter, like :class:`TraversalScheduler`.
+    :param throughput_window: (Optional) Period, in seconds, the throughput is measured over. Default is 10.
+
+    .. code-block:: python
+
+        limiter = AdaptiveConcurrencyLimiter()
+        g = DseGraph.traversal_source(session, 'my_graph', scheduler=limiter)
+        buffer = MutationBuffer(g)
+        ...
+        print(limiter.limit, limiter.throughput)
+
+    """
+
+    min_limit = 1
+    max_limit = 512
+    backoff = 0.5
+    latency_tolerance = 2.0
+    throughput_window = 10
+
+    backoffs = 0
+    """
+    Number of times the limit was decreased.
+    """
+
+    # growth of the latency baseline per window, so that the limit grows again after a lasting change
+    _baseline_drift = 0.05
+
+    def __init__(self, initial_limit=8, min_limit=1, max_limit=512, backoff=0.5, latency_tolerance=2.0,
+                 classes=None, throughput_window=10):
+        super(AdaptiveConcurrencyLimiter, self).__init__(initial_limit, classes)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.throughput_window = throughput_window
+        self._adapt_lock = threading.Lock()
+        self._completions = deque()
+        self._window_requests = 0
+        self._window_latency = 0
+        self._baseline = None
+        self._last_backoff = 0
+        self._started = time.time()
+
+    @property
+    def limit(self):
+        """
+        The current number of requests allowed in flight.
+        """
+        return self.max_in_flight
+
+    @property
+    def throughput(self):
+        """
+        Number of requests completed per second, over the last ``throughput_window`` seconds.
+        """
+        now = time.time()
+        with self._adapt_lock:
+            self._expire_completions(now)
+            period = min(self.throughput_window, now - self._started)
+            return len(self._completions) / period if period > 0 else 0
+
+    def _expire_completions(self, now):
+        while self._completions and self._completions[0] < now - self.throughput_window:
+            self._completions.popleft()
+
+    def release(self, name=None, server_time=None, error=None):
+        self._adapt(server_time, error)
+        super(AdaptiveConcurrencyLimiter, self).release(name, server_time, error)
+
+    def _set_limit(self, limit):
+        with self._lock:
+            self.max_in_flight = limit
+            self._dispatch()
+
+    def _adapt(self, server_time, error):
+        now = time.time()
+        sent = now - server_time if server_time is not None else now
+        limit = None
+        with self._adapt_lock:
+            self._completions.append(now)
+            self._expire_completions(now)
+
+            if error is not None:
+                if is_overload_error(error) and sent >= self._last_backoff:
+                    self._last_backoff = now
+                    self.backoffs += 1
+                    self._window_requests = 0
+                    self._window_latency = 0
+                    limit = max(self.min_limit, int(self.max_in_flight * self.backoff))
+            elif server_time is not None:
+                self._window_requests += 1
+                self._window_latency += server_time
+                if self._window_requests >= self.max_in_flight:
+                    mean = self._window_latency / self._window_requests
+                    self._window_requests = 0
+                    self._window_latency = 0
+                    if self._baseline is None:
+                        self._baseline = mean
+                    else:
+                        self._baseline = min(mean, self._baseline * (1 + self._baseline_drift))
+                    if mean <= self._baseline * self.latency_tolerance and self.max_in_flight < self.max_limit:
+                        limit = self.max_in_flight + 1
+
+        if limit is not None:
+            self._set_limit(limit)
+
+    def report(self):
+        return 'limit: {0}, throughput: {1:.1f}/s, backoffs: {2}\n'.format(
+            self.limit, self.throughput, self.backoffs) + super(AdaptiveConcurrencyLimiter, self).report()
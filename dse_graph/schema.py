@@ -0,0 +1,522 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+import logging
+import re
+import threading
+import time
+
+import six
+
+from gremlin_python.structure.io.graphson import GraphSONReader, GraphSONUtil
+
+from dse.cluster import EXEC_PROFILE_GRAPH_DEFAULT
+from dse.graph import (
+    graph_result_row_factory,
+    Vertex as DseVertex,
+    VertexProperty as DseVertexProperty,
+    Edge as DseEdge
+)
+
+from dse_graph.serializers import dse_deserializers
+
+log = logging.getLogger(__name__)
+
+TYPE_KEY = GraphSONUtil.TYPE_KEY
+VALUE_KEY = GraphSONUtil.VALUE_KEY
+
+"""
+Mapping of DSE Graph property key types to the GraphSON 2.0 type tag they are
+returned with. Types returned as plain JSON values map to the python types that
+are accepted without decoding.
+"""
+SCHEMA_TYPES = {
+    'Text': six.string_types,
+    'Boolean': bool,
+    'Int': 'g:Int32',
+    'Bigint': 'g:Int64',
+    'Smallint': 'gx:Int16',
+    'Varint': 'gx:BigInteger',
+    'Double': 'g:Double',
+    'Float': 'g:Float',
+    'Decimal': 'gx:BigDecimal',
+    'Uuid': 'g:UUID',
+    'Timestamp': 'gx:Instant',
+    'Date': 'gx:LocalDate',
+    'Time': 'gx:LocalTime',
+    'Duration': 'gx:Duration',
+    'Inet': 'gx:InetAddress',
+    'Blob': 'dse:Blob',
+    'Point': 'dse:Point',
+    'Linestring': 'dse:LineString',
+    'Polygon': 'dse:Polygon'
+}
+
+# includes the gremlin_python defaults, like g:Int32 and g:Double
+_deserializers = GraphSONReader(deserializer_map=dse_deserializers).deserializers
+
+_STATEMENT_RE = re.compile(r'''schema\.(propertyKey|vertexLabel|edgeLabel)\(["']([^"']+)["']\)(.*)''')
+_CALL_RE = re.compile(r'''\.(\w+)\(([^)]*)\)''')
+_ARG_RE = re.compile(r'''["']([^"']*)["']''')
+
+INDEX_TYPES = ('materialized', 'secondary', 'search')
+"""
+Types of the indexes looking up the elements of a label by property value.
+"""
+
+
+class PropertyKey(object):
+    """
+    A property key of the graph schema.
+    """
+
+    name = None
+    data_type = None
+    cardinality = 'single'
+
+    def __init__(self, name, data_type, cardinality='single'):
+        self.name = name
+        self.data_type = data_type
+        self.cardinality = cardinality
+
+    def __repr__(self):
+        return "<PropertyKey: name='{0}', data_type='{1}', cardinality='{2}'>".format(
+            self.name, self.data_type, self.cardinality)
+
+
+class Index(object):
+    """
+    An index of a label: its type, one of `INDEX_TYPES`, and the property keys it covers. Vertex-centric and
+    property indexes are recorded with the type 'edge' and 'property'.
+    """
+
+    name = None
+    index_type = None
+    properties = None
+
+    def __init__(self, name, index_type, properties=None):
+        self.name = name
+        self.index_type = index_type
+        self.properties = list(properties or [])
+
+    def __repr__(self):
+        return "<Index: name='{0}', index_type='{1}', properties={2}>".format(
+            self.name, self.index_type, self.properties)
+
+
+class ElementLabel(object):
+    """
+    A vertex or edge label of the graph schema, with the property keys it allows, its indexes and the
+    property keys of its partition key, if it has a custom id.
+    """
+
+    name = None
+    properties = None
+    indexes = None
+    partition_keys = None
+
+    def __init__(self, name, properties=None, indexes=None, partition_keys=None):
+        self.name = name
+        self.properties = list(properties or [])
+        self.indexes = dict(indexes or {})
+        self.partition_keys = list(partition_keys or [])
+
+    def index_types(self, key):
+        """
+        Returns the set of `INDEX_TYPES` of the indexes covering a property key, including 'partition_key' if
+        the key is part of the partition key of the label.
+        """
+        types = set(index.index_type for index in self.indexes.values()
+                    if index.index_type in INDEX_TYPES and key in index.properties)
+        if key in self.partition_keys:
+            types.add('partition_key')
+        return types
+
+    def __repr__(self):
+        return "<{0}: name='{1}', properties={2}>".format(type(self).__name__, self.name, self.properties)
+
+
+class VertexLabel(ElementLabel):
+    pass
+
+
+class EdgeLabel(ElementLabel):
+
+    connections = None
+
+    def __init__(self, name, properties=None, connections=None):
+        super(EdgeLabel, self).__init__(name, properties)
+        self.connections = list(connections or [])
+
+
+class GraphSchema(object):
+    """
+    A snapshot of a graph schema: property keys, vertex labels and edge labels.
+    """
+
+    property_keys = None
+    vertex_labels = None
+    edge_labels = None
+
+    def __init__(self, property_keys=None, vertex_labels=None, edge_labels=None):
+        self.property_keys = property_keys or {}
+        self.vertex_labels = vertex_labels or {}
+        self.edge_labels = edge_labels or {}
+
+    @classmethod
+    def parse(cls, description):
+        """
+        Builds a GraphSchema from the output of ``schema.describe()``.
+
+        :param description: The schema description string
+        """
+        schema = cls()
+        for line in description.splitlines():
+            match = _STATEMENT_RE.match(line.strip())
+            if not match:
+                continue
+            kind, name, calls = match.groups()
+            calls = [(method, _ARG_RE.findall(args)) for method, args in _CALL_RE.findall(calls)]
+            if kind == 'propertyKey':
+                schema._parse_property_key(name, calls)
+            elif kind == 'vertexLabel':
+                schema._parse_label(schema.vertex_labels, VertexLabel, name, calls)
+            else:
+                schema._parse_label(schema.edge_labels, EdgeLabel, name, calls)
+        return schema
+
+    def _parse_property_key(self, name, calls):
+        if not calls:
+            return
+        data_type = calls[0][0]
+        cardinality = 'multiple' if any(method == 'multiple' for method, _ in calls) else 'single'
+        self.property_keys[name] = PropertyKey(name, data_type, cardinality)
+
+    def _parse_label(self, labels, label_class, name, calls):
+        label = labels.get(name)
+        if label is None:
+            label = labels[name] = label_class(name)
+        if calls and calls[0][0] == 'index':
+            self._parse_index(label, calls)
+            return
+        for method, args in calls:
+            if method == 'properties':
+                label.properties.extend(p for p in args if p not in label.properties)
+            elif method == 'partitionKey':
+                label.partition_keys.extend(args)
+            elif method == 'connection' and len(args) == 2:
+                label.connections.append(tuple(args))
+
+    def _parse_index(self, label, calls):
+        if not calls[0][1] or len(calls) < 2:
+            return
+        method = calls[1][0]
+        if method in INDEX_TYPES:
+            index_type = method
+        elif method in ('outE', 'inE', 'bothE'):
+            index_type = 'edge'
+        elif method == 'property':
+            index_type = 'property'
+        else:
+            return
+        name = calls[0][1][0]
+        properties = [args[0] for method, args in calls[2:] if method == 'by' and args]
+        label.indexes[name] = Index(name, index_type, properties)
+
+    def __repr__(self):
+        return "<GraphSchema: property_keys={0}, vertex_labels={1}, edge_labels={2}>".format(
+            len(self.property_keys), len(self.vertex_labels), len(self.edge_labels))
+
+
+class SchemaCache(object):
+    """
+    Loads the schema of a graph once and keeps it cached. The snapshot is reloaded in the
+    background when it is older than ``refresh_interval`` seconds; the previous snapshot is
+    used until the new one is loaded.
+
+    :param session: A DSE session
+    :param graph_name: The DSE Graph name.
+    :param refresh_interval: (Optional) Maximum age of the snapshot, in seconds. Default is 300.
+    :param execution_profile: (Optional) Execution profile used to load the schema. Default is set to `EXEC_PROFILE_GRAPH_DEFAULT`.
+    """
+
+    session = None
+    graph_name = None
+    refresh_interval = 300
+    execution_profile = None
+
+    def __init__(self, session, graph_name, refresh_interval=300, execution_profile=EXEC_PROFILE_GRAPH_DEFAULT):
+        self.session = session
+        self.graph_name = graph_name
+        self.refresh_interval = refresh_interval
+        self.execution_profile = execution_profile
+        self._lock = threading.Lock()
+        self._schema = None
+        self._decoders = None
+        self._expires_at = 0
+        self._loading = False
+
+    def get(self):
+        """
+        Returns the cached GraphSchema. The first call blocks until the schema is loaded; once
+        the snapshot is stale, a reload is started in the background and the stale snapshot is
+        returned.
+        """
+        schema = self._schema
+        if schema is None:
+            with self._lock:
+                if self._schema is None:
+                    self._load()
+            return self._schema
+        self._refresh_if_stale()
+        return schema
+
+    def refresh(self):
+        """
+        Forces a reload of the schema snapshot, blocking until it is loaded.
+        """
+        with self._lock:
+            self._load()
+        return self._schema
+
+    def decoders(self):
+        """
+        Returns the per-label decoders compiled from the current schema snapshot, keyed
+        by element type ('vertex' or 'edge') and label, or None if no snapshot is loaded yet.
+        This never blocks, so that it can be called from the driver event loop: a missing or
+        stale snapshot is loaded in the background.
+        """
+        self._refresh_if_stale()
+        schema = self._schema
+        if schema is None:
+            return None
+        decoders = self._decoders
+        if decoders is None or decoders[0] is not schema:
+            decoders = self._decoders = (schema, _compile_decoders(schema))
+        return decoders[1]
+
+    def _refresh_if_stale(self):
+        if self._loading or time.time() < self._expires_at:
+            return
+        with self._lock:
+            if self._loading or time.time() < self._expires_at:
+                return
+            self._loading = True
+        try:
+            future = self.session.execute_graph_async('schema.describe()', execution_profile=self._profile())
+        except Exception as exc:
+            self._on_error(exc)
+        else:
+            future.add_callbacks(self._on_loaded, self._on_error)
+
+    def _on_loaded(self, result):
+        try:
+            self._schema = GraphSchema.parse(result[0].value)
+        except Exception:
+            log.warning("Error parsing the schema of graph '%s', keeping the previous snapshot.",
+                        self.graph_name, exc_info=True)
+        self._done_loading()
+
+    def _on_error(self, exc):
+        log.warning("Error refreshing the schema of graph '%s', keeping the previous snapshot: %r",
+                    self.graph_name, exc)
+        self._done_loading()
+
+    def _done_loading(self):
+        with self._lock:
+            self._expires_at = time.time() + self.refresh_interval
+            self._loading = False
+
+    def _profile(self):
+        ep = self.session.execution_profile_clone_update(self.execution_profile, row_factory=graph_result_row_factory)
+        graph_options = ep.graph_options.copy()
+        graph_options.graph_language = 'gremlin-groovy'
+        graph_options.graph_name = self.graph_name
+        ep.graph_options = graph_options
+        return ep
+
+    def _load(self):
+        try:
+            description = self.session.execute_graph('schema.describe()', execution_profile=self._profile())[0].value
+        except Exception:
+            if self._schema is None:
+                raise
+            log.warning("Error refreshing the schema of graph '%s', keeping the previous snapshot.",
+                        self.graph_name, exc_info=True)
+        else:
+            self._schema = GraphSchema.parse(description)
+        self._expires_at = time.time() + self.refresh_interval
+
+    def __str__(self):
+        return "<SchemaCache: graph_name='{0}'>".format(self.graph_name)
+    __repr__ = __str__
+
+
+def _value_decoder(data_type):
+    """
+    Returns a function decoding a GraphSON value of the provided schema type. Values that
+    do not match the expected type fall back to the generic reader.
+    """
+    expected = SCHEMA_TYPES.get(data_type)
+    if expected is None:
+        return lambda value, reader: reader.toObject(value)
+
+    if not isinstance(expected, six.string_types):
+        def decode_plain(value, reader):
+            if isinstance(value, expected):
+                return value
+            return reader.toObject(value)
+        return decode_plain
+
+    deserializer = _deserializers.get(expected)
+    if deserializer is None:
+        return lambda value, reader: reader.toObject(value)
+
+    objectify = deserializer.objectify
+
+    def decode_typed(value, reader):
+        try:
+            if value[TYPE_KEY] == expected:
+                return objectify(value[VALUE_KEY], reader)
+        except (KeyError, TypeError):
+            pass
+        return reader.toObject(value)
+    return decode_typed
+
+
+class _LabelDecoder(object):
+    """
+    Decodes the properties of the elements of a single label, with the value decoders
+    resolved from the schema.
+    """
+
+    def __init__(self, value_decoders):
+        self.value_decoders = value_decoders
+
+    def decode_vertex_properties(self, properties, reader):
+        out = {}
+        decoders = self.value_decoders
+        for key, vertex_properties in six.iteritems(properties):
+            decode = decoders.get(key)
+            if decode is None or not isinstance(vertex_properties, list):
+                out[key] = reader.toObject(vertex_properties)
+                continue
+            values = []
+            for vp in vertex_properties:
+                try:
+                    if vp[TYPE_KEY] != 'g:VertexProperty':
+                        raise KeyError(TYPE_KEY)
+                    vp = vp[VALUE_KEY]
+                    meta = vp.get('properties')
+                    values.append(DseVertexProperty(vp['label'], decode(vp['value'], reader),
+                                                    reader.toObject(meta) if meta else {}))
+                except (KeyError, TypeError):
+                    values.append(reader.toObject(vp))
+            out[key] = values
+        return out
+
+    def decode_edge_properties(self, properties, reader):
+        out = {}
+        decoders = self.value_decoders
+        for key, prop in six.iteritems(properties):
+            decode = decoders.get(key)
+            try:
+                if decode is None or prop[TYPE_KEY] != 'g:Property':
+                    raise KeyError(TYPE_KEY)
+                prop = prop[VALUE_KEY]
+                # same shape as DsePropertyDeserializer
+                out[key] = {prop['key'], decode(prop['value'], reader)}
+            except (KeyError, TypeError):
+                out[key] = reader.toObject(prop)
+        return out
+
+
+def _compile_decoders(schema):
+    value_decoders = dict((name, _value_decoder(pk.data_type)) for name, pk in six.iteritems(schema.property_keys))
+    decoders = {}
+    for kind, labels in (('vertex', schema.vertex_labels), ('edge', schema.edge_labels)):
+        decoders[kind] = dict(
+            (name, _LabelDecoder(dict((p, value_decoders[p]) for p in label.properties if p in value_decoders)))
+            for name, label in six.iteritems(labels))
+    return decoders
+
+
+class SchemaVertexDeserializer(object):
+
+    def __init__(self, decoders):
+        self.decoders = decoders
+
+    def objectify(self, v, reader):
+        label = v["label"] if "label" in v else "vertex"
+        dse_vertex = DseVertex(reader.toObject(v["id"]), label, 'vertex', {})
+        decoder = self.decoders.get(label)
+        properties = v.get('properties', {})
+        if decoder is None:
+            dse_vertex.properties = reader.toObject(properties)
+        else:
+            dse_vertex.properties = decoder.decode_vertex_properties(properties, reader)
+        return dse_vertex
+
+
+class SchemaEdgeDeserializer(object):
+
+    def __init__(self, decoders):
+        self.decoders = decoders
+
+    def objectify(self, v, reader):
+        label = v["label"] if "label" in v else "vertex"
+        decoder = self.decoders.get(label)
+        properties = v.get("properties", {})
+        if decoder is None:
+            properties = reader.toObject(properties)
+        else:
+            properties = decoder.decode_edge_properties(properties, reader)
+        return DseEdge(
+            reader.toObject(v["id"]), label, 'edge', properties,
+            DseVertex(reader.toObject(v["inV"]), v['inVLabel'], 'vertex', {}), v['inVLabel'],
+            DseVertex(reader.toObject(v["outV"]), v['outVLabel'], 'vertex', {}), v['outVLabel']
+        )
+
+
+def schema_aware_row_factory(schema_cache):
+    """
+    Returns a Row Factory that decodes the graphson as DSE types, using decoders compiled from
+    the cached graph schema for the properties of vertices and edges. The results are decoded
+    generically until the schema snapshot is loaded.
+
+    :param schema_cache: A :class:`SchemaCache` for the graph being queried.
+
+    .. code-block:: python
+
+        schema_cache = SchemaCache(session, 'my_graph', refresh_interval=60)
+        ep = DseGraph.create_execution_profile('my_graph', row_factory=schema_aware_row_factory(schema_cache))
+
+    """
+    # the reader of the last compiled decoders, which are looked up once per result page
+    current = [(None, GraphSONReader(deserializer_map=dse_deserializers))]
+
+    def row_factory(column_names, rows):
+        decoders = schema_cache.decoders()
+        compiled, reader = current[0]
+        if decoders is not compiled:
+            reader = _schema_reader(decoders)
+            current[0] = (decoders, reader)
+        return [reader.readObject(row[0])['result'] for row in rows]
+
+    return row_factory
+
+
+def _schema_reader(decoders):
+    deserializer_map = dse_deserializers.copy()
+    if decoders is not None:
+        deserializer_map.update({
+            'g:Vertex': SchemaVertexDeserializer(decoders['vertex']),
+            'g:Edge': SchemaEdgeDeserializer(decoders['edge'])
+        })
+    return GraphSONReader(deserializer_map=deserializer_map)
@@ -8,6 +8,7 @@
 # http://www.datastax.com/terms/datastax-dse-driver-license-terms
 
 import base64
+import json
 import uuid
 import datetime
 
@@ -16,6 +17,11 @@ from isodate import duration_isoformat, parse_duration
 
 import six
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from gremlin_python.structure.io.graphson import GraphSONUtil
 
 from gremlin_python.statics import IntType, LongType, long
@@ -56,6 +62,9 @@ polygon      | dse:Polygon    | Polygon
 point        | dse:Point      | Point
 linestring   | dse:LineString | LineString
 blob         | dse:Blob       | bytearray, buffer (PY2), memoryview (PY3), bytes (PY3)
+
+With NumPy installed, numpy integers are written as g:Int32, or g:Int64 when they do not fit in 32 bits,
+numpy.float16 and numpy.float32 as g:Float, numpy.float64 as g:Double and numpy arrays as lists of these.
 """
 
 
@@ -73,6 +82,76 @@ class IntegerSerializer(object):
             return GraphSONUtil.typedValue('Int32', n)
 
 
+_INT32_MIN, _INT32_MAX = -2**31, 2**31 - 1
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
+_INT32 = GraphSONUtil.formatType('g', 'Int32')
+_INT64 = GraphSONUtil.formatType('g', 'Int64')
+_FLOAT = GraphSONUtil.formatType('g', 'Float')
+_DOUBLE = GraphSONUtil.formatType('g', 'Double')
+
+
+def _typed_values(graphson_type, values):
+    return [{GraphSONUtil.TYPE_KEY: graphson_type, GraphSONUtil.VALUE_KEY: v} for v in values]
+
+
+class NumPyScalarSerializer(object):
+    """
+    Writes a numpy scalar according to its dtype.
+    """
+
+    @classmethod
+    def dictify(cls, n, writer):
+        kind = n.dtype.kind
+        if kind == 'b':
+            return bool(n)
+        elif kind == 'f':
+            return GraphSONUtil.typedValue('Float' if n.dtype.itemsize <= 4 else 'Double', float(n))
+        elif kind in 'iu':
+            n = int(n)
+            if not _INT64_MIN <= n <= _INT64_MAX:
+                raise ValueError('{0} does not fit in a g:Int64'.format(n))
+            return GraphSONUtil.typedValue('Int32' if _INT32_MIN <= n <= _INT32_MAX else 'Int64', n)
+        return writer.toDict(n.item())
+
+
+class NumPyArraySerializer(object):
+    """
+    Writes a numpy array as a list, nested for multi-dimensional arrays. The GraphSON type of the items
+    is chosen from the dtype, and the range of the 64 bits integers is checked on the whole array.
+    """
+
+    @classmethod
+    def dictify(cls, a, writer):
+        if a.ndim == 0:
+            return writer.toDict(a[()])
+        elif a.ndim > 1:
+            return [cls.dictify(sub, writer) for sub in a]
+
+        kind = a.dtype.kind
+        if kind == 'b':
+            return a.tolist()
+        elif kind == 'f':
+            return _typed_values(_FLOAT if a.dtype.itemsize <= 4 else _DOUBLE, a.tolist())
+        elif kind in 'iu':
+            return cls._integers(a)
+        return [writer.toDict(v) for v in a.tolist()]
+
+    @classmethod
+    def _integers(cls, a):
+        if a.dtype.itemsize < 4 or a.dtype == numpy.int32 or not len(a):
+            return _typed_values(_INT32, a.tolist())
+
+        if a.dtype == numpy.uint64 and a.max() > _INT64_MAX:
+            raise ValueError('{0} does not fit in a g:Int64'.format(a.max()))
+        fits = (a >= _INT32_MIN) & (a <= _INT32_MAX)
+        if fits.all():
+            return _typed_values(_INT32, a.tolist())
+        elif not fits.any():
+            return _typed_values(_INT64, a.tolist())
+        return [{GraphSONUtil.TYPE_KEY: _INT32 if f else _INT64, GraphSONUtil.VALUE_KEY: v}
+                for f, v in zip(fits.tolist(), a.tolist())]
+
+
 class Int16Deserializer(object):
     @classmethod
     def objectify(cls, v, _):
@@ -309,6 +388,43 @@ class DsePathDeserializer(object):
         return p
 
 
+class CompactDsePathDeserializer(object):
+    """
+    Path deserializer sharing the decoded objects and the label sets of all the paths it decodes.
+    Each distinct object is decoded once, and labels are frozensets.
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.labels = {}
+
+    def _label_set(self, labels):
+        key = frozenset(labels)
+        return self.labels.setdefault(key, key)
+
+    def _object(self, data, reader):
+        if isinstance(data, dict):
+            value = data.get('@value')
+            if data.get('@type') in ('g:Vertex', 'g:Edge') and isinstance(value, dict) and 'id' in value:
+                key = (data['@type'], json.dumps(value['id'], sort_keys=True))
+            else:
+                key = json.dumps(data, sort_keys=True)
+        elif isinstance(data, list):
+            key = json.dumps(data, sort_keys=True)
+        else:
+            key = (type(data), data)
+
+        obj = self.objects.get(key)
+        if obj is None:
+            obj = self.objects[key] = reader.toObject(data)
+        return obj
+
+    def objectify(self, v, reader):
+        p = DsePath([self._label_set(label) for label in v["labels"]], [])
+        p.objects = [self._object(o, reader) for o in v["objects"]]
+        return p
+
+
 serializers = {
     LongType: IntegerSerializer,
     IntType: IntegerSerializer,
@@ -337,6 +453,12 @@ else:
         bytes: BlobIO,
     })
 
+if numpy is not None:
+    serializers.update(dict((t, NumPyScalarSerializer) for t in (
+        numpy.bool_, numpy.int8, numpy.int16, numpy.int32, numpy.int64, numpy.uint8, numpy.uint16, numpy.uint32,
+        numpy.uint64, numpy.float16, numpy.float32, numpy.float64, numpy.longdouble)))
+    serializers[numpy.ndarray] = NumPyArraySerializer
+
 deserializers = {
     "gx:Int16": Int16Deserializer,
     "g:Int64": Int64Deserializer,
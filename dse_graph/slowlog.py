@@ -0,0 +1,245 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Latency histograms of the traversals per shape, and sampling of the slow traversals.
+"""
+
+import bisect
+import io
+import random
+import threading
+import time
+from collections import deque, namedtuple
+
+import six
+
+from dse_graph.bytecode import traversal_shape
+from dse_graph.graphson import StreamingGraphSONWriter
+from dse_graph.serializers import serializers
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""
+Default upper bounds, in seconds, of the histogram buckets.
+"""
+
+_graphson_writer = StreamingGraphSONWriter(serializer_map=serializers)
+
+SlowTraversal = namedtuple('SlowTraversal', ['timestamp', 'shape', 'duration', 'graphson', 'error'])
+"""
+A sampled slow traversal: the time it was sent, its shape, its duration in seconds, its GraphSON and the error
+it failed with, if any.
+"""
+
+
+class LatencyHistogram(object):
+    """
+    Latency histogram of one traversal shape.
+    """
+
+    shape = None
+    count = 0
+    errors = 0
+    total_duration = 0
+    max_duration = 0
+    buckets = None
+    bucket_counts = None
+
+    def __init__(self, shape, buckets=DEFAULT_BUCKETS):
+        self.shape = shape
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+
+    def add(self, duration, error=False):
+        self.count += 1
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+        self.bucket_counts[bisect.bisect_left(self.buckets, duration)] += 1
+        if error:
+            self.errors += 1
+
+    @property
+    def mean_duration(self):
+        return self.total_duration / float(self.count) if self.count else 0
+
+    def percentile(self, percentile):
+        """
+        Returns the upper bound of the bucket holding the ``percentile``, e.g. 99, of the durations. The
+        maximum duration is returned for the last bucket.
+        """
+        rank = percentile / 100.0 * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.bucket_counts):
+            cumulative += count
+            if count and cumulative >= rank:
+                return min(bound, self.max_duration)
+        return self.max_duration
+
+    def __repr__(self):
+        return "<LatencyHistogram: shape='{0}', count={1}, mean_duration={2:.4f}>".format(
+            self.shape, self.count, self.mean_duration)
+
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_bound(bound):
+    return repr(float(bound))
+
+
+class SlowTraversalLog(object):
+    """
+    Records the latency of the traversals sent by a :class:`dse_graph.DSESessionRemoteGraphConnection`, in a
+    histogram per :func:`dse_graph.bytecode.traversal_shape`, with the arguments of vararg steps like ``V(*ids)``
+    collapsed so that the number of histograms stays bounded. The GraphSON of the traversals slower than
+    ``threshold`` is sampled in a ring buffer of the ``sample_size`` most recent ones.
+
+    :param threshold: (Optional) Duration, in seconds, above which a traversal is sampled. Default is 1 second.
+    :param sample_size: (Optional) Number of slow traversals kept. Default is 100.
+    :param sample_rate: (Optional) Fraction of the slow traversals sampled. Default is 1.0.
+    :param buckets: (Optional) Upper bounds, in seconds, of the histogram buckets. Default is `DEFAULT_BUCKETS`.
+
+    .. code-block:: python
+
+        slow_log = SlowTraversalLog(threshold=0.5)
+        g = DseGraph.traversal_source(session, 'my_graph', slow_log=slow_log)
+        ...
+        slow_log.dump('/var/log/graph_traversals.prom', format='prometheus')
+
+    """
+
+    threshold = 1.0
+    sample_rate = 1.0
+
+    def __init__(self, threshold=1.0, sample_size=100, sample_rate=1.0, buckets=DEFAULT_BUCKETS):
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._samples = deque(maxlen=sample_size)
+
+    def is_slow(self, duration):
+        return duration >= self.threshold
+
+    def record(self, bytecode, duration, graphson=None, error=None, timestamp=None):
+        """
+        Records the duration of a traversal.
+
+        :param bytecode: The Bytecode of the traversal
+        :param duration: Duration of the request, in seconds
+        :param graphson: (Optional) The GraphSON of the traversal, encoded if the traversal is sampled and
+            it is not provided.
+        :param error: (Optional) The exception the request failed with.
+        :param timestamp: (Optional) Time the request was sent. Default is now minus ``duration``.
+        """
+        shape = traversal_shape(bytecode, collapse_varargs=True)
+        sample = None
+        if self.is_slow(duration) and (self.sample_rate >= 1 or random.random() < self.sample_rate):
+            if graphson is None:
+                graphson = _graphson_writer.writeObject(bytecode)
+            sample = SlowTraversal(timestamp if timestamp is not None else time.time() - duration,
+                                   shape, duration, graphson, error)
+
+        with self._lock:
+            histogram = self._histograms.get(shape)
+            if histogram is None:
+                histogram = self._histograms[shape] = LatencyHistogram(shape, self.buckets)
+            histogram.add(duration, error is not None)
+            if sample is not None:
+                self._samples.append(sample)
+
+    def histograms(self):
+        """
+        Returns the :class:`LatencyHistogram` of every recorded shape, by decreasing total duration.
+        """
+        with self._lock:
+            histograms = list(self._histograms.values())
+        return sorted(histograms, key=lambda h: h.total_duration, reverse=True)
+
+    def samples(self):
+        """
+        Returns the sampled :class:`SlowTraversal`, oldest first.
+        """
+        with self._lock:
+            return list(self._samples)
+
+    def report(self):
+        """
+        Returns a human readable report of the histograms and of the sampled slow traversals.
+        """
+        lines = ['{0:>8} {1:>6} {2:>10} {3:>10} {4:>10}  {5}'.format(
+            'count', 'errors', 'mean_ms', 'p99_ms', 'max_ms', 'shape')]
+        for h in self.histograms():
+            lines.append('{0:>8} {1:>6} {2:>10.2f} {3:>10.2f} {4:>10.2f}  {5}'.format(
+                h.count, h.errors, h.mean_duration * 1000, h.percentile(99) * 1000, h.max_duration * 1000, h.shape))
+
+        samples = self.samples()
+        lines.append('')
+        lines.append('Traversals slower than {0}s: {1} sampled'.format(self.threshold, len(samples)))
+        for s in samples:
+            lines.append('{0} {1:.2f}ms{2} {3}'.format(
+                time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(s.timestamp)), s.duration * 1000,
+                ' error={0!r}'.format(s.error) if s.error is not None else '', s.graphson))
+        return '\n'.join(lines) + '\n'
+
+    def prometheus(self, prefix='dse_graph_traversal'):
+        """
+        Returns the histograms in the Prometheus text exposition format: a ``<prefix>_duration_seconds``
+        histogram and a ``<prefix>_errors_total`` counter, with a ``shape`` label.
+
+        :param prefix: (Optional) Prefix of the metric names. Default is 'dse_graph_traversal'.
+        """
+        name = prefix + '_duration_seconds'
+        errors_name = prefix + '_errors_total'
+        histograms = self.histograms()
+        lines = ['# HELP {0} Duration of the graph traversals, per traversal shape.'.format(name),
+                 '# TYPE {0} histogram'.format(name)]
+        for h in histograms:
+            shape = _escape_label(h.shape)
+            cumulative = 0
+            for bound, count in zip(h.buckets, h.bucket_counts):
+                cumulative += count
+                lines.append('{0}_bucket{{shape="{1}",le="{2}"}} {3}'.format(name, shape, _format_bound(bound), cumulative))
+            lines.append('{0}_bucket{{shape="{1}",le="+Inf"}} {2}'.format(name, shape, h.count))
+            lines.append('{0}_sum{{shape="{1}"}} {2!r}'.format(name, shape, float(h.total_duration)))
+            lines.append('{0}_count{{shape="{1}"}} {2}'.format(name, shape, h.count))
+
+        lines.append('# HELP {0} Failed graph traversals, per traversal shape.'.format(errors_name))
+        lines.append('# TYPE {0} counter'.format(errors_name))
+        for h in histograms:
+            lines.append('{0}{{shape="{1}"}} {2}'.format(errors_name, _escape_label(h.shape), h.errors))
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, target=None, format='report'):
+        """
+        Dumps the log as a :meth:`report` or in the :meth:`prometheus` format. Returns the dumped text.
+
+        :param target: (Optional) A file path, overwritten with the text, or a callable called with the text.
+        :param format: (Optional) 'report' or 'prometheus'. Default is 'report'.
+        """
+        if format == 'report':
+            text = self.report()
+        elif format == 'prometheus':
+            text = self.prometheus()
+        else:
+            raise ValueError("Unknown format '{0}', expected 'report' or 'prometheus'.".format(format))
+
+        if isinstance(target, six.string_types):
+            with io.open(target, 'w', encoding='utf-8') as f:
+                f.write(six.text_type(text))
+        elif target is not None:
+            target(text)
+        return text
+
+    def clear(self):
+        with self._lock:
+            self._histograms.clear()
+            self._samples.clear()
@@ -0,0 +1,138 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Incremental decoding of results holding a single, very large, map or list, like the results of
+``group()`` or ``fold()``.
+"""
+
+import json
+import re
+
+from dse_graph import dse_graphson_reader, _remote_connection, _raw_row_factory
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+
+def _skip(raw, idx):
+    return _WHITESPACE.match(raw, idx).end()
+
+
+def _expect(raw, idx, char):
+    if raw[idx:idx + 1] != char:
+        raise ValueError("Expecting '{0}' at position {1}".format(char, idx))
+    return _skip(raw, idx + 1)
+
+
+def _iter_list(raw, idx, reader):
+    idx = _expect(raw, idx, '[')
+    if raw[idx:idx + 1] == ']':
+        return
+    while True:
+        value, idx = _decoder.raw_decode(raw, idx)
+        yield reader.toObject(value)
+        idx = _skip(raw, idx)
+        if raw[idx:idx + 1] == ']':
+            return
+        idx = _expect(raw, idx, ',')
+
+
+def _iter_map(raw, idx, reader):
+    idx = _expect(raw, idx, '{')
+    if raw[idx:idx + 1] == '}':
+        return
+    while True:
+        key, idx = _decoder.raw_decode(raw, idx)
+        idx = _expect(raw, _skip(raw, idx), ':')
+        value, idx = _decoder.raw_decode(raw, idx)
+        yield key, reader.toObject(value)
+        idx = _skip(raw, idx)
+        if raw[idx:idx + 1] == '}':
+            return
+        idx = _expect(raw, idx, ',')
+
+
+def _is_typed(raw, idx):
+    idx = _skip(raw, idx + 1)
+    if raw[idx:idx + 1] != '"':
+        return False
+    key, _ = _decoder.raw_decode(raw, idx)
+    return key == '@type'
+
+
+def _result_position(raw):
+    idx = _expect(raw, _skip(raw, 0), '{')
+    while raw[idx:idx + 1] != '}':
+        key, idx = _decoder.raw_decode(raw, idx)
+        idx = _expect(raw, _skip(raw, idx), ':')
+        if key == 'result':
+            return idx
+        _, idx = _decoder.raw_decode(raw, idx)
+        idx = _skip(raw, idx)
+        if raw[idx:idx + 1] == ',':
+            idx = _skip(raw, idx + 1)
+    raise ValueError('The graphson row has no result.')
+
+
+def _result_entries(raw, reader):
+    """
+    Returns the container type of the result of a graphson row, list, dict or None for other values,
+    and an iterator over its decoded entries.
+    """
+    idx = _result_position(raw)
+    char = raw[idx:idx + 1]
+    if char == '[':
+        return list, _iter_list(raw, idx, reader)
+    elif char == '{' and not _is_typed(raw, idx):
+        return dict, _iter_map(raw, idx, reader)
+    return None, iter([reader.toObject(_decoder.raw_decode(raw, idx)[0])])
+
+
+def iter_result(raw, reader=dse_graphson_reader):
+    """
+    Decodes the result of a graphson row incrementally. If the result is a list, its decoded items are
+    yielded one at a time; if it is a map, its ``(key, value)`` entries are. Any other result is yielded as a
+    single decoded value. Only the entry being decoded is parsed at a time.
+
+    :param raw: A raw graphson row, like ``'{"result": [...]}'``
+    :param reader: (Optional) The GraphSONReader decoding the entries. Default decodes DSE types.
+    """
+    return _result_entries(raw, reader)[1]
+
+
+def incremental_row_factory(column_names, rows):
+    """
+    Row Factory that returns the decoded graphson as DSE types, like `graph_traversal_dse_object_row_factory`,
+    but decodes the maps and lists of the results entry by entry, without first loading the whole rows.
+    """
+    results = []
+    for row in rows:
+        container, entries = _result_entries(row[0], dse_graphson_reader)
+        results.append(container(entries) if container is not None else next(entries))
+    return results
+
+
+def stream_entries(traversal):
+    """
+    Executes a GraphTraversal and returns a generator over the entries of its results, as decoded by
+    :func:`iter_result`.
+
+    :param traversal: A GraphTraversal created with :meth:`dse_graph.DseGraph.traversal_source`
+
+    .. code-block:: python
+
+        for label, count in stream_entries(g.V().groupCount().by(T.label)):
+            print(label, count)
+
+    """
+    connection = _remote_connection(traversal)
+    for raw in connection._execute_async(traversal.bytecode, row_factory=_raw_row_factory).result():
+        for entry in iter_result(raw):
+            yield entry
@@ -5,4 +5,19 @@
 #
 # You may obtain a copy of the License at
 #
-# http://www.datastax.com/terms/datastax-dse-driver-license-terms
\ No newline at end of file
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+import time
+
+
+def wait_until(condition, timeout=10, delay=0.01):
+    """
+    Waits until ``condition()`` is true, e.g. for the response callbacks of the driver that run after the
+    results are returned. Returns the last value of ``condition()``.
+    """
+    deadline = time.time() + timeout
+    result = condition()
+    while not result and time.time() < deadline:
+        time.sleep(delay)
+        result = condition()
+    return result
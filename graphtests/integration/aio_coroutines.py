@@ -0,0 +1,21 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+"""
+Coroutines of the asyncio tests, kept apart because the async syntax requires Python 3.5+.
+"""
+
+
+async def collect(async_iterable, on_item=None):
+    items = []
+    async for item in async_iterable:
+        items.append(item)
+        if on_item is not None:
+            on_item(item)
+    return items
@@ -0,0 +1,102 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+import sys
+import threading
+
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest  # noqa
+
+if sys.version_info >= (3, 5, 2):
+    import asyncio
+    from dse_graph.aio import async_traversal_source, AsyncTraversalResults
+    from graphtests.integration.aio_coroutines import collect
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class _PagedFuture(object):
+    """
+    A response future delivering pages from a driver thread when the next page is requested.
+    """
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.fetches = 0
+        self.has_more_pages = True
+
+    def add_callbacks(self, callback, errback):
+        self.callback = callback
+        self._deliver()
+
+    def start_fetching_next_page(self):
+        self.fetches += 1
+        self._deliver()
+
+    def _deliver(self):
+        page = self.pages.pop(0)
+        self.has_more_pages = bool(self.pages)
+        threading.Thread(target=self.callback, args=(page,)).start()
+
+
+@unittest.skipIf(sys.version_info < (3, 5, 2), 'dse_graph.aio requires Python 3.5.2+')
+class AsyncTraversalTest(BasicGraphUnitTestCase):
+
+    def setUp(self):
+        super(AsyncTraversalTest, self).setUp()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        super(AsyncTraversalTest, self).tearDown()
+
+    def test_terminal_steps(self):
+        """
+        Test to validate that the terminal steps and async for of the asyncio traversals return the results
+
+        @since 1.1.0
+        @expected_result next, toList and async for return the same results as the blocking traversals
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        g = async_traversal_source(self.session, self.graph_name, loop=self.loop)
+        run = self.loop.run_until_complete
+
+        self.assertEqual(run(g.V().count().next()), 6)
+        self.assertEqual(len(run(g.V().next(2))), 2)
+        self.assertEqual(sorted(run(g.V().hasLabel('person').values('name').toList())),
+                         ['josh', 'marko', 'peter', 'vadas'])
+        self.assertEqual(sorted(run(collect(g.V().hasLabel('software').values('name')))), ['lop', 'ripple'])
+
+    def test_paging_backpressure(self):
+        """
+        Test to validate that the next result pages are only requested when the consumer catches up
+
+        @since 1.1.0
+        @expected_result at most max_buffered_pages pages are buffered, and all the results are returned in order
+
+        @test_category dse graph
+        """
+        future = _PagedFuture([[1, 2], [3, 4], [5, 6], [7, 8], [9]])
+        results = AsyncTraversalResults(future, self.loop, max_buffered_pages=2)
+        buffered = []
+
+        def on_item(item):
+            buffered.append(len(results._pages))
+
+        self.assertEqual(self.loop.run_until_complete(collect(results, on_item)), list(range(1, 10)))
+        self.assertEqual(future.fetches, 4)
+        self.assertLessEqual(max(buffered), 2)
@@ -0,0 +1,65 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph, _remote_connection, graph_traversal_row_factory
+from dse_graph.analytics import AnalyticsRoutingPolicy, route, ANALYTICS_SOURCE
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class AnalyticsRoutingTest(BasicGraphUnitTestCase):
+
+    def test_analytics_routing(self):
+        """
+        Test to validate that scan-heavy traversals are routed to the analytics source, unless overridden
+
+        @since 1.1.0
+        @expected_result the decisions are counted per reason and the traversals return the same results
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        policy = AnalyticsRoutingPolicy()
+        self.assertEqual(policy.graph_source(DseGraph.traversal_source().V().count()), ANALYTICS_SOURCE)
+        self.assertIsNone(policy.graph_source(DseGraph.traversal_source().V().has('name', 'marko')))
+
+        policy = AnalyticsRoutingPolicy()
+        g = DseGraph.traversal_source(self.session, self.graph_name, analytics_policy=policy)
+        self.assertEqual(g.V().has('name', 'marko').values('age').next(), 29)
+        self.assertEqual(route(g, analytics=False).V().count().next(), 6)
+
+        decisions = policy.decisions()
+        self.assertEqual(decisions['oltp'], 1)
+        self.assertEqual(decisions['override_graph'], 1)
+        self.assertEqual(policy.analytics_requests, 0)
+
+        connection = _remote_connection(g)
+        options = connection._execution_profile(graph_traversal_row_factory, graph_source=ANALYTICS_SOURCE).graph_options
+        self.assertTrue(options.is_analytics_source)
+
+        # the analytics profile takes the graph of the connection profile
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, execution_profile=ep, analytics_policy=AnalyticsRoutingPolicy())
+        options = _remote_connection(g)._execution_profile(graph_traversal_row_factory,
+                                                           graph_source=ANALYTICS_SOURCE).graph_options
+        self.assertEqual(options.graph_name, self.graph_name.encode('utf-8'))
+
+        # without a policy, the analytics requests use the default analytics profile
+        for g in (route(DseGraph.traversal_source(self.session, self.graph_name)),
+                  DseGraph.traversal_source(self.session, self.graph_name, graph_source=ANALYTICS_SOURCE)):
+            connection = _remote_connection(g)
+            options = connection._execution_profile(graph_traversal_row_factory,
+                                                    graph_source=ANALYTICS_SOURCE).graph_options
+            self.assertTrue(options.is_analytics_source)
+            self.assertEqual(options.graph_name, self.graph_name.encode('utf-8'))
+            self.assertIsNotNone(connection._execute_async(g.V().count().bytecode))
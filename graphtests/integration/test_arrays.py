@@ -0,0 +1,66 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+import array
+
+from dse_graph import DseGraph
+from dse_graph.arrays import typed_list_row_factory
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class TypedListTest(BasicGraphUnitTestCase):
+
+    def setUp(self):
+        super(TypedListTest, self).setUp()
+        generate_classic(self.session)
+
+    def _traversal_source(self, container):
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name + container, ep)
+        return DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep,
+                                         row_factory=typed_list_row_factory(container, min_size=2))
+
+    def test_typed_lists(self):
+        """
+        Test to validate that homogeneous lists of numbers are decoded in bulk in the requested container
+
+        @since 1.1.0
+        @expected_result the folded ages are returned as an array.array, or a plain list
+
+        @test_category dse graph
+        """
+        g = self._traversal_source('array')
+        ages = g.V().hasLabel('person').values('age').order().fold().next()
+        self.assertIsInstance(ages, array.array)
+        self.assertEqual(list(ages), [27, 29, 32, 35])
+        self.assertEqual(g.V().has('name', 'marko').values('name').fold().next(), ['marko'])
+
+        g = self._traversal_source('list')
+        self.assertEqual(g.V().hasLabel('person').values('age').order().fold().next(), [27, 29, 32, 35])
+
+    def test_typed_list_execution_profile(self):
+        """
+        Test to validate that the typed list row factory decodes the results of session.execute_graph
+
+        @since 1.1.0
+        @expected_result the folded ages are returned as an array.array
+
+        @test_category dse graph
+        """
+        ep = DseGraph().create_execution_profile(self.graph_name, row_factory=typed_list_row_factory(min_size=2))
+        self.cluster.add_execution_profile('typed_lists', ep)
+        query = DseGraph.query_from_traversal(DseGraph.traversal_source().V().hasLabel('person')
+                                              .values('age').order().fold())
+        ages = list(self.session.execute_graph(query, execution_profile='typed_lists'))[0]
+        self.assertIsInstance(ages, array.array)
+        self.assertEqual(list(ages), [27, 29, 32, 35])
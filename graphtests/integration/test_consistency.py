@@ -0,0 +1,50 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse import ConsistencyLevel
+
+from dse_graph import DseGraph, _remote_connection, graph_traversal_row_factory
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class ReadWriteProfilesTest(BasicGraphUnitTestCase):
+
+    def test_read_write_profiles(self):
+        """
+        Test to validate that read-only and mutating traversals are sent with their own execution profile
+
+        @since 1.1.0
+        @expected_result the traversals are classified, executed, and sent with the read or write profile
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        read_ep = DseGraph().create_execution_profile(self.graph_name)
+        read_ep.graph_options.graph_read_consistency_level = ConsistencyLevel.ONE
+        write_ep = DseGraph().create_execution_profile(self.graph_name)
+        write_ep.graph_options.graph_write_consistency_level = ConsistencyLevel.QUORUM
+        self.cluster.add_execution_profile('read', read_ep)
+        self.cluster.add_execution_profile('write', write_ep)
+
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile='read',
+                                      read_execution_profile='read', write_execution_profile='write')
+        g.addV('person').property('name', 'peter2').iterate()
+        self.assertEqual(g.V().has('name', 'peter2').count().next(), 1)
+
+        connection = _remote_connection(g)
+        self.assertEqual(connection.reads_sent, 1)
+        self.assertEqual(connection.writes_sent, 1)
+        read_options = connection._execution_profile(graph_traversal_row_factory, True).graph_options
+        write_options = connection._execution_profile(graph_traversal_row_factory, False).graph_options
+        self.assertEqual(read_options.graph_read_consistency_level, ConsistencyLevel.ONE)
+        self.assertEqual(write_options.graph_write_consistency_level, ConsistencyLevel.QUORUM)
@@ -0,0 +1,69 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+from dse_graph import DseGraph
+from dse_graph.export import record_batches, to_arrow, to_pandas, pyarrow
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest  # noqa
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+@unittest.skipIf(pyarrow is None or pandas is None, 'pyarrow and pandas are required')
+class ExportTest(BasicGraphUnitTestCase):
+
+    def setUp(self):
+        super(ExportTest, self).setUp()
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        self.g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep)
+
+    def test_export_vertices_and_edges(self):
+        """
+        Test to validate that vertices and edges are exported with their flattened properties
+
+        @since 1.1.0
+        @expected_result one row per element, with id, label and property columns
+
+        @test_category dse graph
+        """
+        people = to_arrow(self.g.V().hasLabel('person'), batch_size=2)
+        self.assertEqual(people.num_rows, 4)
+        self.assertEqual(set(people.column_names), set(['id', 'label', 'name', 'age']))
+
+        edges = to_pandas(self.g.E().hasLabel('knows'))
+        self.assertEqual(len(edges), 2)
+        self.assertEqual(sorted(edges['weight'].tolist()), [0.5, 1.0])
+        self.assertTrue(set(['outV', 'outVLabel', 'inV', 'inVLabel']).issubset(edges.columns))
+
+    def test_export_maps_in_batches(self):
+        """
+        Test to validate that valueMap rows are exported in record batches of batch_size rows
+
+        @since 1.1.0
+        @expected_result two batches with the name and age columns
+
+        @test_category dse graph
+        """
+        batches = list(record_batches(self.g.V().hasLabel('person').valueMap('name', 'age'), batch_size=2))
+        self.assertEqual([b.num_rows for b in batches], [2, 2])
+        df = to_pandas(self.g.V().hasLabel('person').valueMap('name', 'age'), page_size=3)
+        self.assertEqual(sorted(df['name'].tolist()), ['josh', 'marko', 'peter', 'vadas'])
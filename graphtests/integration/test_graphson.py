@@ -0,0 +1,53 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+import uuid
+
+from gremlin_python.process.traversal import P
+from gremlin_python.structure.io.graphson import GraphSONWriter
+
+from dse_graph import DseGraph
+from dse_graph.graphson import StreamingGraphSONWriter
+from dse_graph.serializers import serializers
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class StreamingGraphSONWriterTest(BasicGraphUnitTestCase):
+
+    def test_streamed_traversals(self):
+        """
+        Test to validate that traversals with large within() and inject() arguments are encoded like GraphSONWriter
+        and executed
+
+        @since 1.1.0
+        @expected_result the GraphSON is identical and the traversals return the expected results
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep)
+
+        names = ['marko', 'josh'] + ['name-{0}'.format(i) for i in range(5000)]
+        rows = [{'id': uuid.uuid4(), 'value': i, 'tags': list(range(i % 3))} for i in range(5000)]
+        traversals = [g.V().has('name', P.within(names)).count(),
+                      g.inject(rows).unfold().count()]
+
+        writer = GraphSONWriter(serializer_map=serializers)
+        streaming_writer = StreamingGraphSONWriter(serializer_map=serializers, stream_threshold=100, chunk_size=100)
+        for traversal in traversals:
+            self.assertEqual(streaming_writer.writeObject(traversal), writer.writeObject(traversal))
+
+        self.assertEqual(traversals[0].next(), 2)
+        self.assertEqual(traversals[1].next(), 5000)
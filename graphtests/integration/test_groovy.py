@@ -0,0 +1,53 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from gremlin_python.process.graph_traversal import __
+from gremlin_python.process.traversal import P, Order
+from gremlin_python.statics import long
+
+from dse_graph import DseGraph
+from dse_graph.groovy import GROOVY_QUERY_LANGUAGE
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class GroovyQueryLanguageTest(BasicGraphUnitTestCase):
+
+    def test_groovy_and_bytecode_results(self):
+        """
+        Test to validate that traversals sent as parameterized gremlin-groovy scripts return the same results
+        as bytecode-json
+
+        @since 1.1.0
+        @expected_result the results of both query languages are equal
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep)
+        groovy_g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep,
+                                             query_language=GROOVY_QUERY_LANGUAGE)
+
+        traversals = [
+            lambda g: g.V().has('name', 'marko').out('knows').values('name'),
+            lambda g: g.V().hasLabel('person').has('age', P.gt(27)).order().by('age', Order.decr).values('name'),
+            lambda g: g.V().has('name', P.within(['marko', 'josh'])).where(__.out('created').count().is_(P.gte(1))),
+            lambda g: g.E().hasLabel('knows').valueMap(),
+        ]
+        for traversal in traversals:
+            self.assertEqual(traversal(groovy_g).toList(), traversal(g).toList())
+
+        # longs are bound as g:Int64 like in bytecode, whatever their value
+        for source in (g, groovy_g):
+            self.assertEqual([type(value) for value in source.inject(long(1), 1).toList()], [long, int])
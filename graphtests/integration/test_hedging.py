@@ -0,0 +1,42 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph, _remote_connection
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class HedgedExecutionTest(BasicGraphUnitTestCase):
+
+    def test_hedged_reads(self):
+        """
+        Test to validate that traversals of a hedging connection return the same results, and that mutations
+        are never hedged
+
+        @since 1.1.0
+        @expected_result results are unchanged and no hedge is sent without another host
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep, hedge_delay=0)
+        connection = _remote_connection(g)
+
+        self.assertEqual(g.V().has('name', 'marko').out('knows').count().next(), 2)
+        g.addV('person').property('name', 'hedge').iterate()
+        self.assertEqual(g.V().has('name', 'hedge').count().next(), 1)
+
+        # single node: there is no other host to hedge to
+        self.assertEqual(connection.hedges_sent, 0)
+        self.assertEqual(connection.hedges_won, 0)
@@ -0,0 +1,81 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph
+from dse_graph.mutations import MutationBuffer
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class MutationBufferTest(BasicGraphUnitTestCase):
+
+    def test_coalesced_property_updates(self):
+        """
+        Test to validate that buffered property updates are coalesced per vertex, last write winning
+
+        @since 1.1.0
+        @expected_result one traversal is sent for the vertex and the last written value is stored
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep)
+        marko = g.V().has('name', 'marko').next()
+
+        buffer = MutationBuffer(g)
+        buffer.set_property(marko.id, 'age', 30)
+        buffer.set_property(marko.id, 'age', 31)
+        self.assertEqual(buffer.pending, 1)
+        self.assertEqual(buffer.flush(), 1)
+        self.assertEqual(buffer.pending, 0)
+
+        self.assertEqual(g.V(marko.id).values('age').next(), 31)
+
+    def test_failed_flush(self):
+        """
+        Test to validate that a failed flush drops the updates that cannot be sent and retries the failed ones
+
+        @since 1.1.0
+        @expected_result the other updates are stored, the failed ones are retried then passed to on_error
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep)
+        marko = g.V().has('name', 'marko').next()
+        vadas = g.V().has('name', 'vadas').next()
+        josh = g.V().has('name', 'josh').next()
+
+        dropped = []
+        buffer = MutationBuffer(g, max_retries=1, on_error=lambda vertex_id, properties, error: dropped.append(
+            (vertex_id, properties)))
+        buffer.set_property(marko.id, 'age', 30)
+        unserializable = object()
+        buffer.set_property(unserializable, 'age', 1)
+        buffer.set_property(josh.id, 'age', 'not an int')  # rejected by the server
+        buffer.set_property(vadas.id, 'age', 28)
+        with self.assertRaises(TypeError):
+            buffer.flush()
+        self.assertEqual(dropped, [(unserializable, {'age': 1})])
+        self.assertEqual(buffer.pending, 1)
+        self.assertEqual(g.V(marko.id).values('age').next(), 30)
+        self.assertEqual(g.V(vadas.id).values('age').next(), 28)
+
+        with self.assertRaises(Exception):
+            buffer.flush()
+        self.assertEqual(dropped[1], (josh.id, {'age': 'not an int'}))
+        self.assertEqual(buffer.pending, 0)
+        self.assertEqual(g.V(josh.id).values('age').next(), 32)
@@ -0,0 +1,51 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from gremlin_python.process.traversal import P
+
+from dse_graph import DseGraph
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest  # noqa
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+@unittest.skipIf(numpy is None, 'numpy is required')
+class NumPyTest(BasicGraphUnitTestCase):
+
+    def test_numpy_arguments(self):
+        """
+        Test to validate that numpy scalars and arrays can be used as traversal arguments
+
+        @since 1.1.0
+        @expected_result the numpy values are written with the GraphSON type of their dtype
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep)
+
+        ages = numpy.array([27, 29], dtype=numpy.int64)
+        names = g.V().has('person', 'age', P.within(ages)).values('name').toList()
+        self.assertEqual(sorted(names), ['marko', 'vadas'])
+        self.assertEqual(g.V().has('person', 'age', numpy.int64(32)).values('name').next(), 'josh')
+        self.assertEqual(g.inject(numpy.arange(3, dtype=numpy.int32)).unfold().sum().next(), 3)
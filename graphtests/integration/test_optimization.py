@@ -0,0 +1,59 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from gremlin_python.process.graph_traversal import __
+from gremlin_python.process.traversal import T
+
+from dse_graph import DseGraph
+from dse_graph.optimization import BytecodeOptimizationStrategy
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class BytecodeOptimizationTest(BasicGraphUnitTestCase):
+
+    def test_optimized_traversals(self):
+        """
+        Test to validate that optimized traversals return the same results as the original ones
+
+        @since 1.1.0
+        @expected_result the results are equal, and the rewritten bytecode starts with V(id)
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep)
+        optimized_g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep,
+                                                client_strategies=[BytecodeOptimizationStrategy()])
+        marko = g.V().has('name', 'marko').next()
+
+        traversals = [
+            lambda g: g.V().hasId(marko.id).identity().out('knows').dedup().dedup().values('name'),
+            lambda g: g.V().hasLabel('person').has('name', 'marko').has('name', 'marko').values('age'),
+            lambda g: g.V().where(__.identity().hasLabel('software').has('lang', 'java')).values('name'),
+            lambda g: g.V().hasLabel('person').has(T.id, marko.id).values('name'),
+            lambda g: g.V().hasLabel('person').has('name', __.is_('marko')).values('age'),
+        ]
+        for traversal in traversals:
+            self.assertEqual(sorted(traversal(optimized_g).toList()), sorted(traversal(g).toList()))
+
+        traversal = g.V().hasId(marko.id).out()
+        BytecodeOptimizationStrategy(['start_from_ids']).optimize(traversal.bytecode)
+        self.assertEqual(traversal.bytecode.step_instructions[0], ['V', marko.id])
+
+        unmerged = [g.V().hasLabel('person').has(T.id, marko.id), g.V().hasLabel('person').has('name', __.count())]
+        for traversal in unmerged:
+            expected = [list(i) for i in traversal.bytecode.step_instructions]
+            BytecodeOptimizationStrategy(['merge_has']).optimize(traversal.bytecode)
+            self.assertEqual(traversal.bytecode.step_instructions, expected)
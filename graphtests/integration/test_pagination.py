@@ -0,0 +1,58 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph
+from dse_graph.pagination import paginate
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_line_graph
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class PaginationTest(BasicGraphUnitTestCase):
+
+    def setUp(self):
+        super(PaginationTest, self).setUp()
+        self.ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, self.ep)
+
+    def test_range_pagination(self):
+        """
+        Test to validate that range windows return every result once
+
+        @since 1.1.0
+        @expected_result the paginated traversal returns the same edges as a single traversal
+
+        @test_category dse graph
+        """
+        self.session.execute_graph(generate_line_graph(250))
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=self.ep)
+
+        expected = g.E().id().toList()
+        results = list(paginate(g.E().id(), page_size=30))
+        self.assertEqual(len(results), len(expected))
+        self.assertEqual(sorted(str(r) for r in results), sorted(str(e) for e in expected))
+
+    def test_cursor_pagination(self):
+        """
+        Test to validate that cursor windows return every vertex once, ordered by the cursor key
+
+        @since 1.1.0
+        @expected_result the paginated vertices are ordered by the cursor key and none is missing
+
+        @test_category dse graph
+        """
+        self.session.execute_graph(generate_line_graph(250))
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=self.ep)
+
+        vertices = list(paginate(g.V(), page_size=40, cursor_key='index', prefetch=False))
+        self.assertEqual(len(vertices), g.V().count().next())
+        indexes = [g.V(v.id).values('index').next() for v in vertices]
+        self.assertEqual(indexes, sorted(indexes))
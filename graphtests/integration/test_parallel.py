@@ -0,0 +1,71 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph, graph_traversal_dse_object_row_factory
+from dse_graph.parallel import ProcessPoolRowFactory, ProcessPoolExecutor
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest  # noqa
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+def _raw_row_factory(column_names, rows):
+    return rows
+
+
+class ProcessPoolRowFactoryTest(BasicGraphUnitTestCase):
+
+    def _raw_rows(self, traversal):
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name, row_factory=_raw_row_factory)
+        self.cluster.add_execution_profile('raw', ep)
+        query = DseGraph.query_from_traversal(traversal)
+        return list(self.session.execute_graph(query, execution_profile='raw'))
+
+    def test_inline_decoding(self):
+        """
+        Test to validate that results smaller than the threshold are decoded inline, without a pool
+
+        @since 1.1.0
+        @expected_result the results are equal to the default decoding and no executor is created
+
+        @test_category dse graph
+        """
+        rows = self._raw_rows(DseGraph.traversal_source().V().order().by('name').values('name'))
+        row_factory = ProcessPoolRowFactory(max_workers=2)
+        try:
+            self.assertEqual(row_factory(['gremlin'], rows), graph_traversal_dse_object_row_factory(['gremlin'], rows))
+            self.assertIsNone(row_factory._executor)
+        finally:
+            row_factory.shutdown()
+
+    @unittest.skipIf(ProcessPoolExecutor is None, 'concurrent.futures is required')
+    def test_pool_decoding(self):
+        """
+        Test to validate that results above the threshold are decoded in the pool and reassembled in order
+
+        @since 1.1.0
+        @expected_result the results are equal to the default decoding, in the same order
+
+        @test_category dse graph
+        """
+        rows = self._raw_rows(DseGraph.traversal_source().V().order().by('name').values('name'))
+        rows = rows * 50
+        row_factory = ProcessPoolRowFactory(max_workers=2, threshold=1, chunk_size=7)
+        try:
+            self.assertEqual(row_factory(['gremlin'], rows), graph_traversal_dse_object_row_factory(['gremlin'], rows))
+            self.assertIsNotNone(row_factory._executor)
+        finally:
+            row_factory.shutdown()
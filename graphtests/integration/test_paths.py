@@ -0,0 +1,44 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph, graph_traversal_compact_path_row_factory
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class CompactPathTest(BasicGraphUnitTestCase):
+
+    def test_compact_paths(self):
+        """
+        Test to validate that compact paths share their decoded objects and label sets
+
+        @since 1.1.0
+        @expected_result paths are equal to the default ones, share their common prefix objects and use frozensets
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        compact_ep = DseGraph().create_execution_profile(self.graph_name,
+                                                         row_factory=graph_traversal_compact_path_row_factory)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        self.cluster.add_execution_profile('compact', compact_ep)
+
+        traversal = DseGraph.traversal_source().V().has('name', 'marko').as_('a').out().as_('b').path()
+        query = DseGraph.query_from_traversal(traversal)
+        paths = list(self.session.execute_graph(query, execution_profile=ep))
+        compact_paths = list(self.session.execute_graph(query, execution_profile='compact'))
+
+        self.assertEqual(len(compact_paths), 3)
+        self.assertEqual([p.objects for p in compact_paths], [p.objects for p in paths])
+        self.assertTrue(all(p.objects[0] is compact_paths[0].objects[0] for p in compact_paths))
+        self.assertEqual(compact_paths[0].labels, [frozenset(['a']), frozenset(['b'])])
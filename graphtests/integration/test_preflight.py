@@ -0,0 +1,63 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from gremlin_python.process.traversal import P, T
+
+from dse.util import Distance
+
+from dse_graph import DseGraph
+from dse_graph.predicates import Geo, Search
+from dse_graph.preflight import ScanAnalyzer, FullScanError, allow_scan
+from dse_graph.schema import SchemaCache
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class ScanAnalyzerTest(BasicGraphUnitTestCase):
+
+    def test_scan_analyzer(self):
+        """
+        Test to validate that the traversals filtering on unindexed properties are rejected before being sent
+
+        @since 1.1.0
+        @expected_result indexed lookups are executed, scans raise FullScanError unless allowed
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        self.session.execute_graph("schema.vertexLabel('person').index('byName').materialized().by('name').add()")
+        schema_cache = SchemaCache(self.session, self.graph_name)
+        self.assertEqual(schema_cache.get().vertex_labels['person'].index_types('name'), set(['materialized']))
+
+        analyzer = ScanAnalyzer(schema_cache, mode='raise')
+        g = DseGraph.traversal_source(self.session, self.graph_name, scan_analyzer=analyzer)
+        self.assertEqual(g.V().has('person', 'name', 'marko').values('age').next(), 29)
+        with self.assertRaises(FullScanError) as context:
+            g.V().has('person', 'age', 29).values('name').next()
+        self.assertEqual(context.exception.scan.reason, 'unindexed')
+        self.assertEqual(allow_scan(g).V().hasLabel('person').count().next(), 4)
+        for predicate in (Search.fuzzy('marko', 1), Search.phrase('marko', 1), Search.token('marko'),
+                          Geo.inside(Distance(0, 0, 1))):
+            self.assertEqual(analyzer.analyze(g.V().has('person', 'name', predicate)).reason, 'unindexed')
+        self.assertIsNone(analyzer.analyze(g.V().has(T.label, P.eq('person')).has('name', 'marko')))
+        self.assertEqual(analyzer.analyze(g.V().has(T.label, P.eq('person')).has('age', 29)).labels, ['person'])
+
+        # a composite partition key only narrows down the traversals filtering on all its components
+        self.session.execute_graph("schema.propertyKey('city').Text().create()\n"
+                                   "schema.propertyKey('zone').Text().create()\n"
+                                   "schema.vertexLabel('sensor').partitionKey('city', 'zone').create()")
+        schema_cache.refresh()
+        self.assertEqual(analyzer.analyze(g.V().has('sensor', 'city', 'paris')).reason, 'unindexed')
+        self.assertIsNone(analyzer.analyze(g.V().has('sensor', 'city', 'paris').has('zone', 'north')))
+
+        self.assertEqual(analyzer.traversals_checked, 2)
+        self.assertEqual(analyzer.scans()['unindexed'], 1)
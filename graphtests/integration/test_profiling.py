@@ -0,0 +1,65 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph
+from dse_graph.profiling import profile, ProfileAggregator
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class ProfilingTest(BasicGraphUnitTestCase):
+
+    def setUp(self):
+        super(ProfilingTest, self).setUp()
+        self.ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, self.ep)
+
+    def test_profile(self):
+        """
+        Test to validate that profile() metrics are parsed into a step tree
+
+        @since 1.1.0
+        @expected_result every step has a name and a duration, and the percentages sum up to about 100
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=self.ep)
+        traversal_profile = profile(g.V().has('name', 'marko').out('knows'))
+
+        self.assertEqual(traversal_profile.shape, 'g.V().has(?,?).out(?)')
+        self.assertTrue(traversal_profile.steps)
+        for step in traversal_profile.steps:
+            self.assertIsNotNone(step.name)
+            self.assertIsNotNone(step.duration)
+        self.assertAlmostEqual(sum(s.percent_duration for s in traversal_profile.steps), 100, delta=1)
+
+    def test_aggregate_profiles(self):
+        """
+        Test to validate that profiles are aggregated per traversal shape
+
+        @since 1.1.0
+        @expected_result traversals differing only by their literals are aggregated together
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=self.ep)
+        aggregator = ProfileAggregator()
+        for name in ('marko', 'josh', 'peter'):
+            aggregator.profile(g.V().has('name', name).out('created'))
+        aggregator.profile(g.V().count())
+
+        reports = dict((r.shape, r) for r in aggregator.reports())
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(reports['g.V().has(?,?).out(?)'].runs, 3)
+        self.assertTrue(aggregator.hot_steps(1))
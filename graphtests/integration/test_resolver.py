@@ -0,0 +1,48 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph
+from dse_graph.resolver import VertexIdResolver
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class VertexIdResolverTest(BasicGraphUnitTestCase):
+
+    def test_resolve_and_invalidate(self):
+        """
+        Test to validate that external keys are resolved in batch, cached, and invalidated when the vertex is dropped
+
+        @since 1.1.0
+        @expected_result known names are resolved to their vertex id, unknown names are not, and dropped vertices are evicted
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep)
+        marko = g.V().has('name', 'marko').next()
+
+        resolver = VertexIdResolver(g, batch_size=2)
+        ids = resolver.resolve_many('person', 'name', ['marko', 'vadas', 'josh', 'unknown', 'vadas', 'unknown'])
+        self.assertEqual(set(ids), set(['marko', 'vadas', 'josh']))
+        self.assertEqual(ids['marko'], marko.id)
+        self.assertEqual(len(resolver), 3)
+        self.assertEqual(resolver.misses, 4)
+
+        self.assertEqual(resolver.resolve('person', 'name', 'marko'), marko.id)
+        self.assertEqual(resolver.hits, 1)
+
+        resolver.drop_vertex(marko.id)
+        self.assertEqual(len(resolver), 2)
+        self.assertIsNone(resolver.resolve('person', 'name', 'marko'))
@@ -0,0 +1,48 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph, _remote_connection
+from dse_graph.routing import submit_by_replica
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class ReplicaRoutingTest(BasicGraphUnitTestCase):
+
+    def test_token_aware_traversals(self):
+        """
+        Test to validate that traversals starting from vertex ids are routed to their replica and split by replica
+
+        @since 1.1.0
+        @expected_result the vertices have a replica, and split traversals return the same results
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep, token_aware=True)
+        router = _remote_connection(g).router
+        ids = g.V().id().toList()
+
+        for vertex_id in ids:
+            self.assertIsNotNone(router.routing_key(vertex_id))
+            self.assertEqual(len(router.replicas(vertex_id)), 1)
+
+        self.assertEqual(g.V(ids[0]).count().next(), 1)
+
+        # routing is best-effort, an id that cannot be serialized has no replica
+        invalid_id = dict(ids[0], community_id='not an int')
+        self.assertIsNone(router.routing_key(invalid_id))
+        self.assertIsNone(router.replica([invalid_id]))
+        names = submit_by_replica(g.V(*ids).values('name'))
+        self.assertEqual(sorted(names), sorted(g.V().values('name').toList()))
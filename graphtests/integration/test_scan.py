@@ -0,0 +1,47 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph
+from dse_graph.scan import PartitionedScan, PropertyRangePartitioner, PartitionProgress
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_line_graph
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class PartitionedScanTest(BasicGraphUnitTestCase):
+
+    def test_partitioned_scan(self):
+        """
+        Test to validate that a partitioned scan returns the same results as a single scan
+
+        @since 1.1.0
+        @expected_result every vertex is returned once, including the ones without the key, and every partition
+        is done
+
+        @test_category dse graph
+        """
+        self.session.execute_graph(generate_line_graph(250))
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep)
+        g.addV('lp').property('name', 'unindexed').iterate()
+
+        progress = []
+        scan = PartitionedScan(g.V().id(), PropertyRangePartitioner('index', [50, 100, 150, 200]),
+                               concurrency=2, on_progress=progress.append)
+        results = list(scan)
+
+        self.assertEqual(len(results), g.V().count().next())
+        self.assertEqual(scan.progress[-1].result_count, 1)
+        self.assertEqual(len(scan.progress), 6)
+        for partition in scan.progress:
+            self.assertEqual(partition.state, PartitionProgress.DONE)
+        self.assertEqual(sum(p.result_count for p in scan.progress), len(results))
@@ -0,0 +1,93 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+import threading
+
+from dse_graph import DseGraph
+from dse_graph.scheduling import TraversalScheduler, PriorityClass, AdaptiveConcurrencyLimiter
+from graphtests.integration import wait_until
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class TraversalSchedulerTest(BasicGraphUnitTestCase):
+
+    def test_priority_classes(self):
+        """
+        Test to validate that the requests of the priority classes are all executed within the in-flight limits
+
+        @since 1.1.0
+        @expected_result the requests are counted per class and no request is left in flight
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+
+        scheduler = TraversalScheduler(max_in_flight=4, classes=[PriorityClass('interactive', weight=4),
+                                                                 PriorityClass('batch', max_in_flight=2)])
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep,
+                                      scheduler=scheduler, priority='interactive')
+        g_batch = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep,
+                                            scheduler=scheduler, priority='batch')
+
+        def run(source, count):
+            for _ in range(count):
+                self.assertEqual(source.V().has('name', 'marko').out('knows').count().next(), 2)
+
+        threads = [threading.Thread(target=run, args=(g_batch, 10)) for _ in range(4)]
+        threads.append(threading.Thread(target=run, args=(g, 10)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # the slots are released by the response callbacks, which can run after the results are returned
+        self.assertTrue(wait_until(lambda: scheduler.in_flight == 0))
+
+        self.assertEqual(scheduler.priority_class('batch').requests, 40)
+        self.assertEqual(scheduler.priority_class('interactive').requests, 10)
+        self.assertEqual(scheduler.in_flight, 0)
+        self.assertGreater(scheduler.priority_class('batch').total_queue_wait, 0)
+
+    def test_adaptive_limiter(self):
+        """
+        Test to validate that the adaptive limiter grows its limit while the requests are healthy
+
+        @since 1.1.0
+        @expected_result the limit grew from its initial value and the throughput is measured
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8, latency_tolerance=100)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep, scheduler=limiter)
+
+        def run(count):
+            for _ in range(count):
+                g.V().has('name', 'marko').count().next()
+
+        threads = [threading.Thread(target=run, args=(25,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # the limit adapts in the response callbacks, which can run after the results are returned
+        self.assertTrue(wait_until(lambda: limiter.in_flight == 0))
+
+        self.assertEqual(sum(c.requests for c in limiter.classes()), 200)
+        self.assertGreater(limiter.limit, 2)
+        self.assertLessEqual(limiter.limit, 8)
+        self.assertGreater(limiter.throughput, 0)
@@ -0,0 +1,87 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph
+from dse_graph.schema import SchemaCache, schema_aware_row_factory
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+from graphtests.integration import wait_until
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class SchemaAwareDecodingTest(BasicGraphUnitTestCase):
+
+    def test_schema_snapshot(self):
+        """
+        Test to validate that the schema snapshot contains the property keys and labels of the graph
+
+        @since 1.1.0
+        @expected_result the classic graph property keys and labels are found in the snapshot
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        schema = SchemaCache(self.session, self.graph_name).get()
+        self.assertEqual(schema.property_keys['name'].data_type, 'Text')
+        self.assertEqual(schema.property_keys['age'].data_type, 'Int')
+        self.assertIn('person', schema.vertex_labels)
+        self.assertIn('knows', schema.edge_labels)
+        self.assertIn('name', schema.vertex_labels['person'].properties)
+
+    def test_schema_aware_row_factory(self):
+        """
+        Test to validate that the schema-aware decoders return the same results as the generic decoding
+
+        @since 1.1.0
+        @expected_result vertices and edges decoded with both row factories are equal
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        schema_cache = SchemaCache(self.session, self.graph_name)
+        generic_ep = DseGraph.create_execution_profile(self.graph_name)
+        schema_ep = DseGraph.create_execution_profile(self.graph_name,
+                                                      row_factory=schema_aware_row_factory(schema_cache))
+        g = DseGraph.traversal_source()
+        schema_cache.decoders()
+        self.assertTrue(wait_until(lambda: schema_cache.decoders() is not None))
+
+        for traversal in (g.V(), g.E()):
+            query = DseGraph.query_from_traversal(traversal)
+            generic = list(self.session.execute_graph(query, execution_profile=generic_ep))
+            schema_aware = list(self.session.execute_graph(query, execution_profile=schema_ep))
+            self.assertEqual(len(generic), len(schema_aware))
+            for expected, element in zip(generic, schema_aware):
+                self.assertEqual(expected.id, element.id)
+                self.assertEqual(expected.label, element.label)
+                self.assertEqual(repr(expected.properties), repr(element.properties))
+
+    def test_background_loading(self):
+        """
+        Test to validate that the decoders never block on the schema, which is loaded in the background
+
+        @since 1.1.0
+        @expected_result no decoders are returned until the snapshot is loaded, then the elements are decoded with it
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        schema_cache = SchemaCache(self.session, self.graph_name)
+        self.assertIsNone(schema_cache.decoders())
+        self.assertTrue(wait_until(lambda: schema_cache.decoders() is not None))
+        self.assertIn('person', schema_cache.decoders()['vertex'])
+
+        # decoded generically while the snapshot of a new cache is loading
+        row_factory = schema_aware_row_factory(SchemaCache(self.session, self.graph_name))
+        schema_ep = DseGraph.create_execution_profile(self.graph_name, row_factory=row_factory)
+        query = DseGraph.query_from_traversal(DseGraph.traversal_source().V().hasLabel('person'))
+        self.assertEqual(len(list(self.session.execute_graph(query, execution_profile=schema_ep))), 4)
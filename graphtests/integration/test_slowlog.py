@@ -0,0 +1,60 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph
+from dse_graph.slowlog import SlowTraversalLog
+from graphtests.integration import wait_until
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class SlowTraversalLogTest(BasicGraphUnitTestCase):
+
+    def test_slow_log(self):
+        """
+        Test to validate that the slow log records a histogram per traversal shape and samples the slow traversals
+
+        @since 1.1.0
+        @expected_result one histogram per shape, the slow traversals are sampled up to sample_size
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+
+        slow_log = SlowTraversalLog(threshold=0, sample_size=2)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep, slow_log=slow_log)
+        for name in ('marko', 'vadas', 'josh'):
+            g.V().has('name', name).out('knows').toList()
+        g.V().count().next()
+        # the requests are recorded by the response callbacks, which can run after the results are returned
+        self.assertTrue(wait_until(lambda: sum(h.count for h in slow_log.histograms()) == 4))
+
+        histograms = dict((h.shape, h) for h in slow_log.histograms())
+        self.assertEqual(histograms['g.V().has(?,?).out(?)'].count, 3)
+        self.assertEqual(histograms['g.V().count()'].count, 1)
+        samples = slow_log.samples()
+        self.assertEqual(len(samples), 2)
+        self.assertIn('josh', samples[0].graphson)
+
+        dumped = []
+        slow_log.dump(dumped.append, format='prometheus')
+        self.assertIn('dse_graph_traversal_duration_seconds_count{shape="g.V().has(?,?).out(?)"} 3', dumped[0])
+
+        # the arguments of vararg steps are collapsed, whatever their number
+        ids = g.V().id().toList()
+        g.V(*ids[:2]).toList()
+        g.V(*ids[:3]).toList()
+        self.assertTrue(wait_until(lambda: sum(h.count for h in slow_log.histograms()) == 7))
+        histograms = dict((h.shape, h) for h in slow_log.histograms())
+        self.assertEqual(histograms['g.V(?*)'].count, 2)
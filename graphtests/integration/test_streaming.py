@@ -0,0 +1,58 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from gremlin_python.process.traversal import T
+
+from dse_graph import DseGraph
+from dse_graph.streaming import stream_entries, incremental_row_factory
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class StreamingTest(BasicGraphUnitTestCase):
+
+    def test_stream_entries(self):
+        """
+        Test to validate that the entries of map and list results are streamed one at a time
+
+        @since 1.1.0
+        @expected_result the streamed entries are the entries of the complete result
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        g = DseGraph.traversal_source(self.session, self.graph_name, execution_profile=ep)
+
+        self.assertEqual(dict(stream_entries(g.V().groupCount().by(T.label))), {'person': 4, 'software': 2})
+        self.assertEqual(sorted(stream_entries(g.V().values('name').fold())),
+                         sorted(g.V().values('name').toList()))
+
+    def test_incremental_row_factory(self):
+        """
+        Test to validate that the incremental row factory decodes results like the default one
+
+        @since 1.1.0
+        @expected_result the results of both row factories are equal
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        incremental_ep = DseGraph().create_execution_profile(self.graph_name, row_factory=incremental_row_factory)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+        self.cluster.add_execution_profile('incremental', incremental_ep)
+
+        query = DseGraph.query_from_traversal(DseGraph.traversal_source().V().group().by(T.label).by('name'))
+        self.assertEqual(list(self.session.execute_graph(query, execution_profile='incremental')),
+                         list(self.session.execute_graph(query, execution_profile=ep)))
@@ -0,0 +1,47 @@
+# Copyright 2016 DataStax, Inc.
+#
+# Licensed under the DataStax DSE Driver License;
+# you may not use this file except in compliance with the License.
+#
+# You may obtain a copy of the License at
+#
+# http://www.datastax.com/terms/datastax-dse-driver-license-terms
+
+from dse_graph import DseGraph, _remote_connection
+from dse_graph.scheduling import TraversalScheduler
+from dse_graph.slowlog import SlowTraversalLog
+from tests.integration.advanced import BasicGraphUnitTestCase, use_single_node_with_graph_and_solr, generate_classic
+
+
+def setup_module():
+    use_single_node_with_graph_and_solr()
+
+
+class WarmupTest(BasicGraphUnitTestCase):
+
+    def test_warmup(self):
+        """
+        Test to validate that warmup returns a usable traversal source, which keeps following its execution profile
+
+        @since 1.1.0
+        @expected_result the traversal source executes traversals with the current settings of its profile
+
+        @test_category dse graph
+        """
+        generate_classic(self.session)
+        ep = DseGraph().create_execution_profile(self.graph_name)
+        self.cluster.add_execution_profile(self.graph_name, ep)
+
+        slow_log = SlowTraversalLog()
+        scheduler = TraversalScheduler()
+        g = DseGraph.warmup(self.session, self.graph_name, execution_profile=ep, slow_log=slow_log,
+                            scheduler=scheduler,
+                            traversals=[DseGraph.traversal_source().V().has('name', 'marko').out('knows')])
+        connection = _remote_connection(g)
+        ep.request_timeout = 42
+        self.assertEqual(connection._execution_profile(connection.row_factory).request_timeout, 42)
+        # the probes are not accounted as application requests
+        self.assertEqual(connection.reads_sent, 0)
+        self.assertEqual(slow_log.histograms(), [])
+        self.assertEqual(scheduler.priority_class().requests, 0)
+        self.assertEqual(g.V().has('name', 'marko').out('knows').count().next(), 2)
@@ -9,10 +9,13 @@
 
 from __future__ import print_function
 
+import sys
+
 import ez_setup
 ez_setup.use_setuptools()
 
 from setuptools import setup
+from setuptools.command.build_py import build_py
 from distutils.cmd import Command
 
 exec(open('dse_graph/_version.py').read())
@@ -58,6 +61,20 @@ class DocCommand(Command):
         print("Documentation step '%s' performed, results here:" % mode)
         print("   file://%s/%s/index.html" % (os.path.dirname(os.path.realpath(__file__)), path))
 
+class BuildPyCommand(build_py):
+    """
+    Leaves out the modules using the async/await syntax on the interpreters without it, so that they are
+    neither installed nor byte-compiled.
+    """
+
+    # module: minimum Python version
+    version_modules = {'aio': (3, 5, 2)}
+
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        return [(pkg, module, path) for pkg, module, path in modules
+                if sys.version_info >= self.version_modules.get(module, (0,))]
+
 dependencies = ['dse-driver>=2.0.0b1', 'gremlinpython==3.2.4', 'six>=1.6', 'isodate>=0.5,<1']
 
 setup(
@@ -85,4 +102,4 @@ setup(
         'Topic :: Software Development :: Libraries :: Python Modules'
     ],
     license="DataStax DSE Driver License http://www.datastax.com/terms/datastax-dse-driver-license-terms",
-    cmdclass={'doc': DocCommand})
+    cmdclass={'doc': DocCommand, 'build_py': BuildPyCommand})